@@ -14,31 +14,61 @@ Usage:
 
     # Write answers back:
     python3 parse_excel_rfp.py --input rfp.xlsx --write-answers answers.json [--output-file output.xlsx]
+
+    # Write answers by editing the sheet XML in place (large workbooks, needs lxml):
+    python3 parse_excel_rfp.py --input rfp.xlsx --write-answers answers.json --fast-write
 """
 
 import argparse
+import copy
+import functools
 import json
 import logging
 import os
+import posixpath
 import re
 import sys
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import Any, Optional
+from itertools import repeat
+from typing import Any, Iterator, Optional
 
 from openpyxl import load_workbook
 from openpyxl.cell.cell import MergedCell
 from openpyxl.styles import Alignment
-from openpyxl.utils import get_column_letter, column_index_from_string
+from openpyxl.utils import get_column_letter, column_index_from_string, range_boundaries
+from openpyxl.xml.constants import SHEET_MAIN_NS
+from openpyxl.xml.functions import iterparse
 
 logger = logging.getLogger(__name__)
 
+# Column letters repeat across every row and answer; decode each one once
+_column_index = functools.lru_cache(maxsize=256)(column_index_from_string)
+
+
+def _cell_text(value: Any) -> str:
+    """Normalise a cell value to stripped text ("" for empty cells).
+
+    Most values are already str (shared strings), so str() is only called
+    for other types.
+    """
+    if value is None:
+        return ""
+    return (value if type(value) is str else str(value)).strip()
+
 # ---------------------------------------------------------------------------
 # Constants
 # ---------------------------------------------------------------------------
 
-# Header keyword patterns for column detection (case-insensitive)
+# Worksheet XML tags read when indexing merged ranges of a read-only sheet
+_MERGE_CELL_TAG = f"{{{SHEET_MAIN_NS}}}mergeCell"
+_ROW_TAG = f"{{{SHEET_MAIN_NS}}}row"
+
+# Header keyword patterns for column detection (case-insensitive substring
+# match). The most common headers come first so typical cells match early.
 RESPONSE_KEYWORDS = [
-    "vendor response", "response", "vendor answer", "answer",
+    "response", "answer", "vendor response", "vendor answer",
     "supplier response", "your response", "bidder response",
 ]
 QUESTION_KEYWORDS = [
@@ -46,54 +76,92 @@ QUESTION_KEYWORDS = [
     "request", "query", "detail", "specification",
 ]
 ID_KEYWORDS = [
-    "id", "ref", "reference", "#", "no.", "number", "item", "sr",
+    "id", "ref", "#", "no.", "reference", "number", "item", "sr",
 ]
 SCORE_KEYWORDS = [
-    "vendor score", "score", "rating", "compliance", "vendor rating",
+    "score", "rating", "compliance", "vendor score", "vendor rating",
+]
+ADDITIONAL_INFO_KEYWORDS = [
+    "additional", "comments", "notes", "remarks", "elaboration",
 ]
 
 # Question type classification patterns
 BINARY_PATTERNS = [
-    r"(?i)^The system\b",
-    r"(?i)^The solution\b",
-    r"(?i)^The platform\b",
-    r"(?i)^The product\b",
-    r"(?i)^Does (your|the) (system|solution|platform|product)\b",
-    r"(?i)^Can (your|the) (system|solution|platform|product|users?)\b",
-    r"(?i)^Is (your|the) (system|solution|platform|product)\b",
-    r"(?i)^Are (you|users|administrators)\b.*able to\b",
-    r"(?i)\b(Y/N|Yes/No)\b",
-    r"(?i)^(Your|The) (system|solution|platform|product) (supports?|allows?|enables?|provides?|includes?|offers?|has)\b",
-    r"(?i)^It is possible\b",
-    r"(?i)^There is (a |an )?\b",
+    r"^The system\b",
+    r"^The solution\b",
+    r"^The platform\b",
+    r"^The product\b",
+    r"^Does (your|the) (system|solution|platform|product)\b",
+    r"^Can (your|the) (system|solution|platform|product|users?)\b",
+    r"^Is (your|the) (system|solution|platform|product)\b",
+    r"^Are (you|users|administrators)\b.*able to\b",
+    r"\b(Y/N|Yes/No)\b",
+    r"^(Your|The) (system|solution|platform|product) (supports?|allows?|enables?|provides?|includes?|offers?|has)\b",
+    r"^It is possible\b",
+    r"^There is (a |an )?\b",
 ]
 NARRATIVE_PATTERNS = [
-    r"(?i)^(Describe|Explain|Provide|Detail|Outline|Elaborate|Specify|List|Summarize)",
-    r"(?i)^(How does|How do|How can|How will|How would)",
-    r"(?i)^(What is|What are|What does|What will)",
-    r"(?i)^(Please (describe|explain|provide|detail|list|outline|specify))",
-    r"(?i)^(Give|State|Indicate|Identify|Define|Clarify)",
+    r"^(Describe|Explain|Provide|Detail|Outline|Elaborate|Specify|List|Summarize)",
+    r"^(How does|How do|How can|How will|How would)",
+    r"^(What is|What are|What does|What will)",
+    r"^(Please (describe|explain|provide|detail|list|outline|specify))",
+    r"^(Give|State|Indicate|Identify|Define|Clarify)",
 ]
 COMPANY_INFO_PATTERNS = [
-    r"(?i)(company name|organisation name|organization name)",
-    r"(?i)(headquarters|head office|registered address)",
-    r"(?i)(number of employees|headcount|staff count|employee count)",
-    r"(?i)(annual revenue|turnover|financial)",
-    r"(?i)(year (founded|established|incorporated))",
-    r"(?i)(ownership (structure|type))",
-    r"(?i)(CEO|CTO|managing director|board of directors)",
-    r"(?i)(parent company|subsidiary)",
-    r"(?i)(stock|ticker|publicly traded|listed)",
+    r"(company name|organisation name|organization name)",
+    r"(headquarters|head office|registered address)",
+    r"(number of employees|headcount|staff count|employee count)",
+    r"(annual revenue|turnover|financial)",
+    r"(year (founded|established|incorporated))",
+    r"(ownership (structure|type))",
+    r"(CEO|CTO|managing director|board of directors)",
+    r"(parent company|subsidiary)",
+    r"(stock|ticker|publicly traded|listed)",
 ]
 REFERENCE_PATTERNS = [
-    r"(?i)(client reference|customer reference|reference (name|contact|detail))",
-    r"(?i)(reference (1|2|3|one|two|three))",
-    r"(?i)(provide.*(reference|testimonial))",
-    r"(?i)(case stud(y|ies))",
-    r"(?i)(similar (project|engagement|implementation|client))",
+    r"(client reference|customer reference|reference (name|contact|detail))",
+    r"(reference (1|2|3|one|two|three))",
+    r"(provide.*(reference|testimonial))",
+    r"(case stud(y|ies))",
+    r"(similar (project|engagement|implementation|client))",
 ]
 
 
+def _keyword_pattern(keywords: list[str]) -> re.Pattern:
+    """Compile a keyword list into one substring alternation (matched against lowercased text)."""
+    return re.compile("|".join(re.escape(kw) for kw in keywords))
+
+
+# Header roles in detection priority order; a header cell takes the first
+# role whose keywords it contains
+_HEADER_ROLE_PATTERNS = (
+    ("response_col", _keyword_pattern(RESPONSE_KEYWORDS)),
+    ("question_col", _keyword_pattern(QUESTION_KEYWORDS)),
+    ("id_col", _keyword_pattern(ID_KEYWORDS)),
+    ("score_col", _keyword_pattern(SCORE_KEYWORDS)),
+    ("additional_info_col", _keyword_pattern(ADDITIONAL_INFO_KEYWORDS)),
+)
+# Header cells in the ID column when the layout comes from the sheet name
+_ID_OR_QUESTION_PATTERN = _keyword_pattern(ID_KEYWORDS + QUESTION_KEYWORDS)
+
+
+# Each category is fused into one alternation so classify_question makes a
+# single regex call per category. Categories stay separate (rather than one
+# combined regex) because a combined search returns the leftmost match, not
+# the highest-priority category.
+def _fuse_patterns(patterns: list[str]) -> re.Pattern:
+    return re.compile("|".join(f"(?:{p})" for p in patterns), re.IGNORECASE)
+
+
+_BINARY_RE = _fuse_patterns(BINARY_PATTERNS)
+_NARRATIVE_RE = _fuse_patterns(NARRATIVE_PATTERNS)
+_COMPANY_INFO_RE = _fuse_patterns(COMPANY_INFO_PATTERNS)
+_REFERENCE_RE = _fuse_patterns(REFERENCE_PATTERNS)
+
+# Proper question IDs such as "D.1" or "E.15"
+_QUESTION_ID_RE = re.compile(r'^[A-Z]\.\d+')
+
+
 # ---------------------------------------------------------------------------
 # Sheet Structure Detector
 # ---------------------------------------------------------------------------
@@ -101,17 +169,6 @@ REFERENCE_PATTERNS = [
 class SheetStructureDetector:
     """Detects the column layout of an RFP sheet by examining header rows."""
 
-    @staticmethod
-    def _match_keyword(cell_value: str, keywords: list[str]) -> bool:
-        """Check if cell text matches any keyword (case-insensitive)."""
-        if not cell_value:
-            return False
-        val = cell_value.strip().lower()
-        for kw in keywords:
-            if kw in val:
-                return True
-        return False
-
     @classmethod
     def detect(cls, ws, sheet_name: str = "") -> Optional[dict]:
         """Detect the column layout of a worksheet.
@@ -144,26 +201,23 @@ class SheetStructureDetector:
         best_header_row = None
         detected = {}
 
-        for row_idx in range(1, max_scan_rows + 1):
+        # iter_rows streams the block in one pass; per-cell ws.cell() lookups
+        # re-parse the sheet from the top on read-only worksheets
+        header_rows = ws.iter_rows(
+            min_row=1, max_row=max_scan_rows, min_col=1, max_col=max_scan_cols, values_only=True
+        )
+        for row_idx, row_values in enumerate(header_rows, start=1):
             row_detections = {}
-            for col_idx in range(1, max_scan_cols + 1):
-                cell = ws.cell(row=row_idx, column=col_idx)
-                val = str(cell.value).strip() if cell.value is not None else ""
+            for col_idx, value in enumerate(row_values, start=1):
+                # Normalise once per cell; every role pattern tests the same text
+                val = _cell_text(value).lower()
                 if not val:
                     continue
 
-                col_letter = get_column_letter(col_idx)
-
-                if cls._match_keyword(val, RESPONSE_KEYWORDS):
-                    row_detections["response_col"] = col_letter
-                elif cls._match_keyword(val, QUESTION_KEYWORDS):
-                    row_detections["question_col"] = col_letter
-                elif cls._match_keyword(val, ID_KEYWORDS):
-                    row_detections["id_col"] = col_letter
-                elif cls._match_keyword(val, SCORE_KEYWORDS):
-                    row_detections["score_col"] = col_letter
-                elif cls._match_keyword(val, ["additional", "comments", "notes", "remarks", "elaboration"]):
-                    row_detections["additional_info_col"] = col_letter
+                for role, pattern in _HEADER_ROLE_PATTERNS:
+                    if pattern.search(val):
+                        row_detections[role] = get_column_letter(col_idx)
+                        break
 
             # If this row has both question and response columns, it's likely the header
             if "question_col" in row_detections and "response_col" in row_detections:
@@ -193,20 +247,22 @@ class SheetStructureDetector:
         # Detect patterns from Citco-style RFPs
         # Sheet D pattern: ID=A, Question=B, Score=C, Response=D
         if name_lower.startswith("d") and "functional" in name_lower:
+            header_row = cls._find_data_start(ws, "A")
             return {
                 "id_col": "A", "question_col": "B", "score_col": "C",
                 "response_col": "D", "additional_info_col": "E",
-                "header_row": cls._find_data_start(ws, "A"),
-                "first_data_row": cls._find_data_start(ws, "A") + 1,
+                "header_row": header_row,
+                "first_data_row": header_row + 1,
             }
 
         # Sheet E pattern: ID=B, Question=C, Score=D, Response=E
         if name_lower.startswith("e") and "non-functional" in name_lower:
+            header_row = cls._find_data_start(ws, "B")
             return {
                 "id_col": "B", "question_col": "C", "score_col": "D",
                 "response_col": "E", "additional_info_col": "F",
-                "header_row": cls._find_data_start(ws, "B"),
-                "first_data_row": cls._find_data_start(ws, "B") + 1,
+                "header_row": header_row,
+                "first_data_row": header_row + 1,
             }
 
         # Default pattern: ID=B, Question=C, Response=D
@@ -224,16 +280,76 @@ class SheetStructureDetector:
     @staticmethod
     def _find_data_start(ws, id_col_letter: str) -> int:
         """Find the header row by looking for the first row with data in the ID column area."""
-        col_idx = column_index_from_string(id_col_letter)
-        for row_idx in range(1, min(20, (ws.max_row or 1) + 1)):
-            cell = ws.cell(row=row_idx, column=col_idx)
-            val = str(cell.value).strip() if cell.value is not None else ""
-            if val and any(kw in val.lower() for kw in ID_KEYWORDS + QUESTION_KEYWORDS):
+        col_idx = _column_index(id_col_letter)
+        max_scan_row = min(19, ws.max_row or 1)
+        column = ws.iter_rows(
+            min_row=1, max_row=max_scan_row, min_col=col_idx, max_col=col_idx, values_only=True
+        )
+        for row_idx, (value,) in enumerate(column, start=1):
+            val = _cell_text(value)
+            if val and _ID_OR_QUESTION_PATTERN.search(val.lower()):
                 return row_idx
         # Default: assume row 3 is header (common in RFPs with title rows)
         return 3
 
 
+# ---------------------------------------------------------------------------
+# Sheet Formatting
+# ---------------------------------------------------------------------------
+
+class SheetFormatting:
+    """Lazy access to the merged ranges and fonts of a worksheet.
+
+    ``ws`` may be read-only, which exposes neither directly, so each is
+    indexed in one streaming pass the first time a row needs it: bold cells
+    from the styles of the column being checked, and merged ranges from the
+    sheet XML's <mergeCells>. No full workbook load is needed.
+    """
+
+    def __init__(self, ws):
+        self.ws = ws
+        self._bold_rows: dict[int, set[int]] = {}
+        self._wide_merge_rows: Optional[set[int]] = None
+
+    def is_bold(self, row_idx: int, col_idx: int) -> bool:
+        """Check whether a cell is formatted bold."""
+        bold_rows = self._bold_rows.get(col_idx)
+        if bold_rows is None:
+            column = self.ws.iter_rows(min_col=col_idx, max_col=col_idx)
+            bold_rows = self._bold_rows[col_idx] = {
+                idx
+                for idx, (cell,) in enumerate(column, start=1)
+                if getattr(cell, "font", None) is not None and cell.font.bold
+            }
+        return row_idx in bold_rows
+
+    def has_wide_merge(self, row_idx: int) -> bool:
+        """Check whether a merge spanning 3+ columns covers this row."""
+        if self._wide_merge_rows is None:
+            # Index the merged ranges once per sheet instead of scanning them per row
+            self._wide_merge_rows = set()
+            for min_col, min_row, max_col, max_row in self._merged_ranges():
+                # If the merge spans 3+ columns, it's likely a category header
+                if max_col - min_col >= 2:
+                    self._wide_merge_rows.update(range(min_row, max_row + 1))
+        return row_idx in self._wide_merge_rows
+
+    def _merged_ranges(self) -> Iterator[tuple[int, int, int, int]]:
+        """Yield (min_col, min_row, max_col, max_row) for each merged range."""
+        if hasattr(self.ws, "merged_cells"):
+            for merged_range in self.ws.merged_cells.ranges:
+                yield merged_range.bounds
+            return
+        # Read-only worksheets don't parse <mergeCells>; read it from the
+        # sheet XML, discarding rows as they stream past
+        with self.ws._get_source() as src:
+            for _, element in iterparse(src):
+                if element.tag == _MERGE_CELL_TAG:
+                    yield range_boundaries(element.get("ref"))
+                elif element.tag == _ROW_TAG:
+                    element.clear()
+
+
 # ---------------------------------------------------------------------------
 # Question Extractor
 # ---------------------------------------------------------------------------
@@ -247,21 +363,14 @@ class QuestionExtractor:
         if not text:
             return "narrative"
 
-        for pattern in COMPANY_INFO_PATTERNS:
-            if re.search(pattern, text):
-                return "company_info"
-
-        for pattern in REFERENCE_PATTERNS:
-            if re.search(pattern, text):
-                return "reference"
-
-        for pattern in BINARY_PATTERNS:
-            if re.search(pattern, text):
-                return "binary"
-
-        for pattern in NARRATIVE_PATTERNS:
-            if re.search(pattern, text):
-                return "narrative"
+        if _COMPANY_INFO_RE.search(text):
+            return "company_info"
+        if _REFERENCE_RE.search(text):
+            return "reference"
+        if _BINARY_RE.search(text):
+            return "binary"
+        if _NARRATIVE_RE.search(text):
+            return "narrative"
 
         # Default: if short and statement-like, treat as binary; else narrative
         if len(text) < 100 and not text.endswith("?"):
@@ -269,13 +378,13 @@ class QuestionExtractor:
         return "narrative"
 
     @staticmethod
-    def is_category_header(row_data: dict, ws, row_idx: int, structure: dict) -> bool:
+    def is_category_header(row_data: dict, formatting: SheetFormatting, row_idx: int, q_col_idx: int) -> bool:
         """Determine if a row is a category header (not a question)."""
         question_text = row_data.get("question", "")
         id_value = row_data.get("id", "")
 
         # If there's a proper question ID (e.g., "D.1", "E.15"), it's a question
-        if id_value and re.match(r'^[A-Z]\.\d+', str(id_value).strip()):
+        if id_value and _QUESTION_ID_RE.match(str(id_value).strip()):
             return False
 
         # No ID but has text in question column - likely a category
@@ -284,24 +393,42 @@ class QuestionExtractor:
             if len(question_text.strip()) < 80:
                 return True
             # Check bold formatting
-            q_col_idx = column_index_from_string(structure["question_col"])
-            cell = ws.cell(row=row_idx, column=q_col_idx)
-            if cell.font and cell.font.bold:
+            if formatting.is_bold(row_idx, q_col_idx):
                 return True
 
         # Check for merged cells in this row
-        for merged_range in ws.merged_cells.ranges:
-            if merged_range.min_row <= row_idx <= merged_range.max_row:
-                # If the merge spans 3+ columns, it's likely a category header
-                if merged_range.max_col - merged_range.min_col >= 2:
-                    return True
+        return formatting.has_wide_merge(row_idx)
 
-        return False
+    @staticmethod
+    def find_formula_rows(ws, col_letter: str, first_data_row: int) -> set[int]:
+        """Return the rows whose cell in ``col_letter`` holds a formula.
+
+        ``ws`` must come from a workbook opened without ``data_only``, where
+        formula cells still read back as their ``=...`` source.
+        """
+        col_idx = _column_index(col_letter)
+        column = ws.iter_rows(min_row=first_data_row, min_col=col_idx, max_col=col_idx, values_only=True)
+        return {
+            row_idx
+            for row_idx, (value,) in enumerate(column, start=first_data_row)
+            if isinstance(value, str) and value.startswith("=")
+        }
 
     @classmethod
-    def extract(cls, ws, structure: dict) -> dict:
+    def extract(
+        cls,
+        ws,
+        structure: dict,
+        formatting: Optional[SheetFormatting] = None,
+        score_formula_rows: Optional[set[int]] = None,
+    ) -> dict:
         """Extract all questions from a worksheet.
 
+        ``ws`` may be read-only. ``formatting`` supplies merged ranges and
+        fonts; it defaults to reading them from ``ws``.
+        If ``ws`` was loaded with ``data_only``, pass ``score_formula_rows``
+        (see find_formula_rows) so formula scores are still recognised.
+
         Returns:
             {
                 "total_questions": int,
@@ -324,26 +451,37 @@ class QuestionExtractor:
         categories = []
         current_category = "General"
 
-        id_col_idx = column_index_from_string(structure["id_col"]) if structure.get("id_col") else None
-        q_col_idx = column_index_from_string(structure["question_col"])
-        resp_col_idx = column_index_from_string(structure["response_col"])
-        score_col_idx = column_index_from_string(structure["score_col"]) if structure.get("score_col") else None
-        addl_col_idx = column_index_from_string(structure["additional_info_col"]) if structure.get("additional_info_col") else None
+        id_col_idx = _column_index(structure["id_col"]) if structure.get("id_col") else None
+        q_col_idx = _column_index(structure["question_col"])
+        resp_col_idx = _column_index(structure["response_col"])
+        score_col_idx = _column_index(structure["score_col"]) if structure.get("score_col") else None
+        addl_col_idx = _column_index(structure["additional_info_col"]) if structure.get("additional_info_col") else None
 
         first_data_row = structure.get("first_data_row", 2)
+        # Per-sheet constants, looked up once rather than on every row
+        response_col_letter = structure["response_col"]
+        score_col_letter = structure.get("score_col")
+        classify_question = cls.classify_question
+        is_category_header = cls.is_category_header
+
+        # Only read the span of columns the structure actually uses
+        used_cols = [idx for idx in (id_col_idx, q_col_idx, resp_col_idx, score_col_idx, addl_col_idx) if idx]
+        min_col = min(used_cols)
+        max_col = max(used_cols)
+
+        if formatting is None:
+            formatting = SheetFormatting(ws)
+
+        rows = ws.iter_rows(min_row=first_data_row, min_col=min_col, max_col=max_col, values_only=True)
+        for row_idx, row in enumerate(rows, start=first_data_row):
+            # Cheap check for fully empty rows before any string work
+            if row.count(None) == len(row):
+                continue
 
-        for row_idx in range(first_data_row, (ws.max_row or first_data_row) + 1):
             # Read cell values
-            id_val = ""
-            if id_col_idx:
-                cell = ws.cell(row=row_idx, column=id_col_idx)
-                id_val = str(cell.value).strip() if cell.value is not None else ""
-
-            q_cell = ws.cell(row=row_idx, column=q_col_idx)
-            question_text = str(q_cell.value).strip() if q_cell.value is not None else ""
-
-            resp_cell = ws.cell(row=row_idx, column=resp_col_idx)
-            current_response = str(resp_cell.value).strip() if resp_cell.value is not None else ""
+            id_val = _cell_text(row[id_col_idx - min_col]) if id_col_idx else ""
+            question_text = _cell_text(row[q_col_idx - min_col])
+            current_response = _cell_text(row[resp_col_idx - min_col])
 
             # Skip empty rows
             if not question_text and not id_val:
@@ -363,7 +501,7 @@ class QuestionExtractor:
             }
 
             # Check if this is a category header
-            if cls.is_category_header(row_data, ws, row_idx, structure):
+            if is_category_header(row_data, formatting, row_idx, q_col_idx):
                 # Use whichever column has the text
                 cat_text = question_text if question_text else id_val
                 if cat_text:
@@ -377,10 +515,7 @@ class QuestionExtractor:
                 continue
 
             # Read additional info if available
-            additional_info = ""
-            if addl_col_idx:
-                addl_cell = ws.cell(row=row_idx, column=addl_col_idx)
-                additional_info = str(addl_cell.value).strip() if addl_cell.value is not None else ""
+            additional_info = _cell_text(row[addl_col_idx - min_col]) if addl_col_idx else ""
 
             question_entry = {
                 "row": row_idx,
@@ -388,21 +523,26 @@ class QuestionExtractor:
                 "category": current_category,
                 "question": question_text,
                 "additional_info": additional_info,
-                "question_type": cls.classify_question(question_text),
+                "question_type": classify_question(question_text),
                 "current_response": current_response,
-                "response_col_letter": structure["response_col"],
+                "response_col_letter": response_col_letter,
             }
 
-            if structure.get("score_col"):
-                question_entry["score_col_letter"] = structure["score_col"]
+            if score_col_letter:
+                question_entry["score_col_letter"] = score_col_letter
                 # Read current score
                 if score_col_idx:
-                    score_cell = ws.cell(row=row_idx, column=score_col_idx)
+                    score_value = row[score_col_idx - min_col]
                     # Check if it's a formula - don't include formulas
-                    if score_cell.data_type == 'f':
+                    # (openpyxl types any string starting with "=" as a formula)
+                    if score_formula_rows is not None:
+                        is_formula = row_idx in score_formula_rows
+                    else:
+                        is_formula = isinstance(score_value, str) and score_value.startswith("=")
+                    if is_formula:
                         question_entry["score_is_formula"] = True
                     else:
-                        current_score = str(score_cell.value).strip() if score_cell.value is not None else ""
+                        current_score = _cell_text(score_value)
                         question_entry["current_score"] = current_score
 
             questions.append(question_entry)
@@ -421,24 +561,37 @@ class QuestionExtractor:
 class AnswerWriter:
     """Writes answers back into the Excel file, preserving formatting."""
 
+    # openpyxl styles are immutable, so one instance is shared by every answer cell
+    ANSWER_ALIGNMENT = Alignment(wrap_text=True, vertical="top")
+
+    @staticmethod
+    def _index_merged_ranges(ws) -> dict[int, list]:
+        """Map each row to the merged ranges covering it, built once per sheet."""
+        merged_by_row: dict[int, list] = {}
+        for merged_range in ws.merged_cells.ranges:
+            for row in range(merged_range.min_row, merged_range.max_row + 1):
+                merged_by_row.setdefault(row, []).append(merged_range)
+        return merged_by_row
+
     @staticmethod
-    def _get_writable_cell(ws, row: int, col_letter: str):
+    def _get_writable_cell(ws, row: int, col_letter: str, merged_by_row: dict[int, list]):
         """Get a writable cell, handling merged cells by finding the anchor cell.
 
         If the target cell is a MergedCell, unmerge the range first so we can
-        write to it, then write to the anchor cell.
+        write to it, then write to the anchor cell. ``merged_by_row`` is the
+        sheet's index from _index_merged_ranges.
         Returns (cell, was_merged) tuple.
         """
-        col_idx = column_index_from_string(col_letter)
+        col_idx = _column_index(col_letter)
         cell = ws.cell(row=row, column=col_idx)
 
         if not isinstance(cell, MergedCell):
             return cell, False
 
-        # Find the merged range containing this cell
-        for merged_range in list(ws.merged_cells.ranges):
-            if (merged_range.min_row <= row <= merged_range.max_row and
-                    merged_range.min_col <= col_idx <= merged_range.max_col):
+        # Find the merged range containing this cell. Once unmerged, its
+        # cells are no longer MergedCells, so a range is never unmerged twice.
+        for merged_range in merged_by_row.get(row, ()):
+            if merged_range.min_col <= col_idx <= merged_range.max_col:
                 # Unmerge this range so we can write
                 ws.unmerge_cells(str(merged_range))
                 # Now get the cell again (should be writable)
@@ -477,24 +630,25 @@ class AnswerWriter:
                 continue
 
             ws = wb[sheet_name]
+            merged_by_row = AnswerWriter._index_merged_ranges(ws)
 
             for answer in sheet_answers:
                 row = answer["row"]
                 col_letter = answer["response_col_letter"]
 
                 # Get writable cell (handles merged cells)
-                cell, was_merged = AnswerWriter._get_writable_cell(ws, row, col_letter)
+                cell, was_merged = AnswerWriter._get_writable_cell(ws, row, col_letter, merged_by_row)
                 if was_merged:
                     total_unmerged += 1
 
                 cell.value = answer["answer"]
-                cell.alignment = Alignment(wrap_text=True, vertical="top")
+                cell.alignment = AnswerWriter.ANSWER_ALIGNMENT
                 total_written += 1
 
                 # Write score if provided
                 if answer.get("score") and answer.get("score_col_letter"):
                     score_col = answer["score_col_letter"]
-                    score_cell, score_merged = AnswerWriter._get_writable_cell(ws, row, score_col)
+                    score_cell, score_merged = AnswerWriter._get_writable_cell(ws, row, score_col, merged_by_row)
                     if score_merged:
                         total_unmerged += 1
 
@@ -518,6 +672,372 @@ class AnswerWriter:
         return output_path
 
 
+class _FastWriteUnsupported(Exception):
+    """Raised when a workbook needs the full openpyxl writer."""
+
+
+class FastAnswerWriter:
+    """Writes answers by editing only the affected sheet XML parts in the XLSX zip.
+
+    Every other part (styles aside, which gain the wrapped answer alignment)
+    is copied through byte-for-byte, so large workbooks are not loaded into
+    openpyxl's object model or rewritten. Falls back to AnswerWriter when
+    lxml is unavailable, a target cell is inside a merged range (unmerging
+    needs the full model), or a written sheet has shared or array formulas,
+    which span cells and would break if one of them were overwritten.
+    """
+
+    MAIN_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+    DOC_REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+    PKG_REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+    CONTENT_TYPES_NS = "http://schemas.openxmlformats.org/package/2006/content-types"
+    CALC_CHAIN_PART = "xl/calcChain.xml"
+    CELL_REF_RE = re.compile(r"^([A-Z]+)(\d+)$")
+
+    @classmethod
+    def write(cls, input_path: str, answers_data: dict, output_path: Optional[str] = None) -> str:
+        """Write answers back to the Excel file; same contract as AnswerWriter.write."""
+        if output_path is None:
+            base, ext = os.path.splitext(input_path)
+            output_path = f"{base}_answered{ext}"
+
+        try:
+            cls._write(input_path, answers_data, output_path)
+        except _FastWriteUnsupported as e:
+            print(f"  Fast write not possible ({e}), using full writer", file=sys.stderr)
+            return AnswerWriter.write(input_path, answers_data, output_path)
+
+        return output_path
+
+    @classmethod
+    def _write(cls, input_path: str, answers_data: dict, output_path: str) -> None:
+        try:
+            from lxml import etree
+        except ImportError:
+            raise _FastWriteUnsupported("lxml is not installed")
+
+        with zipfile.ZipFile(input_path) as zin:
+            sheet_parts, sheet_ids, styles_part = cls._locate_parts(etree, zin)
+            styles_root = etree.fromstring(zin.read(styles_part))
+            alignment_styles: dict[str, str] = {}
+
+            replaced: dict[str, Optional[bytes]] = {}
+            # (sheetId, cell ref) of overwritten formula cells, which calcChain lists
+            cleared_formulas: set[tuple[str, str]] = set()
+            total_written = 0
+            total_skipped = 0
+
+            for sheet_name, sheet_answers in answers_data.get("answers", {}).items():
+                if sheet_name not in sheet_parts:
+                    print(f"  WARNING: Sheet '{sheet_name}' not found, skipping", file=sys.stderr)
+                    continue
+
+                part = sheet_parts[sheet_name]
+                root = etree.fromstring(zin.read(part))
+                sheet = _FastSheet(cls, etree, root)
+                formula_tag = f"{{{cls.MAIN_NS}}}f"
+
+                for answer in sheet_answers:
+                    row = answer["row"]
+                    cell = sheet.cell(row, answer["response_col_letter"])
+                    if cell.find(formula_tag) is not None:
+                        cleared_formulas.add((sheet_ids[sheet_name], cell.get("r")))
+                    cls._set_value(etree, cell, answer["answer"])
+                    cell.set("s", cls._wrapped_style(etree, styles_root, cell.get("s", "0"), alignment_styles))
+                    total_written += 1
+
+                    # Write score if provided
+                    if answer.get("score") and answer.get("score_col_letter"):
+                        score_cell = sheet.cell(row, answer["score_col_letter"])
+                        # Don't overwrite formulas
+                        if score_cell.find(formula_tag) is not None:
+                            print(f"  Skipping score for row {row} (formula cell)", file=sys.stderr)
+                            total_skipped += 1
+                        else:
+                            cls._set_value(etree, score_cell, answer["score"])
+
+                replaced[part] = etree.tostring(root, xml_declaration=True, encoding="UTF-8", standalone=True)
+
+            if alignment_styles:
+                replaced[styles_part] = etree.tostring(
+                    styles_root, xml_declaration=True, encoding="UTF-8", standalone=True
+                )
+
+            if cleared_formulas and cls.CALC_CHAIN_PART in zin.namelist():
+                replaced.update(cls._prune_calc_chain(etree, zin, cleared_formulas))
+
+            # Write to a temp file first so output_path may equal input_path
+            tmp_path = f"{output_path}.tmp"
+            try:
+                with zipfile.ZipFile(tmp_path, "w") as zout:
+                    for item in zin.infolist():
+                        if item.filename in replaced and replaced[item.filename] is None:
+                            continue  # part dropped
+                        zout.writestr(item, replaced.get(item.filename) or zin.read(item.filename))
+                os.replace(tmp_path, output_path)
+            finally:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+
+        print(f"  Answers written: {total_written}", file=sys.stderr)
+        if total_skipped:
+            print(f"  Score cells skipped (formulas): {total_skipped}", file=sys.stderr)
+        print(f"  Output: {output_path}", file=sys.stderr)
+
+    @classmethod
+    def _locate_parts(cls, etree, zin: zipfile.ZipFile) -> tuple[dict[str, str], dict[str, str], str]:
+        """Resolve sheet names to their worksheet part paths and sheetIds, plus the styles part."""
+        rels = etree.fromstring(zin.read("xl/_rels/workbook.xml.rels"))
+        targets = {}
+        styles_part = None
+        for rel in rels.iter(f"{{{cls.PKG_REL_NS}}}Relationship"):
+            target = rel.get("Target")
+            target = target.lstrip("/") if target.startswith("/") else posixpath.normpath(f"xl/{target}")
+            targets[rel.get("Id")] = target
+            if rel.get("Type", "").endswith("/styles"):
+                styles_part = target
+        if styles_part is None:
+            raise _FastWriteUnsupported("workbook has no styles part")
+
+        workbook = etree.fromstring(zin.read("xl/workbook.xml"))
+        sheets = list(workbook.iter(f"{{{cls.MAIN_NS}}}sheet"))
+        sheet_parts = {sheet.get("name"): targets[sheet.get(f"{{{cls.DOC_REL_NS}}}id")] for sheet in sheets}
+        sheet_ids = {sheet.get("name"): sheet.get("sheetId") for sheet in sheets}
+        return sheet_parts, sheet_ids, styles_part
+
+    @classmethod
+    def _prune_calc_chain(cls, etree, zin: zipfile.ZipFile, cleared: set[tuple[str, str]]) -> dict[str, Optional[bytes]]:
+        """Drop calcChain entries for cells that no longer hold formulas.
+
+        Stale entries make Excel offer to repair the file. Returns the parts
+        to replace; a chain left empty is removed along with its workbook
+        relationship and content type, since an empty one is invalid.
+        """
+        chain = etree.fromstring(zin.read(cls.CALC_CHAIN_PART))
+        sheet_id = None
+        kept = 0
+        for entry in list(chain.iterfind(f"{{{cls.MAIN_NS}}}c")):
+            # An entry without i belongs to the same sheet as the one before it
+            sheet_id = entry.get("i", sheet_id)
+            if (sheet_id, entry.get("r")) in cleared:
+                chain.remove(entry)
+            else:
+                entry.set("i", sheet_id)
+                kept += 1
+
+        if kept:
+            return {cls.CALC_CHAIN_PART: etree.tostring(chain, xml_declaration=True, encoding="UTF-8", standalone=True)}
+
+        rels_part = "xl/_rels/workbook.xml.rels"
+        rels = etree.fromstring(zin.read(rels_part))
+        for rel in list(rels.iter(f"{{{cls.PKG_REL_NS}}}Relationship")):
+            if rel.get("Type", "").endswith("/calcChain"):
+                rels.remove(rel)
+        content_types = etree.fromstring(zin.read("[Content_Types].xml"))
+        for override in list(content_types.iter(f"{{{cls.CONTENT_TYPES_NS}}}Override")):
+            if override.get("PartName") == f"/{cls.CALC_CHAIN_PART}":
+                content_types.remove(override)
+        return {
+            cls.CALC_CHAIN_PART: None,
+            rels_part: etree.tostring(rels, xml_declaration=True, encoding="UTF-8", standalone=True),
+            "[Content_Types].xml": etree.tostring(
+                content_types, xml_declaration=True, encoding="UTF-8", standalone=True
+            ),
+        }
+
+    @classmethod
+    def _set_value(cls, etree, cell, value) -> None:
+        """Replace a <c> element's content, typed the way openpyxl would store the value."""
+        for child in list(cell):
+            if child.tag in (f"{{{cls.MAIN_NS}}}f", f"{{{cls.MAIN_NS}}}v", f"{{{cls.MAIN_NS}}}is"):
+                cell.remove(child)
+        cell.attrib.pop("t", None)
+        if value is None:
+            return
+
+        if isinstance(value, bool):
+            cell.set("t", "b")
+            etree.SubElement(cell, f"{{{cls.MAIN_NS}}}v").text = "1" if value else "0"
+        elif isinstance(value, (int, float)):
+            etree.SubElement(cell, f"{{{cls.MAIN_NS}}}v").text = repr(value)
+        elif isinstance(value, str) and value.startswith("=") and len(value) > 1:
+            etree.SubElement(cell, f"{{{cls.MAIN_NS}}}f").text = value[1:]
+        else:
+            cell.set("t", "inlineStr")
+            inline = etree.SubElement(cell, f"{{{cls.MAIN_NS}}}is")
+            text = etree.SubElement(inline, f"{{{cls.MAIN_NS}}}t")
+            text.text = str(value)
+            text.set("{http://www.w3.org/XML/1998/namespace}space", "preserve")
+        # Value children must precede any <extLst>
+        for ext in cell.findall(f"{{{cls.MAIN_NS}}}extLst"):
+            cell.append(ext)
+
+    @classmethod
+    def _wrapped_style(cls, etree, styles_root, style_id: str, cache: dict[str, str]) -> str:
+        """Return the cellXfs index of ``style_id`` with wrapped, top-aligned text.
+
+        Mirrors AnswerWriter's Alignment(wrap_text=True, vertical="top"): the
+        source xf is cloned once with its alignment replaced.
+        """
+        if style_id in cache:
+            return cache[style_id]
+
+        cell_xfs = styles_root.find(f"{{{cls.MAIN_NS}}}cellXfs")
+        xfs = cell_xfs.findall(f"{{{cls.MAIN_NS}}}xf")
+        new_xf = copy.deepcopy(xfs[int(style_id)])
+        for alignment in new_xf.findall(f"{{{cls.MAIN_NS}}}alignment"):
+            new_xf.remove(alignment)
+        alignment = etree.Element(f"{{{cls.MAIN_NS}}}alignment", wrapText="1", vertical="top")
+        new_xf.insert(0, alignment)
+        new_xf.set("applyAlignment", "1")
+        cell_xfs.append(new_xf)
+        cell_xfs.set("count", str(len(xfs) + 1))
+
+        cache[style_id] = str(len(xfs))
+        return cache[style_id]
+
+
+class _FastSheet:
+    """Row/cell lookup over one parsed worksheet XML tree for FastAnswerWriter."""
+
+    def __init__(self, writer: type[FastAnswerWriter], etree, root):
+        self._ns = writer.MAIN_NS
+        self._ref_re = writer.CELL_REF_RE
+        self._etree = etree
+        self._sheet_data = root.find(f"{{{self._ns}}}sheetData")
+        # Shared and array formulas span cells; overwriting one breaks the rest
+        for formula in root.iter(f"{{{self._ns}}}f"):
+            if formula.get("t") in ("shared", "array"):
+                raise _FastWriteUnsupported(f"sheet has {formula.get('t')} formulas")
+
+        self._rows = {}
+        for row in self._sheet_data.iterfind(f"{{{self._ns}}}row"):
+            if row.get("r") is None:
+                raise _FastWriteUnsupported("rows without explicit row numbers")
+            self._rows[int(row.get("r"))] = row
+
+        # Targets inside a merged range (other than its anchor) need unmerging
+        self._merged = []
+        merge_cells = root.find(f"{{{self._ns}}}mergeCells")
+        if merge_cells is not None:
+            for merge in merge_cells.iterfind(f"{{{self._ns}}}mergeCell"):
+                min_col, min_row, max_col, max_row = range_boundaries(merge.get("ref"))
+                self._merged.append((min_row, min_col, max_row, max_col))
+
+    def cell(self, row_idx: int, col_letter: str):
+        """Return the <c> element at the given row/column, creating it in order if missing."""
+        col_idx = _column_index(col_letter)
+        for min_row, min_col, max_row, max_col in self._merged:
+            if (min_row <= row_idx <= max_row and min_col <= col_idx <= max_col
+                    and (row_idx, col_idx) != (min_row, min_col)):
+                raise _FastWriteUnsupported(f"{col_letter}{row_idx} is inside a merged range")
+
+        row = self._rows.get(row_idx)
+        if row is None:
+            row = self._etree.Element(f"{{{self._ns}}}row", r=str(row_idx))
+            later = [r for r in self._rows if r > row_idx]
+            if later:
+                self._rows[min(later)].addprevious(row)
+            else:
+                self._sheet_data.append(row)
+            self._rows[row_idx] = row
+
+        ref = f"{col_letter}{row_idx}"
+        for cell in row.iterfind(f"{{{self._ns}}}c"):
+            match = self._ref_re.match(cell.get("r") or "")
+            if match is None:
+                raise _FastWriteUnsupported("cells without explicit references")
+            existing_col = _column_index(match.group(1))
+            if existing_col == col_idx:
+                return cell
+            if existing_col > col_idx:
+                new_cell = self._etree.Element(f"{{{self._ns}}}c", r=ref)
+                cell.addprevious(new_cell)
+                return new_cell
+
+        new_cell = self._etree.SubElement(row, f"{{{self._ns}}}c", r=ref)
+        # Keep <c> elements ahead of a row-level <extLst>
+        for ext in row.findall(f"{{{self._ns}}}extLst"):
+            row.append(ext)
+        return new_cell
+
+
+# ---------------------------------------------------------------------------
+# Sheet Extraction
+# ---------------------------------------------------------------------------
+
+class _WorkbookHandles:
+    """The workbook opens needed to extract sheets, each loaded on first use.
+
+    Values (and the fonts and merged ranges read alongside them) stream from
+    a read-only ``data_only`` workbook. Score formulas come from a second
+    read-only open without ``data_only``, which would replace them with
+    cached values.
+    """
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self._values = None
+        self._formulas = None
+
+    @property
+    def values(self):
+        if self._values is None:
+            self._values = load_workbook(self.file_path, read_only=True, data_only=True)
+        return self._values
+
+    @property
+    def formulas(self):
+        if self._formulas is None:
+            self._formulas = load_workbook(self.file_path, read_only=True)
+        return self._formulas
+
+    def close(self) -> None:
+        for wb in (self._values, self._formulas):
+            if wb is not None:
+                wb.close()
+
+
+def _extract_sheet(handles: _WorkbookHandles, sheet_name: str) -> Optional[dict]:
+    """Detect structure and extract questions for one sheet.
+
+    Returns the sheet's JSON-serialisable result, or None if no answerable
+    structure was detected.
+    """
+    ws = handles.values[sheet_name]
+    structure = SheetStructureDetector.detect(ws, sheet_name)
+    if not structure:
+        return None
+
+    score_formula_rows = None
+    if structure.get("score_col"):
+        score_formula_rows = QuestionExtractor.find_formula_rows(
+            handles.formulas[sheet_name], structure["score_col"], structure.get("first_data_row", 2)
+        )
+
+    formatting = SheetFormatting(ws)
+    extraction = QuestionExtractor.extract(ws, structure, formatting, score_formula_rows)
+
+    return {
+        "structure": {
+            "id_col": structure.get("id_col"),
+            "question_col": structure["question_col"],
+            "response_col": structure["response_col"],
+            "score_col": structure.get("score_col"),
+        },
+        **extraction,
+    }
+
+
+def _extract_sheet_in_worker(file_path: str, sheet_name: str) -> Optional[dict]:
+    """Process-pool entry point: extract one sheet using its own workbook handles."""
+    handles = _WorkbookHandles(file_path)
+    try:
+        return _extract_sheet(handles, sheet_name)
+    finally:
+        handles.close()
+
+
 # ---------------------------------------------------------------------------
 # Main Orchestrator
 # ---------------------------------------------------------------------------
@@ -527,6 +1047,11 @@ class ExcelRFPParser:
 
     def list_sheets(self, file_path: str) -> dict:
         """List all sheets with metadata and detected structure."""
+        # A read-only open only parses the workbook-level parts (sheet list,
+        # styles, shared strings) up front. Each worksheet part is streamed
+        # on demand, and max_row/max_column come from its <dimension> tag
+        # without reading the rows, so this is as cheap as reading
+        # xl/workbook.xml by hand once structure detection needs cell text.
         wb = load_workbook(file_path, read_only=True, data_only=True)
         sheets = []
 
@@ -540,12 +1065,9 @@ class ExcelRFPParser:
                 "total_columns": ws.max_column or 0,
             }
 
-            # Try to detect structure
-            # Need to reopen without read_only for merged cell detection
-            wb_full = load_workbook(file_path, data_only=True)
-            ws_full = wb_full[sheet_name]
-            structure = SheetStructureDetector.detect(ws_full, sheet_name)
-            wb_full.close()
+            # Try to detect structure (only needs cell values, so the
+            # read-only worksheet is enough)
+            structure = SheetStructureDetector.detect(ws, sheet_name)
 
             if structure:
                 sheet_info["is_answerable"] = True
@@ -558,12 +1080,14 @@ class ExcelRFPParser:
                 }
 
                 # Count questions (quick scan)
-                q_col_idx = column_index_from_string(structure["question_col"])
+                q_col_idx = _column_index(structure["question_col"])
                 first_data = structure.get("first_data_row", 2)
                 q_count = 0
-                for row_idx in range(first_data, (ws.max_row or first_data) + 1):
-                    cell = ws.cell(row=row_idx, column=q_col_idx)
-                    val = str(cell.value).strip() if cell.value is not None else ""
+                question_column = ws.iter_rows(
+                    min_row=first_data, min_col=q_col_idx, max_col=q_col_idx, values_only=True
+                )
+                for (value,) in question_column:
+                    val = _cell_text(value)
                     if val and not val.startswith("=") and len(val) > 5:
                         q_count += 1
                 sheet_info["question_count"] = q_count
@@ -582,9 +1106,16 @@ class ExcelRFPParser:
             "sheets": sheets,
         }
 
-    def extract_questions(self, file_path: str, sheet_names: list[str]) -> dict:
-        """Extract questions from specified sheets."""
-        wb = load_workbook(file_path, data_only=True)
+    def extract_questions(self, file_path: str, sheet_names: list[str], jobs: int = 1) -> dict:
+        """Extract questions from specified sheets.
+
+        Sheets are extracted in parallel worker processes when ``jobs`` > 1
+        (default: 1, serial); each worker opens its own read-only workbook.
+        """
+        wb = load_workbook(file_path, read_only=True)
+        available = [(name, name.lower()) for name in wb.sheetnames]
+        wb.close()
+
         result = {
             "file": os.path.basename(file_path),
             "file_path": file_path,
@@ -592,71 +1123,75 @@ class ExcelRFPParser:
             "sheets": {},
         }
 
+        matched_names = []
         for sheet_name in sheet_names:
             # Find matching sheet (allow partial matching)
-            matched_name = self._match_sheet_name(sheet_name, wb.sheetnames)
+            matched_name = self._match_sheet_name(sheet_name, available)
             if not matched_name:
                 print(f"  WARNING: No sheet matching '{sheet_name}', skipping", file=sys.stderr)
                 continue
+            if matched_name not in matched_names:
+                matched_names.append(matched_name)
 
-            ws = wb[matched_name]
-            structure = SheetStructureDetector.detect(ws, matched_name)
-
-            if not structure:
+        if jobs > 1 and len(matched_names) > 1:
+            with ProcessPoolExecutor(max_workers=jobs) as executor:
+                extractions = list(executor.map(_extract_sheet_in_worker, repeat(file_path), matched_names))
+        else:
+            handles = _WorkbookHandles(file_path)
+            try:
+                extractions = [_extract_sheet(handles, name) for name in matched_names]
+            finally:
+                handles.close()
+
+        for matched_name, sheet_result in zip(matched_names, extractions):
+            if sheet_result is None:
                 print(f"  WARNING: Could not detect structure for '{matched_name}', skipping", file=sys.stderr)
                 continue
 
-            extraction = QuestionExtractor.extract(ws, structure)
+            result["sheets"][matched_name] = sheet_result
+            print(f"  {matched_name}: {sheet_result['total_questions']} questions in {len(sheet_result['categories'])} categories", file=sys.stderr)
 
-            result["sheets"][matched_name] = {
-                "structure": {
-                    "id_col": structure.get("id_col"),
-                    "question_col": structure["question_col"],
-                    "response_col": structure["response_col"],
-                    "score_col": structure.get("score_col"),
-                },
-                **extraction,
-            }
-
-            print(f"  {matched_name}: {extraction['total_questions']} questions in {len(extraction['categories'])} categories", file=sys.stderr)
-
-        wb.close()
         return result
 
-    def write_answers(self, file_path: str, answers_json_path: str, output_path: Optional[str] = None) -> str:
-        """Write answers back to the Excel file."""
+    def write_answers(
+        self, file_path: str, answers_json_path: str, output_path: Optional[str] = None, fast: bool = False
+    ) -> str:
+        """Write answers back to the Excel file.
+
+        With ``fast``, only the affected sheet XML is edited in place (see
+        FastAnswerWriter) instead of round-tripping the whole workbook.
+        """
         with open(answers_json_path, "r") as f:
             answers_data = json.load(f)
 
-        return AnswerWriter.write(file_path, answers_data, output_path)
+        writer = FastAnswerWriter if fast else AnswerWriter
+        return writer.write(file_path, answers_data, output_path)
 
     @staticmethod
-    def _match_sheet_name(query: str, available: list[str]) -> Optional[str]:
-        """Match a sheet name query to available sheet names (exact or partial)."""
+    def _match_sheet_name(query: str, available: list[tuple[str, str]]) -> Optional[str]:
+        """Match a sheet name query to available sheet names (exact or partial).
+
+        ``available`` holds ``(name, name.lower())`` pairs so names are only
+        lowercased once per workbook. Matches are ranked exact, then
+        case-insensitive, then short prefix, then substring.
+        """
         query_clean = query.strip()
+        query_lower = query_clean.lower()
+        # Single letter match (e.g., "D" matches "D. Functional Requirements")
+        short_query = len(query_clean) <= 2
 
-        # Exact match
-        for name in available:
+        case_match = prefix_match = partial_match = None
+        for name, name_lower in available:
             if name == query_clean:
                 return name
+            if name_lower == query_lower:
+                case_match = case_match or name
+            elif query_lower in name_lower:
+                if short_query and name_lower.startswith(query_lower):
+                    prefix_match = prefix_match or name
+                partial_match = partial_match or name
 
-        # Case-insensitive match
-        for name in available:
-            if name.lower() == query_clean.lower():
-                return name
-
-        # Partial match (query is a prefix or substring)
-        for name in available:
-            if query_clean.lower() in name.lower():
-                return name
-
-        # Single letter match (e.g., "D" matches "D. Functional Requirements")
-        if len(query_clean) <= 2:
-            for name in available:
-                if name.lower().startswith(query_clean.lower()):
-                    return name
-
-        return None
+        return case_match or prefix_match or partial_match
 
 
 # ---------------------------------------------------------------------------
@@ -687,6 +1222,14 @@ def main():
         "--output-file", type=str, default=None,
         help="For --write-answers: output Excel file path (default: <input>_answered.xlsx)"
     )
+    parser.add_argument(
+        "--fast-write", action="store_true",
+        help="For --write-answers: edit only the affected sheet XML instead of re-saving the workbook (needs lxml)"
+    )
+    parser.add_argument(
+        "--jobs", type=int, default=1,
+        help="For --sheets: number of worker processes, one sheet each (default: 1)"
+    )
     parser.add_argument(
         "--verbose", action="store_true",
         help="Enable verbose logging"
@@ -710,7 +1253,7 @@ def main():
             # Extract questions from specified sheets
             sheet_names = [s.strip() for s in args.sheets.split(",")]
             print(f"Extracting questions from: {', '.join(sheet_names)}", file=sys.stderr)
-            result = rfp_parser.extract_questions(args.input, sheet_names)
+            result = rfp_parser.extract_questions(args.input, sheet_names, args.jobs)
         else:
             # List all sheets
             print(f"Listing sheets in: {os.path.basename(args.input)}", file=sys.stderr)
@@ -726,7 +1269,7 @@ def main():
             sys.exit(1)
 
         print(f"Writing answers from: {args.write_answers}", file=sys.stderr)
-        output = rfp_parser.write_answers(args.input, args.write_answers, args.output_file)
+        output = rfp_parser.write_answers(args.input, args.write_answers, args.output_file, args.fast_write)
         print(json.dumps({"status": "success", "output_file": output}))
 
     else:
@@ -10,23 +10,31 @@ Usage:
 """
 
 import argparse
+import concurrent.futures
+import functools
 import json
 import logging
+import math
 import os
 import sys
 from datetime import datetime
-from typing import Any, Optional
+from typing import BinaryIO, Callable, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # optional; stdlib json is used instead
+    orjson = None
 
 from reportlab.lib import colors
-from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY, TA_LEFT, TA_RIGHT
+from reportlab.lib.enums import TA_JUSTIFY, TA_LEFT
 from reportlab.lib.pagesizes import A4
-from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
-from reportlab.lib.units import inch, mm
+from reportlab.lib.styles import ParagraphStyle
 from reportlab.lib.colors import HexColor, white, black
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
 from reportlab.platypus import (
     BaseDocTemplate,
+    CondPageBreak,
     Frame,
     Flowable,
     NextPageTemplate,
@@ -36,8 +44,9 @@ from reportlab.platypus import (
     Spacer,
     Table,
     TableStyle,
-    KeepTogether,
 )
+from reportlab.platypus.paragraph import cleanBlockQuotedText, textTransformFrags
+from reportlab.platypus.paraparser import ParaParser
 from reportlab.pdfgen import canvas
 
 logger = logging.getLogger(__name__)
@@ -62,10 +71,37 @@ COVER_BG_DEFAULT = HexColor("#1B3A5C")
 BODY_TEXT_COLOR = black
 WHITE = white
 
+# Bullet glyphs drawn in the hanging indent by ReportLab's native bullet support
+DASH_BULLET = "\u2013"
+ROUND_BULLET = "\u2022"
+
+# Resolved font files are cached here so later runs can skip directory scans
+FONT_CACHE_PATH = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "rfi_pdf", "fontmap.json"
+)
+
+# Body sections after the executive summary start on a new page only when
+# less than this much vertical space (pts) remains; short sections share pages
+SECTION_MIN_SPACE = 400
+# Gap above such a section's heading bar when it shares a page (dropped at page top)
+SECTION_SPACE_BEFORE = 24
+
+# Table cells shorter than this (and fitting their column) skip Paragraph parsing
+PLAIN_CELL_MAX_CHARS = 40
+
 # Heading bar dimensions
 HEADING_BAR_HEIGHT = 28
 HEADING_BAR_PADDING = 8
 
+# Text widths keyed by (text, font, size); TOC rows repeat the same measurements
+_string_width = functools.lru_cache(maxsize=256)(pdfmetrics.stringWidth)
+
+# Escapes user strings spliced into Paragraph markup (also safe inside attributes)
+_XML_ESC = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;"})
+
+# Shared read-only fallback for missing JSON objects (never mutated)
+_EMPTY: dict = {}
+
 
 # ---------------------------------------------------------------------------
 # Font Manager
@@ -92,76 +128,205 @@ class FontManager:
 
     FONT_DEFINITIONS = {
         "CalibriLight": {
-            "files": ["calibril.ttf", "Calibri-Light.ttf", "CalibriLight.ttf", "calibri-light.ttf"],
-            "fallback_files": ["Arial.ttf", "arial.ttf", "LiberationSans-Regular.ttf"],
+            "files": ("calibril.ttf", "Calibri-Light.ttf", "CalibriLight.ttf", "calibri-light.ttf"),
+            "fallback_files": ("Arial.ttf", "arial.ttf", "LiberationSans-Regular.ttf"),
             "builtin_fallback": "Helvetica",
         },
         "CalibriLightBold": {
-            "files": ["calibrib.ttf", "Calibri-Bold.ttf", "CalibriBold.ttf"],
-            "fallback_files": ["Arial Bold.ttf", "arialbd.ttf", "LiberationSans-Bold.ttf"],
+            "files": ("calibrib.ttf", "Calibri-Bold.ttf", "CalibriBold.ttf"),
+            "fallback_files": ("Arial Bold.ttf", "arialbd.ttf", "LiberationSans-Bold.ttf"),
             "builtin_fallback": "Helvetica-Bold",
         },
         "TimesNewRoman": {
-            "files": [
+            "files": (
                 "Times New Roman.ttf", "times.ttf", "TimesNewRoman.ttf",
                 "Times New Roman Regular.ttf", "timesNewRoman.ttf",
-            ],
-            "fallback_files": ["Georgia.ttf", "georgia.ttf", "LiberationSerif-Regular.ttf"],
+            ),
+            "fallback_files": ("Georgia.ttf", "georgia.ttf", "LiberationSerif-Regular.ttf"),
             "builtin_fallback": "Times-Roman",
         },
         "TimesNewRomanBold": {
-            "files": [
+            "files": (
                 "Times New Roman Bold.ttf", "timesbd.ttf", "TimesNewRomanBold.ttf",
                 "Times New Roman Bold Regular.ttf",
-            ],
-            "fallback_files": ["Georgia Bold.ttf", "georgiab.ttf", "LiberationSerif-Bold.ttf"],
+            ),
+            "fallback_files": ("Georgia Bold.ttf", "georgiab.ttf", "LiberationSerif-Bold.ttf"),
             "builtin_fallback": "Times-Bold",
         },
         "TimesNewRomanItalic": {
-            "files": [
+            "files": (
                 "Times New Roman Italic.ttf", "timesi.ttf", "TimesNewRomanItalic.ttf",
-            ],
-            "fallback_files": ["Georgia Italic.ttf", "georgiai.ttf", "LiberationSerif-Italic.ttf"],
+            ),
+            "fallback_files": ("Georgia Italic.ttf", "georgiai.ttf", "LiberationSerif-Italic.ttf"),
             "builtin_fallback": "Times-Italic",
         },
     }
 
-    def __init__(self):
+    # Candidate filenames lowercased once, matching the lowercased scandir index
+    _FONT_FILES_LOWER = {
+        logical_name: (
+            tuple(f.lower() for f in defn["files"]),
+            tuple(f.lower() for f in defn["fallback_files"]),
+        )
+        for logical_name, defn in FONT_DEFINITIONS.items()
+    }
+
+    def __init__(self, cache_path: Optional[str] = FONT_CACHE_PATH):
         self.font_map: dict[str, str] = {}
         self.substitutions: dict[str, str] = {}
+        self.cache_path = cache_path
+        self._font_index: Optional[list[dict[str, str]]] = None
+        # logical name -> TTF path actually registered
+        self._resolved_paths: dict[str, str] = {}
+
+    @classmethod
+    def _index_font_dirs(cls) -> list[dict[str, str]]:
+        """Scan each search path once, mapping lowercased filenames to full paths.
+
+        Kept in search-path order so lookups preserve the directory priority.
+        Missing directories are detected by scandir itself rather than a
+        separate isdir() stat per path.
+        """
+        index = []
+        for search_path in cls.FONT_SEARCH_PATHS:
+            entries: dict[str, str] = {}
+            try:
+                with os.scandir(search_path) as it:
+                    for entry in it:
+                        if entry.is_file():
+                            entries.setdefault(entry.name.lower(), entry.path)
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+            except OSError as e:
+                logger.debug("Could not scan font directory '%s': %s", search_path, e)
+                continue
+            index.append(entries)
+        return index
 
     def register_fonts(self) -> dict[str, str]:
-        """Register all required fonts, returning a mapping of logical names to registered names."""
+        """Register all required fonts, returning a mapping of logical names to registered names.
+
+        A still-valid on-disk cache of the previous resolution is used when
+        available; otherwise the search paths are scanned and the cache rewritten.
+        """
+        if self.cache_path and self._register_from_cache():
+            return self.font_map
+
+        self._font_index = self._index_font_dirs()
         for logical_name, defn in self.FONT_DEFINITIONS.items():
-            registered = self._try_register(logical_name, defn["files"])
+            files, fallback_files = self._FONT_FILES_LOWER[logical_name]
+            registered = self._try_register(logical_name, files)
             if not registered:
-                registered = self._try_register(logical_name, defn["fallback_files"])
+                registered = self._try_register(logical_name, fallback_files)
                 if registered:
                     self.substitutions[logical_name] = registered
             if not registered:
                 # Use ReportLab built-in
                 self.font_map[logical_name] = defn["builtin_fallback"]
                 self.substitutions[logical_name] = defn["builtin_fallback"]
-                logger.info(f"Font '{logical_name}' -> builtin '{defn['builtin_fallback']}'")
+                logger.info("Font '%s' -> builtin '%s'", logical_name, defn["builtin_fallback"])
             else:
                 self.font_map[logical_name] = logical_name
 
+        if self.cache_path:
+            self._save_cache()
         return self.font_map
 
-    def _try_register(self, name: str, filenames: list[str]) -> Optional[str]:
-        """Try to find and register a TTF font from the search paths."""
-        for search_path in self.FONT_SEARCH_PATHS:
-            if not os.path.isdir(search_path):
-                continue
+    @classmethod
+    def _search_path_mtimes(cls) -> dict[str, Optional[int]]:
+        """Directory mtimes for the search paths (None if missing); they change when fonts are added."""
+        mtimes: dict[str, Optional[int]] = {}
+        for search_path in cls.FONT_SEARCH_PATHS:
+            try:
+                mtimes[search_path] = os.stat(search_path).st_mtime_ns
+            except OSError:
+                mtimes[search_path] = None
+        return mtimes
+
+    @staticmethod
+    def _file_signature(path: str) -> Optional[list[int]]:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return [st.st_mtime_ns, st.st_size]
+
+    def _save_cache(self):
+        """Write the current resolution to the cache file, ignoring failures."""
+        fonts = {}
+        for logical_name, registered in self.font_map.items():
+            path = self._resolved_paths.get(logical_name)
+            fonts[logical_name] = {
+                "registered": registered,
+                "substitute": self.substitutions.get(logical_name),
+                "path": path,
+                "signature": self._file_signature(path) if path else None,
+            }
+        cache = {
+            "definitions": self.FONT_DEFINITIONS,
+            "search_paths": self._search_path_mtimes(),
+            "fonts": fonts,
+        }
+        try:
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            tmp_path = f"{self.cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(cache, f)
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            logger.debug("Could not write font cache '%s': %s", self.cache_path, e)
+
+    def _register_from_cache(self) -> bool:
+        """Register fonts from the cache file if every directory and font file is unchanged."""
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                cache = json.load(f)
+            if cache["definitions"] != json.loads(json.dumps(self.FONT_DEFINITIONS)):
+                return False
+            if cache["search_paths"] != self._search_path_mtimes():
+                return False
+            fonts = cache["fonts"]
+            if set(fonts) != set(self.FONT_DEFINITIONS):
+                return False
+            for entry in fonts.values():
+                if entry["path"] and self._file_signature(entry["path"]) != entry["signature"]:
+                    return False
+        except (OSError, ValueError, KeyError, TypeError):
+            return False
+
+        for logical_name, entry in fonts.items():
+            path = entry["path"]
+            if path:
+                # Builtin fallbacks need no registration
+                try:
+                    pdfmetrics.registerFont(TTFont(logical_name, path))
+                except Exception as e:
+                    logger.debug("Cached font '%s' failed to register: %s", path, e)
+                    self.font_map.clear()
+                    self.substitutions.clear()
+                    self._resolved_paths.clear()
+                    return False
+                self._resolved_paths[logical_name] = path
+            self.font_map[logical_name] = entry["registered"]
+            if entry["substitute"]:
+                self.substitutions[logical_name] = entry["substitute"]
+        logger.info("Fonts loaded from cache '%s'", self.cache_path)
+        return True
+
+    def _try_register(self, name: str, filenames: tuple[str, ...]) -> Optional[str]:
+        """Try to find and register a TTF font from the search paths (filenames lowercased)."""
+        for dir_entries in self._font_index:
             for filename in filenames:
-                font_path = os.path.join(search_path, filename)
-                if os.path.isfile(font_path):
+                font_path = dir_entries.get(filename)
+                if font_path:
                     try:
                         pdfmetrics.registerFont(TTFont(name, font_path))
-                        logger.info(f"Registered font '{name}' from '{font_path}'")
+                        logger.info("Registered font '%s' from '%s'", name, font_path)
+                        self._resolved_paths[name] = font_path
                         return name
                     except Exception as e:
-                        logger.debug(f"Failed to register '{font_path}': {e}")
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug("Failed to register '%s': %s", font_path, e)
         return None
 
     def get(self, logical_name: str) -> str:
@@ -177,28 +342,30 @@ class HeadingBarFlowable(Flowable):
     """A dark blue rectangle with white text, matching the reference document's section headings."""
 
     def __init__(self, text: str, font_name: str = "Helvetica", font_size: float = 18,
-                 bar_height: float = HEADING_BAR_HEIGHT, bar_color=HEADING_BAR_COLOR):
+                 bar_height: float = HEADING_BAR_HEIGHT, bar_color=HEADING_BAR_COLOR,
+                 space_before: float = 0):
         super().__init__()
         self.text = text
+        # Frames skip spaceBefore at the top of a page
+        self.spaceBefore = space_before
         self.font_name = font_name
         self.font_size = font_size
         self.bar_height = bar_height
         self.bar_color = bar_color
         self.width = CONTENT_WIDTH
         self.height = bar_height + 4  # a little padding below
+        self._text_y = 4 + (bar_height - font_size) / 2 + 2
 
     def draw(self):
         c = self.canv
-        # Draw the filled rectangle
+        # Draw the filled rectangle (no stroke, so no stroke colour needed)
         c.setFillColor(self.bar_color)
-        c.setStrokeColor(self.bar_color)
         c.rect(0, 4, self.width, self.bar_height, fill=1, stroke=0)
 
         # Draw white text on top
         c.setFillColor(WHITE)
         c.setFont(self.font_name, self.font_size)
-        text_y = 4 + (self.bar_height - self.font_size) / 2 + 2
-        c.drawString(HEADING_BAR_PADDING, text_y, self.text)
+        c.drawString(HEADING_BAR_PADDING, self._text_y, self.text)
 
 
 class CoverPageFlowable(Flowable):
@@ -211,6 +378,8 @@ class CoverPageFlowable(Flowable):
         self.font_map = font_map
         self.bg_color = bg_color
         self.bg_image_path = bg_image_path
+        # Resolved once so a re-drawn cover doesn't stat the image again
+        self._bg_image_ok = bool(bg_image_path) and os.path.isfile(bg_image_path)
         self.width = PAGE_WIDTH
         self.height = PAGE_HEIGHT
 
@@ -219,7 +388,7 @@ class CoverPageFlowable(Flowable):
 
         # Frame is full-page (0,0 origin, no padding), so draw directly
         # Draw background
-        if self.bg_image_path and os.path.isfile(self.bg_image_path):
+        if self._bg_image_ok:
             try:
                 c.drawImage(
                     self.bg_image_path,
@@ -257,13 +426,18 @@ class CoverPageFlowable(Flowable):
 
 
 class TOCEntryFlowable(Flowable):
-    """A single TOC entry with dot leaders and page number."""
+    """A single TOC entry with dot leaders and page number.
 
-    def __init__(self, section_name: str, page_num: int, font_name: str = "Times-Roman",
+    The section's page isn't known when the TOC page is laid out, so only the
+    name is drawn in place; NumberedCanvas draws the dot leaders and page
+    number (via draw_page_number) once the whole document has been built.
+    """
+
+    def __init__(self, section_name: str, section_key: str, font_name: str = "Times-Roman",
                  font_size: float = 12):
         super().__init__()
         self.section_name = section_name
-        self.page_num = page_num
+        self.section_key = section_key
         self.font_name = font_name
         self.font_size = font_size
         self.width = CONTENT_WIDTH
@@ -277,21 +451,30 @@ class TOCEntryFlowable(Flowable):
         # Draw section name on left
         c.drawString(0, 4, self.section_name)
 
+        # Leave the dot leaders and page number for the canvas to fill in
+        if isinstance(c, NumberedCanvas):
+            x, y = c.absolutePosition(0, 4)
+            c.defer_toc_entry(self, x, y)
+
+    def draw_page_number(self, c, x: float, y: float, page_num: int):
+        """Draw dot leaders and the page number, with (x, y) the entry's absolute text origin."""
+        c.setFillColor(BODY_TEXT_COLOR)
+        c.setFont(self.font_name, self.font_size)
+
         # Draw page number on right
-        page_str = str(self.page_num)
-        page_width = c.stringWidth(page_str, self.font_name, self.font_size)
-        c.drawString(self.width - page_width, 4, page_str)
+        page_str = str(page_num)
+        page_width = _string_width(page_str, self.font_name, self.font_size)
+        c.drawString(x + self.width - page_width, y, page_str)
 
-        # Draw dot leaders between
-        name_width = c.stringWidth(self.section_name + "  ", self.font_name, self.font_size)
-        dot_width = c.stringWidth(". ", self.font_name, self.font_size)
+        # Draw dot leaders between, as one run of ". " pairs
+        name_width = _string_width(self.section_name + "  ", self.font_name, self.font_size)
+        dot_width = _string_width(". ", self.font_name, self.font_size)
         dot_start = name_width
         dot_end = self.width - page_width - 10
 
-        x = dot_start
-        while x < dot_end:
-            c.drawString(x, 4, ".")
-            x += dot_width
+        dot_count = max(0, math.ceil((dot_end - dot_start) / dot_width))
+        if dot_count:
+            c.drawString(x + dot_start, y, ". " * dot_count)
 
 
 # ---------------------------------------------------------------------------
@@ -299,45 +482,70 @@ class TOCEntryFlowable(Flowable):
 # ---------------------------------------------------------------------------
 
 class NumberedCanvas(canvas.Canvas):
-    """Custom canvas that defers footer drawing until total page count is known."""
+    """Custom canvas that defers footer and TOC page numbers until the layout is known.
+
+    ``section_pages`` maps heading text to the page it landed on; the doc
+    template fills it in while building, and it is complete by save().
+    """
+
+    # Per-page attributes pdfgen's showPage() reads to emit a page; everything
+    # else on the canvas is either document-wide or reset by _startPage().
+    _PAGE_STATE_ATTRS = (
+        "_code", "_psCommandsBeforePage", "_psCommandsAfterPage", "_currentPageHasImages",
+        "_formsinuse", "_annotationrefs", "_formData", "_colorsUsed", "_shadingUsed",
+        "_extgstate", "_pageNumber", "_pageRotation", "_pageTransition", "_pageDuration",
+        "_pagesize", "_preamble",
+    )
 
     def __init__(self, *args, **kwargs):
         self._footer_data = kwargs.pop("footer_data", {})
         self._font_map = kwargs.pop("font_map", {})
         self._skip_footer_pages = kwargs.pop("skip_footer_pages", {1})  # page 1 = cover
+        self._section_pages = kwargs.pop("section_pages", {})
         super().__init__(*args, **kwargs)
+
+        company = self._footer_data.get("company_name", "Company")
+        year = self._footer_data.get("year", str(datetime.now().year))
+        solution = self._footer_data.get("solution_name", "Solution")
+        client = self._footer_data.get("client_name", "Client")
+        # Only the page numbers vary from page to page
+        self._footer_prefix = f"\u00a9 {company} {year}  {solution} for {client}    Page "
+        self._footer_font = self._font_map.get("CalibriLight", "Helvetica")
         self._saved_page_states = []
+        # page index -> [(TOCEntryFlowable, x, y)]
+        self._toc_entries: dict[int, list] = {}
+
+    def defer_toc_entry(self, entry: "TOCEntryFlowable", x: float, y: float):
+        """Queue a TOC entry on the current page for its page number to be drawn at save()."""
+        self._toc_entries.setdefault(len(self._saved_page_states), []).append((entry, x, y))
 
     def showPage(self):
-        self._saved_page_states.append(dict(self.__dict__))
+        self._saved_page_states.append(tuple(getattr(self, name) for name in self._PAGE_STATE_ATTRS))
         self._startPage()
 
     def save(self):
         total_content_pages = len(self._saved_page_states) - 1  # exclude cover page
         for i, state in enumerate(self._saved_page_states):
-            self.__dict__.update(state)
+            for name, value in zip(self._PAGE_STATE_ATTRS, state):
+                setattr(self, name, value)
+            self.init_graphics_state()
+            self.state_stack = []
             page_num = i + 1
             if page_num not in self._skip_footer_pages:
                 self._draw_footer(page_num - 1, total_content_pages)
+            for entry, x, y in self._toc_entries.get(i, ()):
+                section_page = self._section_pages.get(entry.section_key, 0)
+                if section_page > 0:
+                    # Subtract 1 because cover is page 1 but content starts at "page 1"
+                    entry.draw_page_number(self, x, y, section_page - 1)
             canvas.Canvas.showPage(self)
         canvas.Canvas.save(self)
 
     def _draw_footer(self, content_page_num: int, total_content_pages: int):
         """Draw footer at bottom of page."""
-        company = self._footer_data.get("company_name", "Company")
-        year = self._footer_data.get("year", str(datetime.now().year))
-        solution = self._footer_data.get("solution_name", "Solution")
-        client = self._footer_data.get("client_name", "Client")
-
-        footer_text = (
-            f"\u00a9 {company} {year}  {solution} for {client}"
-            f"    Page {content_page_num} of {total_content_pages}"
-        )
-
-        footer_font = self._font_map.get("CalibriLight", "Helvetica")
         self.setFillColor(FOOTER_TEXT_COLOR)
-        self.setFont(footer_font, 10)
-        self.drawString(MARGIN_LEFT, 30, footer_text)
+        self.setFont(self._footer_font, 10)
+        self.drawString(MARGIN_LEFT, 30, f"{self._footer_prefix}{content_page_num} of {total_content_pages}")
 
 
 # ---------------------------------------------------------------------------
@@ -345,7 +553,17 @@ class NumberedCanvas(canvas.Canvas):
 # ---------------------------------------------------------------------------
 
 def create_styles(font_map: dict[str, str]) -> dict[str, ParagraphStyle]:
-    """Create all paragraph styles using the resolved font map."""
+    """Create all paragraph styles using the resolved font map.
+
+    Styles are built once per distinct font map and shared between documents;
+    the returned dict is a fresh copy so callers may add to it safely.
+    """
+    return dict(_create_styles_cached(tuple(sorted(font_map.items()))))
+
+
+@functools.lru_cache(maxsize=None)
+def _create_styles_cached(font_map_items: tuple) -> dict[str, ParagraphStyle]:
+    font_map = dict(font_map_items)
     tnr = font_map.get("TimesNewRoman", "Times-Roman")
     tnr_bold = font_map.get("TimesNewRomanBold", "Times-Bold")
     tnr_italic = font_map.get("TimesNewRomanItalic", "Times-Italic")
@@ -478,12 +696,64 @@ def create_styles(font_map: dict[str, str]) -> dict[str, ParagraphStyle]:
     }
 
 
+@functools.lru_cache(maxsize=512)
+def _parse_para_frags(text: str, style: ParagraphStyle) -> tuple:
+    """Parse paragraph markup into ReportLab frags, cached by (text, style).
+
+    Styles come from the create_styles cache, so identity-hashed style
+    objects are stable keys across tables and documents.
+    """
+    parser = ParaParser()
+    _, frags, _ = parser.parse(cleanBlockQuotedText(text), style)
+    if frags is None:
+        raise ValueError(f"xml parser error ({parser.errors[0]}) in paragraph beginning\n'{text[:30]}'")
+    textTransformFrags(frags, style)
+    return tuple(frags)
+
+
+def _cached_para(text: str, style: ParagraphStyle) -> Paragraph:
+    """Build a Paragraph for frequently repeated text (table headers) from cached frags."""
+    return Paragraph(text, style, frags=list(_parse_para_frags(text, style)))
+
+
+def _esc(value) -> str:
+    """Escape a user value for use in Paragraph markup.
+
+    No input field accepts markup: every user-supplied string goes through
+    this before it reaches a Paragraph, so "&" and "<" render literally.
+    """
+    return str(value).translate(_XML_ESC)
+
+
+def _contact_address(company: dict) -> Optional[str]:
+    parts = [company[key] for key in ("address_line1", "address_line2") if company.get(key)]
+    return ", ".join(parts) or None
+
+
+def _contact_person(company: dict) -> Optional[str]:
+    if not company.get("contact_name"):
+        return None
+    title = f" ({company['contact_title']})" if company.get("contact_title") else ""
+    return f"{company['contact_name']}{title}"
+
+
+# Contact table rows: (label, value getter); rows with an empty value are skipped
+_CONTACT_FIELDS: list[tuple[str, Callable[[dict], Optional[str]]]] = [
+    ("Company", lambda company: company.get("name")),
+    ("Address", _contact_address),
+    ("Contact Person", _contact_person),
+    ("Phone", lambda company: company.get("contact_phone")),
+    ("Email", lambda company: company.get("contact_email")),
+    ("Website", lambda company: company.get("website")),
+]
+
+
 # ---------------------------------------------------------------------------
 # RFI Document Builder
 # ---------------------------------------------------------------------------
 
 class RFIDocumentBuilder:
-    """Builds the complete RFI response PDF using a two-pass approach."""
+    """Builds the complete RFI response PDF in a single rendering pass."""
 
     def __init__(self, font_map: dict[str, str]):
         self.font_map = font_map
@@ -492,31 +762,25 @@ class RFIDocumentBuilder:
         # Section tracking for TOC
         self._section_pages: dict[str, int] = {}
 
-    def build(self, data: dict, output_path: str) -> str:
-        """Build the PDF document.
+    def build(self, data: dict, output: Union[str, BinaryIO]) -> Union[str, BinaryIO]:
+        """Build the PDF document into a file path or a writable binary file object.
 
-        Uses a two-pass approach:
-        - Pass 1: Render to determine total pages and section positions
-        - Pass 2: Re-render with correct TOC page numbers
+        Section pages are recorded as headings are laid out; the TOC page
+        numbers and footers are drawn by NumberedCanvas when it saves, so
+        the document only needs to be rendered once. ReportLab assembles the
+        whole PDF in memory and writes it with a single write() call, so
+        passing e.g. an io.BytesIO avoids touching disk at all.
         """
-        os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+        if isinstance(output, str):
+            os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+        self._render(data, output)
+        return output
 
-        # Pass 1: Render to discover page counts
-        import io
-        buf = io.BytesIO()
-        self._render(data, buf, pass_number=1)
-        buf.seek(0)
-
-        # Pass 2: Render with known TOC data
-        self._render(data, output_path, pass_number=2)
-
-        return output_path
-
-    def _render(self, data: dict, output, pass_number: int):
+    def _render(self, data: dict, output: Union[str, BinaryIO]):
         """Render the complete document."""
         footer_data = {
-            "company_name": data.get("company", {}).get("name", "Company"),
-            "year": data.get("copyright", {}).get("year", str(datetime.now().year)),
+            "company_name": data.get("company", _EMPTY).get("name", "Company"),
+            "year": data.get("copyright", _EMPTY).get("year", str(datetime.now().year)),
             "solution_name": data.get("solution_name", "Solution"),
             "client_name": data.get("client_name", "Client"),
         }
@@ -537,23 +801,25 @@ class RFIDocumentBuilder:
         story.append(PageBreak())
 
         # Page 3: Table of Contents
-        story.extend(self._build_toc(data, pass_number))
+        story.extend(self._build_toc(data))
         story.append(PageBreak())
 
+        sections = data.get("sections") or _EMPTY
+
         # Page 4+: Executive Summary
-        story.extend(self._build_executive_summary(data))
-        story.append(PageBreak())
+        story.extend(self._build_executive_summary(sections.get("executive_summary", _EMPTY)))
+        story.append(CondPageBreak(SECTION_MIN_SPACE))
 
         # Company Profile & Credentials
-        story.extend(self._build_company_profile(data))
-        story.append(PageBreak())
+        story.extend(self._build_company_profile(sections.get("company_profile", _EMPTY)))
+        story.append(CondPageBreak(SECTION_MIN_SPACE))
 
         # Solution Profile
-        story.extend(self._build_solution_profile(data))
-        story.append(PageBreak())
+        story.extend(self._build_solution_profile(sections.get("solution_profile", _EMPTY)))
+        story.append(CondPageBreak(SECTION_MIN_SPACE))
 
         # Technical Information
-        story.extend(self._build_technical_info(data))
+        story.extend(self._build_technical_info(sections.get("technical_information", _EMPTY)))
         story.append(PageBreak())
 
         # Appendices & Copyright
@@ -583,7 +849,7 @@ class RFIDocumentBuilder:
         class _DocTemplate(BaseDocTemplate):
             """Custom doc template that tracks page numbers for sections."""
             def __init__(self, *args, section_tracker=None, **kwargs):
-                self._section_tracker = section_tracker or {}
+                self._section_tracker = section_tracker if section_tracker is not None else {}
                 super().__init__(*args, **kwargs)
 
             def afterFlowable(self, flowable):
@@ -610,38 +876,61 @@ class RFIDocumentBuilder:
                 footer_data=footer_data,
                 font_map=self.font_map,
                 skip_footer_pages={1},
+                section_pages=self._section_pages,
                 **kwargs,
             )
 
         doc.build(story, canvasmaker=canvas_maker)
+        self.total_pages = doc.page
 
-        if pass_number == 1:
-            self.total_pages = doc.page
-
-    def _make_heading_bar(self, text: str, section_num: Optional[int] = None) -> HeadingBarFlowable:
+    def _make_heading_bar(self, text: str, section_num: Optional[int] = None,
+                          space_before: float = 0) -> HeadingBarFlowable:
         """Create a heading bar flowable."""
         heading_font = self.font_map.get("CalibriLight", "Helvetica")
         display_text = f"{section_num}  {text}" if section_num else text
-        return HeadingBarFlowable(display_text, font_name=heading_font)
+        return HeadingBarFlowable(display_text, font_name=heading_font, space_before=space_before)
 
     def _make_styled_table(self, headers: list[str], rows: list[list[str]],
                            col_widths: Optional[list[float]] = None) -> Table:
-        """Create a styled table with gray header row."""
-        s = self.styles
-        # Build table data with Paragraph objects for wrapping
-        table_data = [[Paragraph(h, s["table_header"]) for h in headers]]
-        for row in rows:
-            table_data.append([Paragraph(str(cell), s["table_cell"]) for cell in row])
+        """Create a styled table with gray header row.
 
+        Short plain-text cells that fit their column on one line are passed to
+        the Table as bare strings (styled via TableStyle); anything longer or
+        containing markup is wrapped in a Paragraph.
+        """
+        s = self.styles
         if not col_widths:
             col_widths = [CONTENT_WIDTH / len(headers)] * len(headers)
 
+        cell_style = s["table_cell"]
+        cell_font, cell_size = cell_style.fontName, cell_style.fontSize
+        # Usable width inside the 6pt left/right cell padding
+        text_widths = [width - 12 for width in col_widths]
+
+        def make_cell(cell, text_width: float):
+            text = cell if cell.__class__ is str else str(cell)
+            if (len(text) < PLAIN_CELL_MAX_CHARS and "<" not in text and "&" not in text
+                    and _string_width(text, cell_font, cell_size) <= text_width):
+                return text
+            return Paragraph(_esc(text), cell_style)
+
+        table_data = [[_cached_para(h, s["table_header"]) for h in headers]]
+        table_data.extend(
+            [make_cell(cell, text_width) for cell, text_width in zip(row, text_widths)]
+            for row in rows
+        )
+
         t = Table(table_data, colWidths=col_widths, repeatRows=1)
         t.setStyle(TableStyle([
             # Header row
             ("BACKGROUND", (0, 0), (-1, 0), TABLE_HEADER_BG),
             ("FONTNAME", (0, 0), (-1, 0), self.font_map.get("TimesNewRomanBold", "Times-Bold")),
             ("FONTSIZE", (0, 0), (-1, 0), 11),
+            # Body rows (bare-string cells; Paragraph cells use table_cell)
+            ("FONTNAME", (0, 1), (-1, -1), cell_font),
+            ("FONTSIZE", (0, 1), (-1, -1), cell_size),
+            ("LEADING", (0, 1), (-1, -1), cell_style.leading),
+            ("TEXTCOLOR", (0, 1), (-1, -1), cell_style.textColor),
             # Grid
             ("GRID", (0, 0), (-1, -1), 0.5, colors.grey),
             # Alignment and padding
@@ -667,12 +956,12 @@ class RFIDocumentBuilder:
         # Prepared for line
         prepared_for = data.get("prepared_for", "")
         if prepared_for:
-            flowables.append(Paragraph(f"Prepared for: <b>{prepared_for}</b>", s["prepared_for"]))
+            flowables.append(Paragraph(f"Prepared for: <b>{_esc(prepared_for)}</b>", s["prepared_for"]))
             flowables.append(Spacer(1, 8))
 
         date_prepared = data.get("date_prepared", "")
         if date_prepared:
-            flowables.append(Paragraph(f"Date Prepared: {date_prepared}", s["prepared_for"]))
+            flowables.append(Paragraph(f"Date Prepared: {_esc(date_prepared)}", s["prepared_for"]))
             flowables.append(Spacer(1, 16))
 
         # Contact Information heading bar
@@ -681,33 +970,16 @@ class RFIDocumentBuilder:
 
         # Contact table
         company = data.get("company", {})
-        contact_rows = []
-        if company.get("name"):
-            contact_rows.append(["Company", company["name"]])
-        addr_parts = []
-        if company.get("address_line1"):
-            addr_parts.append(company["address_line1"])
-        if company.get("address_line2"):
-            addr_parts.append(company["address_line2"])
-        if addr_parts:
-            contact_rows.append(["Address", ", ".join(addr_parts)])
-        if company.get("contact_name"):
-            title = f" ({company['contact_title']})" if company.get("contact_title") else ""
-            contact_rows.append(["Contact Person", f"{company['contact_name']}{title}"])
-        if company.get("contact_phone"):
-            contact_rows.append(["Phone", company["contact_phone"]])
-        if company.get("contact_email"):
-            contact_rows.append(["Email", company["contact_email"]])
-        if company.get("website"):
-            contact_rows.append(["Website", company["website"]])
+        contact_rows = [
+            (label, value) for label, get_value in _CONTACT_FIELDS
+            if (value := get_value(company))
+        ]
 
         if contact_rows:
-            table_data = []
-            for row in contact_rows:
-                table_data.append([
-                    Paragraph(row[0], s["table_header"]),
-                    Paragraph(row[1], s["table_cell"]),
-                ])
+            table_data = [
+                [_cached_para(label, s["table_header"]), Paragraph(_esc(value), s["table_cell"])]
+                for label, value in contact_rows
+            ]
             ct = Table(table_data, colWidths=[120, CONTENT_WIDTH - 120])
             ct.setStyle(TableStyle([
                 ("GRID", (0, 0), (-1, -1), 0.5, colors.grey),
@@ -746,7 +1018,7 @@ class RFIDocumentBuilder:
 
         return flowables
 
-    def _build_toc(self, data: dict, pass_number: int) -> list:
+    def _build_toc(self, data: dict) -> list:
         """Build table of contents page."""
         flowables = []
 
@@ -767,22 +1039,13 @@ class RFIDocumentBuilder:
 
         tnr = self.font_map.get("TimesNewRoman", "Times-Roman")
 
-        if pass_number == 2 and self._section_pages:
-            # Use actual page numbers from pass 1
-            for display_name, tracker_key in toc_sections:
-                page = self._section_pages.get(tracker_key, 0)
-                if page > 0:
-                    # Subtract 1 because cover is page 1 but content starts at "page 1"
-                    flowables.append(TOCEntryFlowable(display_name, page - 1, font_name=tnr))
-        else:
-            # Pass 1 or no data - placeholder page numbers
-            placeholder_pages = [1, 2, 3, 4, 5, 6, 7, 7]
-            for (display_name, _), pnum in zip(toc_sections, placeholder_pages):
-                flowables.append(TOCEntryFlowable(display_name, pnum, font_name=tnr))
+        # Page numbers are filled in by NumberedCanvas once every heading is placed
+        for display_name, tracker_key in toc_sections:
+            flowables.append(TOCEntryFlowable(display_name, tracker_key, font_name=tnr))
 
         return flowables
 
-    def _build_executive_summary(self, data: dict) -> list:
+    def _build_executive_summary(self, section: dict) -> list:
         """Build executive summary section."""
         s = self.styles
         flowables = []
@@ -790,38 +1053,34 @@ class RFIDocumentBuilder:
         flowables.append(self._make_heading_bar("Executive Summary"))
         flowables.append(Spacer(1, 12))
 
-        section = data.get("sections", {}).get("executive_summary", {})
-
         # Paragraphs
         for para_text in section.get("paragraphs", []):
-            flowables.append(Paragraph(para_text, s["body"]))
-            flowables.append(Spacer(1, 4))
+            flowables.extend((Paragraph(_esc(para_text), s["body"]), Spacer(1, 4)))
 
         # Bullet points
         bullets = section.get("bullet_points", [])
         if bullets:
             flowables.append(Spacer(1, 6))
-            for bullet in bullets:
-                flowables.append(
-                    Paragraph(f"- {bullet}", s["dash_bullet"])
-                )
+            flowables.extend(
+                Paragraph(_esc(bullet), s["dash_bullet"], bulletText=DASH_BULLET) for bullet in bullets
+            )
 
         return flowables
 
-    def _build_company_profile(self, data: dict) -> list:
+    def _build_company_profile(self, section: dict) -> list:
         """Build company profile and credentials section."""
         s = self.styles
         flowables = []
 
-        flowables.append(self._make_heading_bar("Company Profile & Credentials", section_num=1))
+        flowables.append(self._make_heading_bar(
+            "Company Profile & Credentials", section_num=1, space_before=SECTION_SPACE_BEFORE
+        ))
         flowables.append(Spacer(1, 12))
 
-        section = data.get("sections", {}).get("company_profile", {})
-
         # Description
         desc = section.get("description", "")
         if desc:
-            flowables.append(Paragraph(desc, s["body"]))
+            flowables.append(Paragraph(_esc(desc), s["body"]))
             flowables.append(Spacer(1, 8))
 
         # Credentials
@@ -829,10 +1088,9 @@ class RFIDocumentBuilder:
         if creds:
             flowables.append(Paragraph("<b>Awards & Recognition:</b>", s["body_bold"]))
             flowables.append(Spacer(1, 4))
-            for cred in creds:
-                flowables.append(
-                    Paragraph(f"\u2022 {cred}", s["round_bullet"])
-                )
+            flowables.extend(
+                Paragraph(_esc(cred), s["round_bullet"], bulletText=ROUND_BULLET) for cred in creds
+            )
             flowables.append(Spacer(1, 8))
 
         # Certifications / analyst recognition
@@ -840,10 +1098,10 @@ class RFIDocumentBuilder:
         if certs:
             flowables.append(Paragraph("<b>Analyst Recognition:</b>", s["body_bold"]))
             flowables.append(Spacer(1, 4))
-            for cert in certs:
-                flowables.append(
-                    Paragraph(f"\u2022 <i>{cert}</i>", s["round_bullet"])
-                )
+            flowables.extend(
+                Paragraph(f"<i>{_esc(cert)}</i>", s["round_bullet"], bulletText=ROUND_BULLET)
+                for cert in certs
+            )
             flowables.append(Spacer(1, 8))
 
         # Experience highlights
@@ -851,38 +1109,37 @@ class RFIDocumentBuilder:
         if exp:
             flowables.append(Paragraph("<b>Key Experience:</b>", s["body_bold"]))
             flowables.append(Spacer(1, 4))
-            for item in exp:
-                flowables.append(
-                    Paragraph(f"- {item}", s["dash_bullet"])
-                )
+            flowables.extend(
+                Paragraph(_esc(item), s["dash_bullet"], bulletText=DASH_BULLET) for item in exp
+            )
             flowables.append(Spacer(1, 8))
 
         # Hyperlinks
         links = section.get("hyperlinks", [])
-        for link in links:
-            flowables.append(
-                Paragraph(
-                    f'<a href="{link["url"]}" color="#0462c1">{link["text"]}</a>',
-                    s["hyperlink"],
-                )
+        flowables.extend(
+            Paragraph(
+                f'<a href="{_esc(link["url"])}" color="#0462c1">{_esc(link["text"])}</a>',
+                s["hyperlink"],
             )
+            for link in links
+        )
 
         return flowables
 
-    def _build_solution_profile(self, data: dict) -> list:
+    def _build_solution_profile(self, section: dict) -> list:
         """Build solution/product profile section."""
         s = self.styles
         flowables = []
 
-        flowables.append(self._make_heading_bar("Solution Profile", section_num=2))
+        flowables.append(self._make_heading_bar(
+            "Solution Profile", section_num=2, space_before=SECTION_SPACE_BEFORE
+        ))
         flowables.append(Spacer(1, 12))
 
-        section = data.get("sections", {}).get("solution_profile", {})
-
         # Overview
         overview = section.get("overview", "")
         if overview:
-            flowables.append(Paragraph(overview, s["body"]))
+            flowables.append(Paragraph(_esc(overview), s["body"]))
             flowables.append(Spacer(1, 10))
 
         # Features
@@ -894,26 +1151,26 @@ class RFIDocumentBuilder:
             for feature in features:
                 name = feature.get("name", "")
                 desc = feature.get("description", "")
-                flowables.append(
-                    Paragraph(f"- <b>{name}:</b> {desc}", s["dash_bullet"])
-                )
-                flowables.append(Spacer(1, 2))
+                flowables.extend((
+                    Paragraph(f"<b>{_esc(name)}:</b> {_esc(desc)}", s["dash_bullet"], bulletText=DASH_BULLET),
+                    Spacer(1, 2),
+                ))
 
         return flowables
 
-    def _build_technical_info(self, data: dict) -> list:
+    def _build_technical_info(self, section: dict) -> list:
         """Build technical information section."""
         s = self.styles
         flowables = []
 
-        flowables.append(self._make_heading_bar("Technical Information", section_num=3))
+        flowables.append(self._make_heading_bar(
+            "Technical Information", section_num=3, space_before=SECTION_SPACE_BEFORE
+        ))
         flowables.append(Spacer(1, 12))
 
-        section = data.get("sections", {}).get("technical_information", {})
-
         content = section.get("content", "")
         if content:
-            flowables.append(Paragraph(content, s["body"]))
+            flowables.append(Paragraph(_esc(content), s["body"]))
             flowables.append(Spacer(1, 10))
 
         # Attached documents
@@ -921,10 +1178,9 @@ class RFIDocumentBuilder:
         if attached:
             flowables.append(Paragraph("<b>Attached Documents:</b>", s["body_bold"]))
             flowables.append(Spacer(1, 4))
-            for doc_name in attached:
-                flowables.append(
-                    Paragraph(f"- {doc_name}", s["dash_bullet"])
-                )
+            flowables.extend(
+                Paragraph(_esc(doc_name), s["dash_bullet"], bulletText=DASH_BULLET) for doc_name in attached
+            )
 
         return flowables
 
@@ -943,11 +1199,13 @@ class RFIDocumentBuilder:
                 label = app.get("label", "")
                 filename = app.get("filename", "")
                 desc = app.get("description", "")
-                line = f"- <b>{label}:</b> {filename}"
+                line = f"<b>{_esc(label)}:</b> {_esc(filename)}"
                 if desc:
-                    line += f" ({desc})"
-                flowables.append(Paragraph(line, s["dash_bullet"]))
-                flowables.append(Spacer(1, 2))
+                    line += f" ({_esc(desc)})"
+                flowables.extend((
+                    Paragraph(line, s["dash_bullet"], bulletText=DASH_BULLET),
+                    Spacer(1, 2),
+                ))
         else:
             flowables.append(Paragraph("No appendices.", s["body"]))
 
@@ -963,11 +1221,11 @@ class RFIDocumentBuilder:
         notice = copyright_data.get("notice_text", "")
 
         if notice:
-            flowables.append(Paragraph(notice, s["copyright"]))
+            flowables.append(Paragraph(_esc(notice), s["copyright"]))
         else:
             flowables.append(
                 Paragraph(
-                    f"\u00a9 {year} {company_name}. All rights reserved.",
+                    f"\u00a9 {_esc(year)} {_esc(company_name)}. All rights reserved.",
                     s["copyright"],
                 )
             )
@@ -975,10 +1233,70 @@ class RFIDocumentBuilder:
         return flowables
 
 
+# ---------------------------------------------------------------------------
+# Batch generation
+# ---------------------------------------------------------------------------
+
+# Font map registered once per worker process by _register_fonts_once
+_worker_font_map: Optional[dict[str, str]] = None
+
+
+def _register_fonts_once(cache_path: Optional[str] = FONT_CACHE_PATH):
+    """Process-pool initializer: discover and register fonts once per worker."""
+    global _worker_font_map
+    _worker_font_map = FontManager(cache_path=cache_path).register_fonts()
+
+
+def _build_in_worker(data: dict, output_path: str) -> tuple[str, int]:
+    """Build one PDF in a worker process, returning (output_path, total_pages)."""
+    if _worker_font_map is None:
+        _register_fonts_once()
+    builder = RFIDocumentBuilder(_worker_font_map)
+    builder.build(data, output_path)
+    return output_path, builder.total_pages
+
+
+def build_many(data_list: list[dict], output_paths: list[str], max_workers: Optional[int] = None,
+               font_cache_path: Optional[str] = FONT_CACHE_PATH) -> list[tuple[str, int]]:
+    """Build several RFI PDFs in parallel, one document per worker process.
+
+    ReportLab rendering is CPU-bound pure Python, so processes rather than
+    threads are used. Returns (output_path, total_pages) in input order.
+    """
+    if len(data_list) != len(output_paths):
+        raise ValueError("data_list and output_paths must be the same length")
+    if not data_list:
+        return []
+
+    max_workers = min(max_workers or os.cpu_count() or 1, len(data_list))
+    if max_workers == 1:
+        _register_fonts_once(font_cache_path)
+        return [_build_in_worker(data, path) for data, path in zip(data_list, output_paths)]
+
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=max_workers, initializer=_register_fonts_once, initargs=(font_cache_path,)
+    ) as executor:
+        return list(executor.map(_build_in_worker, data_list, output_paths))
+
+
 # ---------------------------------------------------------------------------
 # CLI
 # ---------------------------------------------------------------------------
 
+def _load_data(path: str) -> dict:
+    """Read an input JSON file, exiting with a message if it is missing or invalid."""
+    try:
+        with open(path, "rb") as f:
+            raw = f.read()
+        return orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except FileNotFoundError:
+        print(f"Error: Input file not found: {path}", file=sys.stderr)
+        sys.exit(1)
+    except json.JSONDecodeError as e:
+        print(f"Error: Invalid JSON in {path}: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Generate a professional RFI Response PDF document",
@@ -986,11 +1304,20 @@ def main():
         epilog="""
 Example:
     python3 generate_pdf.py --input data.json --output response.pdf --verbose
+
+    # Several documents at once, in parallel; --output is then a directory
+    python3 generate_pdf.py --input a.json b.json c.json --output ./output --jobs 3
         """,
     )
-    parser.add_argument("--input", required=True, help="Path to JSON data file")
-    parser.add_argument("--output", required=True, help="Output PDF file path")
+    parser.add_argument("--input", required=True, nargs="+",
+                        help="Path to JSON data file (several for a batch)")
+    parser.add_argument("--output", required=True,
+                        help="Output PDF file path, or a directory when several inputs are given")
+    parser.add_argument("--jobs", type=int, default=None,
+                        help="Worker processes for a batch (default: one per input, up to the CPU count)")
     parser.add_argument("--verbose", action="store_true", help="Enable verbose logging")
+    parser.add_argument("--no-font-cache", action="store_true",
+                        help="Rescan font directories instead of using the cached font map")
     args = parser.parse_args()
 
     # Configure logging
@@ -1000,20 +1327,36 @@ Example:
         format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
     )
 
+    font_cache_path = None if args.no_font_cache else FONT_CACHE_PATH
+
+    if len(args.input) > 1:
+        # Batch: one PDF per input, named after it, built in worker processes
+        data_list = [_load_data(path) for path in args.input]
+        os.makedirs(args.output, exist_ok=True)
+        output_paths = [
+            os.path.join(args.output, os.path.splitext(os.path.basename(path))[0] + ".pdf")
+            for path in args.input
+        ]
+        print(f"Generating {len(data_list)} PDFs in: {args.output}")
+        try:
+            results = build_many(data_list, output_paths, args.jobs, font_cache_path)
+        except Exception as e:
+            print(f"Error generating PDFs: {e}", file=sys.stderr)
+            if args.verbose:
+                import traceback
+                traceback.print_exc()
+            sys.exit(1)
+        print(f"\nPDFs generated successfully!")
+        for output_path, total_pages in results:
+            print(f"  {output_path}: {total_pages} pages")
+        return
+
     # Load JSON data
-    try:
-        with open(args.input, "r", encoding="utf-8") as f:
-            data = json.load(f)
-    except FileNotFoundError:
-        print(f"Error: Input file not found: {args.input}", file=sys.stderr)
-        sys.exit(1)
-    except json.JSONDecodeError as e:
-        print(f"Error: Invalid JSON in {args.input}: {e}", file=sys.stderr)
-        sys.exit(1)
+    data = _load_data(args.input[0])
 
     # Register fonts
     print("Discovering and registering fonts...")
-    font_mgr = FontManager()
+    font_mgr = FontManager(cache_path=font_cache_path)
     font_map = font_mgr.register_fonts()
 
     if font_mgr.substitutions:
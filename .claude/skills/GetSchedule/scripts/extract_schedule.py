@@ -7,114 +7,354 @@ the procurement schedule — key dates, deadlines, and milestones.
 
 Usage:
     python3 extract_schedule.py --input document.pdf [--output schedule.json] [--format json|csv|markdown] [--verbose]
+    python3 extract_schedule.py --batch paths.txt [--output schedules.jsonl]
 """
 
 import argparse
+import concurrent.futures
 import csv
+import hashlib
 import io
 import json
 import logging
 import os
+import re
 import sys
 from datetime import datetime
-from typing import Any, Optional
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Optional
+
+try:
+    import orjson
+except ImportError:  # optional; stdlib json is used instead
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
 # Maximum characters to send to Claude (covers most schedule locations)
 MAX_TEXT_CHARS = 15000
 
+# Table cells longer than this are cut short in the Claude prompt
+MAX_CELL_CHARS = 200
+
+# Parse results are cached here, keyed by a hash of the document's bytes
+PARSE_CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "rfp-schedule"
+)
+# Part of every cache key; bump it when the parser output changes
+PARSE_CACHE_VERSION = 1
+
+# Schedule tables always carry dates or week numbers, so pages without a
+# single digit are not worth pdfplumber's (slow) table detection
+_DIGIT_RE = re.compile(r"\d")
+
+# pdfplumber passes over at least this many pages are split across processes
+PARALLEL_MIN_PAGES = 16
+
+# Headings that usually introduce the procurement schedule (used by --early-exit)
+_SCHEDULE_ANCHOR_RE = re.compile(
+    r"\b(schedule|timeline|timetable|key\s+dates|planning|milestones|deadlines?)\b", re.I
+)
+
 
 # ---------------------------------------------------------------------------
 # Document Parser
 # ---------------------------------------------------------------------------
 
+class _ScheduleScan:
+    """Decides when enough pages have been read to cover the schedule.
+
+    Stops once MAX_TEXT_CHARS of text follow the first schedule-like heading,
+    or after 4 * MAX_TEXT_CHARS in total if no such heading turns up.
+    """
+
+    def __init__(self):
+        self.total_chars = 0
+        self.chars_since_anchor: Optional[int] = None
+
+    def done_after(self, text: str) -> bool:
+        """Account for one more page of text; True if parsing can stop after it."""
+        self.total_chars += len(text)
+        if self.chars_since_anchor is not None:
+            self.chars_since_anchor += len(text)
+        else:
+            match = _SCHEDULE_ANCHOR_RE.search(text)
+            if match:
+                self.chars_since_anchor = len(text) - match.start()
+        if self.chars_since_anchor is not None:
+            return self.chars_since_anchor > MAX_TEXT_CHARS
+        return self.total_chars > 4 * MAX_TEXT_CHARS
+
+
+def _parse_pages(file_path: str, page_numbers: list[int], extract_text: bool,
+                 scan: Optional[_ScheduleScan] = None) -> list[tuple[str, list[list[list[str]]]]]:
+    """Run pdfplumber over the given 0-based pages, returning (text, tables) per page.
+
+    With extract_text=False the caller already has the page text (from
+    PDFium) and every listed page is a table candidate; otherwise tables are
+    only extracted from pages whose text contains a digit, and ``scan`` (if
+    given) can end the pass early. Module-level so it can run in a worker
+    process.
+    """
+    import pdfplumber
+
+    results = []
+    with pdfplumber.open(file_path) as pdf:
+        for page_idx in page_numbers:
+            page = pdf.pages[page_idx]
+            text = ""
+            if extract_text:
+                text = page.extract_text() or ""
+                stop = scan is not None and scan.done_after(text)
+                if not _DIGIT_RE.search(text):
+                    results.append((text, []))
+                    if stop:
+                        break
+                    continue
+            else:
+                stop = False
+
+            # pdfplumber cells are str or None (empty/merged cells)
+            page_tables = [
+                [[cell.strip() if cell else "" for cell in row] for row in table]
+                for table in page.extract_tables()
+            ]
+            results.append((text, page_tables))
+            if stop:
+                break
+    return results
+
+
 class DocumentParser:
     """Parses PDF and DOCX documents to extract text and tables."""
 
     @staticmethod
-    def parse(file_path: str) -> dict[str, Any]:
+    def parse(file_path: str, stop_early: bool = False, cache_dir: Optional[str] = None) -> dict[str, Any]:
         """Parse a document and return text + tables.
 
+        With stop_early, PDF parsing stops once the text following the first
+        schedule-like heading fills the prompt budget (see _ScheduleScan);
+        tables past that point are not extracted and "partial" is set.
+
+        With cache_dir, results are stored there under the SHA-256 of the
+        file contents and reused when the same document is parsed again.
+
         Returns:
             {
                 "text": str,
                 "tables": list[list[list[str]]],
                 "filename": str,
                 "page_count": int,
+                "pages_parsed": int,
+                "partial": bool,
             }
         """
         if not os.path.isfile(file_path):
             raise FileNotFoundError(f"File not found: {file_path}")
 
         ext = os.path.splitext(file_path)[1].lower()
-        if ext == ".pdf":
-            return DocumentParser._parse_pdf(file_path)
-        elif ext in (".docx", ".doc"):
-            return DocumentParser._parse_docx(file_path)
-        else:
+        if ext not in (".pdf", ".docx", ".doc"):
             raise ValueError(f"Unsupported file type: {ext}. Supported: .pdf, .docx")
+        stop_early = stop_early and ext == ".pdf"
+
+        if not cache_dir:
+            return DocumentParser._parse_file(file_path, ext, stop_early)
+
+        cache_path = DocumentParser._cache_path(file_path, cache_dir, stop_early)
+        result = DocumentParser._load_cached(cache_path)
+        if result is not None:
+            logger.info("Parse result loaded from cache '%s'", cache_path)
+            result["filename"] = os.path.basename(file_path)
+            return result
+
+        result = DocumentParser._parse_file(file_path, ext, stop_early)
+        DocumentParser._save_cached(cache_path, result)
+        return result
+
+    @staticmethod
+    def _parse_file(file_path: str, ext: str, stop_early: bool) -> dict[str, Any]:
+        if ext == ".pdf":
+            return DocumentParser._parse_pdf(file_path, stop_early)
+        return DocumentParser._parse_docx(file_path)
+
+    @staticmethod
+    def _cache_path(file_path: str, cache_dir: str, stop_early: bool) -> str:
+        """Cache file for this document's contents (early-exit results are kept apart)."""
+        digest = hashlib.sha256()
+        with open(file_path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+        suffix = "-early" if stop_early else ""
+        return os.path.join(cache_dir, f"{digest.hexdigest()}-v{PARSE_CACHE_VERSION}{suffix}.json")
 
     @staticmethod
-    def _parse_pdf(file_path: str) -> dict[str, Any]:
-        """Parse a PDF file using pdfplumber."""
-        import pdfplumber
+    def _load_cached(cache_path: str) -> Optional[dict[str, Any]]:
+        try:
+            with open(cache_path, "rb") as f:
+                raw = f.read()
+            result = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        except (OSError, ValueError):
+            return None
+        return result if isinstance(result, dict) else None
 
-        all_text = []
+    @staticmethod
+    def _save_cached(cache_path: str, result: dict[str, Any]):
+        """Write a parse result to the cache, ignoring failures."""
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(format_json(result, indent=False))
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.debug("Could not write parse cache '%s': %s", cache_path, e)
+
+    @staticmethod
+    def _extract_text_fast(file_path: str) -> Optional[tuple[list[str], list[bool]]]:
+        """Extract per-page text with PDFium, plus whether each page has any vector paths.
+
+        pdfplumber's default table finder builds tables from drawn lines and
+        rects, so a page without path objects cannot yield a table.
+        Returns None if pypdfium2 isn't installed.
+        """
+        try:
+            import pypdfium2 as pdfium
+            import pypdfium2.raw as pdfium_c
+        except ImportError:
+            return None
+
+        page_texts = []
+        has_paths = []
+        pdf = pdfium.PdfDocument(file_path)
+        try:
+            for page in pdf:
+                textpage = page.get_textpage()
+                page_texts.append(textpage.get_text_range().replace("\r\n", "\n").strip())
+                textpage.close()
+                paths = page.get_objects(filter=[pdfium_c.FPDF_PAGEOBJ_PATH])
+                has_paths.append(next(paths, None) is not None)
+                page.close()
+        finally:
+            pdf.close()
+        return page_texts, has_paths
+
+    @staticmethod
+    def _parse_pdf(file_path: str, stop_early: bool = False) -> dict[str, Any]:
+        """Parse a PDF file: text via PDFium when available, tables via pdfplumber.
+
+        Without pypdfium2 every page goes through pdfplumber, as before.
+        """
         all_tables = []
 
-        with pdfplumber.open(file_path) as pdf:
-            page_count = len(pdf.pages)
-            for page in pdf.pages:
-                # Extract text
-                text = page.extract_text()
-                if text:
-                    all_text.append(text)
-
-                # Extract tables
-                tables = page.extract_tables()
-                if tables:
-                    for table in tables:
-                        # Clean up None values
-                        cleaned = []
-                        for row in table:
-                            cleaned.append([str(cell).strip() if cell else "" for cell in row])
-                        all_tables.append(cleaned)
+        fast = DocumentParser._extract_text_fast(file_path)
+        if fast is not None:
+            page_texts, has_paths = fast
+            page_count = len(page_texts)
+            if stop_early:
+                scan = _ScheduleScan()
+                for page_idx, text in enumerate(page_texts):
+                    if scan.done_after(text):
+                        page_texts = page_texts[:page_idx + 1]
+                        break
+            pages_parsed = len(page_texts)
+            # Only pages that can hold a (dated) ruled table need pdfplumber
+            table_pages = [
+                i for i, text in enumerate(page_texts)
+                if has_paths[i] and _DIGIT_RE.search(text)
+            ]
+            for _, tables in DocumentParser._parse_pages_parallel(file_path, table_pages, False):
+                all_tables.extend(tables)
+            text = "\n\n".join(filter(None, page_texts))
+        else:
+            logger.debug("pypdfium2 not installed; extracting text with pdfplumber")
+            import pdfplumber
+
+            with pdfplumber.open(file_path) as pdf:
+                page_count = len(pdf.pages)
+            if stop_early:
+                # Sequential, so the scan can stop at the first sufficient page
+                pages = _parse_pages(file_path, list(range(page_count)), True, _ScheduleScan())
+            else:
+                pages = DocumentParser._parse_pages_parallel(file_path, list(range(page_count)), True)
+            pages_parsed = len(pages)
+            for _, tables in pages:
+                all_tables.extend(tables)
+            text = "\n\n".join(page_text for page_text, _ in pages if page_text)
 
         return {
-            "text": "\n\n".join(all_text),
+            "text": text,
             "tables": all_tables,
             "filename": os.path.basename(file_path),
             "page_count": page_count,
+            "pages_parsed": pages_parsed,
+            "partial": pages_parsed < page_count,
         }
 
+    @staticmethod
+    def _parse_pages_parallel(file_path: str, page_numbers: list[int],
+                              extract_text: bool) -> list[tuple[str, list[list[list[str]]]]]:
+        """Run _parse_pages over page_numbers, in page-chunks across processes when large.
+
+        pdfminer/pdfplumber is CPU-bound pure Python, so processes (not threads)
+        are used. Results come back in page order.
+        """
+        workers = os.cpu_count() or 1
+        if workers < 2 or len(page_numbers) < PARALLEL_MIN_PAGES:
+            return _parse_pages(file_path, page_numbers, extract_text)
+
+        chunk_size = max(1, len(page_numbers) // workers)
+        chunks = [
+            page_numbers[i:i + chunk_size] for i in range(0, len(page_numbers), chunk_size)
+        ]
+        results = []
+        with concurrent.futures.ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as executor:
+            futures = [
+                executor.submit(_parse_pages, file_path, chunk, extract_text) for chunk in chunks
+            ]
+            for future in futures:
+                results.extend(future.result())
+        return results
+
     @staticmethod
     def _parse_docx(file_path: str) -> dict[str, Any]:
         """Parse a DOCX file using python-docx."""
         from docx import Document
+        from docx.oxml.ns import qn
+
+        W_P, W_T, W_TAB, W_BR = qn("w:p"), qn("w:t"), qn("w:tab"), qn("w:br")
+
+        def cell_text(tc) -> str:
+            # Same text as python-docx's Cell.text (paragraphs joined by
+            # newlines, tabs and line breaks kept), read straight off the XML.
+            return "\n".join(
+                "".join(
+                    el.text or "" if el.tag == W_T else "\t" if el.tag == W_TAB else "\n"
+                    for el in p.iter(W_T, W_TAB, W_BR)
+                )
+                for p in tc.iterchildren(W_P)
+            )
 
         doc = Document(file_path)
-        all_text = []
         all_tables = []
 
-        # Extract paragraphs
-        for para in doc.paragraphs:
-            if para.text.strip():
-                all_text.append(para.text.strip())
+        # Extract paragraphs (Paragraph.text walks the XML, so read it once each)
+        text = "\n".join(filter(None, (para.text.strip() for para in doc.paragraphs)))
 
         # Extract tables
         for table in doc.tables:
             rows = []
             for row in table.rows:
-                cells = [cell.text.strip() for cell in row.cells]
+                cells = [cell_text(cell._tc).strip() for cell in row.cells]
                 rows.append(cells)
             all_tables.append(rows)
 
         return {
-            "text": "\n".join(all_text),
+            "text": text,
             "tables": all_tables,
             "filename": os.path.basename(file_path),
             "page_count": 0,  # DOCX doesn't have page count easily
+            "pages_parsed": 0,
+            "partial": False,
         }
 
 
@@ -234,9 +474,13 @@ Always note any caveats mentioned about the schedule (e.g., "indicative", "subje
 class ScheduleExtractor:
     """Extracts schedule events from parsed document content using Claude AI."""
 
-    def __init__(self, api_key: str, model: str = "claude-sonnet-4-5-20250929"):
-        import anthropic
-        self.client = anthropic.Anthropic(api_key=api_key)
+    def __init__(self, api_key: Optional[str] = None, model: str = "claude-sonnet-4-5-20250929",
+                 client: Any = None):
+        """Create an extractor; pass ``client`` to share one Anthropic client (and its pool)."""
+        if client is None:
+            import anthropic
+            client = anthropic.Anthropic(api_key=api_key)
+        self.client = client
         self.model = model
 
     def extract(self, parsed_doc: dict[str, Any]) -> dict[str, Any]:
@@ -253,7 +497,9 @@ class ScheduleExtractor:
 
         logger.info(f"Sending {len(user_content)} chars to Claude for extraction...")
 
-        response = self.client.messages.create(
+        # Stream the reply and return as soon as the extract_schedule block
+        # is complete, instead of waiting for the whole message.
+        with self.client.messages.stream(
             model=self.model,
             max_tokens=4096,
             system=SYSTEM_PROMPT,
@@ -262,19 +508,34 @@ class ScheduleExtractor:
             messages=[
                 {"role": "user", "content": user_content},
             ],
-        )
-
-        # Extract structured data from tool use response
-        for block in response.content:
-            if block.type == "tool_use" and block.name == "extract_schedule":
-                result = block.input
-                # Add metadata
-                result["document"] = parsed_doc.get("filename", "unknown")
-                result["extracted_at"] = datetime.now().isoformat()
-                return result
+        ) as stream:
+            for event in stream:
+                if event.type != "content_block_stop":
+                    continue
+                block = event.content_block
+                if block.type == "tool_use" and block.name == "extract_schedule":
+                    result = dict(block.input)
+                    # Add metadata
+                    result["document"] = parsed_doc.get("filename", "unknown")
+                    result["extracted_at"] = datetime.now().isoformat()
+                    return result
 
         raise RuntimeError("Claude did not return a tool_use response")
 
+    def extract_many(self, paths: Iterable[str], stop_early: bool = False,
+                     cache_dir: Optional[str] = None) -> Iterator[dict[str, Any]]:
+        """Parse and extract each document in turn over the same client connection.
+
+        A document that fails yields ``{"document": ..., "error": ...}``
+        instead of stopping the batch.
+        """
+        for path in paths:
+            try:
+                yield self.extract(DocumentParser.parse(path, stop_early=stop_early, cache_dir=cache_dir))
+            except Exception as e:
+                logger.debug("Extraction failed for %s", path, exc_info=True)
+                yield {"document": os.path.basename(path), "error": str(e)}
+
     def _build_prompt(self, parsed_doc: dict[str, Any]) -> str:
         """Build the user prompt combining text and tables."""
         parts = []
@@ -286,13 +547,23 @@ class ScheduleExtractor:
         parts.append("")
 
         # Include tables first (most likely to contain schedule)
-        tables = parsed_doc.get("tables", [])
+        tables = _prompt_tables(parsed_doc.get("tables", []))
         if tables:
             parts.append("=== TABLES FOUND IN DOCUMENT ===")
             for i, table in enumerate(tables, 1):
                 parts.append(f"\nTable {i}:")
                 for row in table:
-                    parts.append(" | ".join(row))
+                    parts.append(" | ".join(
+                        cell if len(cell) <= MAX_CELL_CHARS else cell[:MAX_CELL_CHARS] + "..."
+                        for cell in row
+                    ))
+            parts.append("")
+
+        if parsed_doc.get("partial"):
+            parts.append(
+                f"[Note: parsing stopped early after page {parsed_doc.get('pages_parsed')} "
+                f"of {parsed_doc.get('page_count')}; later pages were not read.]"
+            )
             parts.append("")
 
         # Include document text (truncated if needed)
@@ -314,10 +585,59 @@ class ScheduleExtractor:
         return "\n".join(parts)
 
 
+def _prompt_tables(tables: list[list[list[str]]]) -> list[list[list[str]]]:
+    """Drop tables that cannot hold a schedule before they reach the prompt.
+
+    Repeats of an earlier table (e.g. a header table on every page), tables
+    with fewer than two non-empty rows and tables without a single digit
+    are skipped.
+    """
+    has_digit = _DIGIT_RE.search
+    seen = set()
+    kept = []
+    for table in tables:
+        key = tuple(tuple(row) for row in table)
+        if key in seen:
+            continue
+        seen.add(key)
+        if sum(1 for row in table if any(cell.strip() for cell in row)) < 2:
+            continue
+        if not has_digit("".join(cell for row in table for cell in row)):
+            continue
+        kept.append(table)
+    return kept
+
+
 # ---------------------------------------------------------------------------
 # Output Formatters
 # ---------------------------------------------------------------------------
 
+def format_json(data: Any, indent: bool = True) -> str:
+    """Serialize to JSON (non-ASCII kept as-is), using orjson when installed.
+
+    With ``indent=False`` the result is a single compact line (for JSONL).
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(data, option=option).decode()
+    if indent:
+        return json.dumps(data, indent=2, ensure_ascii=False)
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+
+
+def _markdown_row(i: int, event: dict[str, Any]) -> str:
+    """Format one schedule event as a markdown table row."""
+    get = event.get
+    notes = get("notes", "")
+    # Truncate long notes for table display
+    if len(notes) > 60:
+        notes = notes[:57] + "..."
+    return (
+        f"| {i} | {get('event_name', 'N/A')} | {get('date', 'TBD')} | {get('date_type', '')} | "
+        f"{'Yes' if get('is_deadline') else 'No'} | {notes} |"
+    )
+
+
 def format_markdown_table(result: dict[str, Any]) -> str:
     """Format extraction result as a markdown table."""
     lines = []
@@ -335,16 +655,7 @@ def format_markdown_table(result: dict[str, Any]) -> str:
     lines.append("| # | Event | Date | Type | Deadline? | Notes |")
     lines.append("|---|-------|------|------|-----------|-------|")
 
-    for i, event in enumerate(events, 1):
-        name = event.get("event_name", "N/A")
-        date = event.get("date", "TBD")
-        date_type = event.get("date_type", "")
-        is_deadline = "Yes" if event.get("is_deadline") else "No"
-        notes = event.get("notes", "")
-        # Truncate long notes for table display
-        if len(notes) > 60:
-            notes = notes[:57] + "..."
-        lines.append(f"| {i} | {name} | {date} | {date_type} | {is_deadline} | {notes} |")
+    lines.append("\n".join(_markdown_row(i, event) for i, event in enumerate(events, 1)))
 
     # Additional notes
     additional = result.get("additional_notes", "")
@@ -364,8 +675,8 @@ def format_csv(result: dict[str, Any]) -> str:
     writer.writerow(["#", "Event Type", "Event Name", "Date", "Date Type", "Is Deadline", "Notes"])
 
     events = result.get("schedule_events", [])
-    for i, event in enumerate(events, 1):
-        writer.writerow([
+    writer.writerows(
+        (
             i,
             event.get("event_type", ""),
             event.get("event_name", ""),
@@ -373,7 +684,9 @@ def format_csv(result: dict[str, Any]) -> str:
             event.get("date_type", ""),
             "Yes" if event.get("is_deadline") else "No",
             event.get("notes", ""),
-        ])
+        )
+        for i, event in enumerate(events, 1)
+    )
 
     return output.getvalue()
 
@@ -382,6 +695,62 @@ def format_csv(result: dict[str, Any]) -> str:
 # CLI
 # ---------------------------------------------------------------------------
 
+def _cache_dir(args: argparse.Namespace) -> Optional[str]:
+    return None if args.no_cache else PARSE_CACHE_DIR
+
+
+def _require_api_key() -> str:
+    """Return ANTHROPIC_API_KEY, or exit with instructions if it is not set."""
+    api_key = os.environ.get("ANTHROPIC_API_KEY")
+    if not api_key:
+        print("Error: ANTHROPIC_API_KEY environment variable is not set.", file=sys.stderr)
+        print("Set it with: export ANTHROPIC_API_KEY='your-key-here'", file=sys.stderr)
+        print("Alternatively, use --parse-only to just extract text/tables and let Claude Code handle analysis.", file=sys.stderr)
+        sys.exit(1)
+    return api_key
+
+
+def _run_batch(args: argparse.Namespace):
+    """Extract every document listed in --batch, writing one JSON line per document."""
+    if args.parse_only:
+        print("Error: --parse-only cannot be combined with --batch.", file=sys.stderr)
+        sys.exit(1)
+    try:
+        with open(args.batch, encoding="utf-8") as f:
+            paths = [line.strip() for line in f if line.strip()]
+    except OSError as e:
+        print(f"Error reading batch file: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    extractor = ScheduleExtractor(api_key=_require_api_key(), model=args.model)
+    if args.output:
+        output_path = Path(args.output)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        out = output_path.open("w", encoding="utf-8")
+    else:
+        out = sys.stdout
+
+    failed = 0
+    try:
+        for i, result in enumerate(extractor.extract_many(paths, stop_early=args.early_exit, cache_dir=_cache_dir(args)), 1):
+            if "error" in result:
+                failed += 1
+                print(f"  [{i}/{len(paths)}] {result['document']}: failed ({result['error']})", file=sys.stderr)
+            else:
+                event_count = len(result.get("schedule_events", []))
+                print(f"  [{i}/{len(paths)}] {result['document']}: {event_count} schedule events", file=sys.stderr)
+            out.write(format_json(result, indent=False) + "\n")
+            out.flush()
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    if args.output:
+        print(f"Output saved to: {args.output}", file=sys.stderr)
+    if failed:
+        sys.exit(1)
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Extract procurement schedule from RFP/RFI documents (PDF or DOCX)",
@@ -391,9 +760,17 @@ Examples:
     python3 extract_schedule.py --input rfp.pdf
     python3 extract_schedule.py --input rfp.pdf --output schedule.json --format json
     python3 extract_schedule.py --input proposal.docx --format csv --output schedule.csv
+    python3 extract_schedule.py --batch rfps.txt --output schedules.jsonl
         """,
     )
-    parser.add_argument("--input", required=True, help="Path to PDF or DOCX document")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--input", help="Path to PDF or DOCX document")
+    source.add_argument(
+        "--batch",
+        metavar="FILE",
+        help="File listing one document path per line; each is extracted in turn over one "
+             "API client and written as a JSON line (JSONL) to --output or stdout",
+    )
     parser.add_argument("--output", help="Output file path (optional, prints to stdout if omitted)")
     parser.add_argument(
         "--format",
@@ -408,6 +785,17 @@ Examples:
         help="Only parse the document and output text + tables as JSON (no AI extraction). "
              "Use this when Claude Code will handle the AI extraction directly.",
     )
+    parser.add_argument(
+        "--early-exit",
+        action="store_true",
+        help="Stop parsing a PDF once enough text after the schedule section has been read "
+             "(faster on long documents; tables on later pages are skipped).",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Always re-parse the document instead of reusing a cached result from {PARSE_CACHE_DIR}",
+    )
     parser.add_argument("--verbose", action="store_true", help="Enable verbose logging")
     args = parser.parse_args()
 
@@ -418,15 +806,21 @@ Examples:
         format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
     )
 
+    if args.batch:
+        _run_batch(args)
+        return
+
     # Step 1: Parse document
     print(f"Parsing document: {args.input}", file=sys.stderr)
     try:
-        parsed = DocumentParser.parse(args.input)
+        parsed = DocumentParser.parse(args.input, stop_early=args.early_exit, cache_dir=_cache_dir(args))
     except Exception as e:
         print(f"Error parsing document: {e}", file=sys.stderr)
         sys.exit(1)
 
     page_info = f" ({parsed['page_count']} pages)" if parsed.get("page_count") else ""
+    if parsed.get("partial"):
+        page_info = f" (stopped after page {parsed['pages_parsed']} of {parsed['page_count']})"
     table_info = f", {len(parsed['tables'])} tables" if parsed.get("tables") else ""
     print(f"  Parsed: {len(parsed['text'])} chars{page_info}{table_info}", file=sys.stderr)
 
@@ -438,6 +832,9 @@ Examples:
             "page_count": parsed.get("page_count", 0),
             "table_count": len(parsed.get("tables", [])),
         }
+        if parsed.get("partial"):
+            output["pages_parsed"] = parsed["pages_parsed"]
+            output["parse_partial"] = True
 
         # Format tables as readable text
         tables = parsed.get("tables", [])
@@ -458,16 +855,11 @@ Examples:
             output["document_text"] = text
             output["text_truncated"] = False
 
-        print(json.dumps(output, indent=2, ensure_ascii=False))
+        print(format_json(output))
         return
 
     # Full extraction mode: requires API key
-    api_key = os.environ.get("ANTHROPIC_API_KEY")
-    if not api_key:
-        print("Error: ANTHROPIC_API_KEY environment variable is not set.", file=sys.stderr)
-        print("Set it with: export ANTHROPIC_API_KEY='your-key-here'", file=sys.stderr)
-        print("Alternatively, use --parse-only to just extract text/tables and let Claude Code handle analysis.", file=sys.stderr)
-        sys.exit(1)
+    api_key = _require_api_key()
 
     # Step 2: Extract schedule via Claude
     print("Extracting schedule using Claude AI...", file=sys.stderr)
@@ -486,7 +878,7 @@ Examples:
 
     # Step 3: Format output
     if args.format == "json":
-        formatted = json.dumps(result, indent=2, ensure_ascii=False)
+        formatted = format_json(result)
     elif args.format == "csv":
         formatted = format_csv(result)
     else:  # markdown
@@ -494,9 +886,9 @@ Examples:
 
     # Step 4: Output
     if args.output:
-        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
-        with open(args.output, "w", encoding="utf-8") as f:
-            f.write(formatted)
+        output_path = Path(args.output)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_text(formatted, encoding="utf-8")
         print(f"Output saved to: {args.output}", file=sys.stderr)
     else:
         print(formatted)
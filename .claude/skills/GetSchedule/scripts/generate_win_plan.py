@@ -10,20 +10,32 @@ Usage:
 """
 
 import argparse
+import contextlib
+import functools
+import io
 import json
 import logging
 import os
 import sys
+from copy import deepcopy
 from datetime import datetime
-from typing import Any
+from typing import Any, Optional
+
+try:
+    import orjson
+except ImportError:  # optional; stdlib json is used instead
+    orjson = None
 
 from docx import Document
-from docx.shared import Inches, Pt, RGBColor, Cm, Emu
+from docx.shared import Inches, Pt, RGBColor, Cm, Emu, Length
+from docx.text.run import Run
+from docx.enum.style import WD_STYLE_TYPE
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.enum.table import WD_TABLE_ALIGNMENT
 from docx.enum.section import WD_ORIENT
 from docx.oxml.ns import qn, nsdecls
 from docx.oxml import parse_xml
+from docx.opc import phys_pkg
 
 logger = logging.getLogger(__name__)
 
@@ -33,16 +45,137 @@ TABLE_HEADER_BG = "D9D9D9"   # Light gray
 DEADLINE_HIGHLIGHT = "FFF3CD" # Light yellow for deadlines
 WHITE = "FFFFFF"
 LIGHT_BLUE_BG = "EBF0F5"     # Very light blue for alternating rows
+GREY_TEXT = RGBColor(0x99, 0x99, 0x99)  # Placeholder and footer text
+HEADING_TEXT = RGBColor(0x31, 0x46, 0x62)  # HEADING_BAR_COLOR, for titles
+WHITE_TEXT = RGBColor(0xFF, 0xFF, 0xFF)
+BODY_TEXT_SIZE = Pt(10)
+
+# Table column widths (shared tuples also keep _text_row_template's cache keys cheap)
+OVERVIEW_COL_WIDTHS = (Cm(5), Cm(12))
+SCHEDULE_COL_WIDTHS = (Cm(1), Cm(5.5), Cm(3), Cm(2), Cm(1.5), Cm(4))
+DEADLINE_COL_WIDTHS = (Cm(2.5), Cm(5.5), Cm(3), Cm(6))
+TEAM_COL_WIDTHS = (Cm(5), Cm(4), Cm(8))
+ACTION_COL_WIDTHS = (Cm(1), Cm(6.5), Cm(3.5), Cm(3), Cm(3))
+HEADING_BAR_WIDTH = Cm(17)
+
+# Height one empty Normal paragraph takes up: an 11pt Calibri line plus 6pt after
+BLANK_LINE_HEIGHT_PT = 19.4
+
+# Deadline priority based on event type (anything else is MEDIUM)
+PRIORITY_MAP = {
+    "submission_deadline": "CRITICAL",
+    "intention_to_respond": "HIGH",
+    "clarification_deadline": "HIGH",
+    "poc_end": "HIGH",
+    "shortlist_notification": "MEDIUM",
+    "selection_decision": "MEDIUM",
+    "contracting": "MEDIUM",
+    "implementation_start": "LOW",
+}
+PRIORITY_COLORS = {
+    "CRITICAL": RGBColor(0xDC, 0x35, 0x45),  # Red
+    "HIGH": RGBColor(0xFD, 0x7E, 0x14),      # Orange
+    "MEDIUM": RGBColor(0xFF, 0xC1, 0x07),    # Amber
+    "LOW": None,
+}
+
+# Paragraph styles for table text, defined once in _setup_styles
+TABLE_TEXT_STYLE = "TableSmall"      # 9pt Calibri body cells
+TABLE_HEADER_STYLE = "TableHeader"   # 10pt bold Calibri header cells
+
+# zlib level for the saved .docx: ~1.4x the default size, where ZIP_STORED would be ~30x
+DOCX_COMPRESSLEVEL = 1
+
+
+# Borderless table setting for heading bars (deep-copied into each table)
+_NO_BORDERS = parse_xml(
+    f'<w:tblBorders {nsdecls("w")}>'
+    '  <w:top w:val="none" w:sz="0" w:space="0" w:color="auto"/>'
+    '  <w:left w:val="none" w:sz="0" w:space="0" w:color="auto"/>'
+    '  <w:bottom w:val="none" w:sz="0" w:space="0" w:color="auto"/>'
+    '  <w:right w:val="none" w:sz="0" w:space="0" w:color="auto"/>'
+    '  <w:insideH w:val="none" w:sz="0" w:space="0" w:color="auto"/>'
+    '  <w:insideV w:val="none" w:sz="0" w:space="0" w:color="auto"/>'
+    '</w:tblBorders>'
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _shading(color: str):
+    """Parsed <w:shd> template for a fill color; callers append a deepcopy."""
+    return parse_xml(f'<w:shd {nsdecls("w")} w:fill="{color}"/>')
 
 
 def set_cell_shading(cell, color: str):
     """Set background shading color on a table cell."""
-    shading = parse_xml(f'<w:shd {nsdecls("w")} w:fill="{color}"/>')
-    cell._tc.get_or_add_tcPr().append(shading)
+    cell._tc.get_or_add_tcPr().append(deepcopy(_shading(color)))
+
+
+@functools.lru_cache(maxsize=None)
+def _text_row_template(widths: tuple[Length, ...], fill: Optional[str]):
+    """Parsed <w:tr> of empty table-text cells (sized, optionally shaded); callers append a deepcopy.
+
+    Font and size come from the TableSmall paragraph style, so each cell is
+    just a styled paragraph holding one empty run for the text.
+    """
+    shd = f'<w:shd w:fill="{fill}"/>' if fill else ""
+    cells = "".join(
+        f'<w:tc><w:tcPr><w:tcW w:w="{width.twips}" w:type="dxa"/>{shd}</w:tcPr>'
+        f'<w:p><w:pPr><w:pStyle w:val="{TABLE_TEXT_STYLE}"/></w:pPr><w:r/></w:p></w:tc>'
+        for width in widths
+    )
+    return parse_xml(f'<w:tr {nsdecls("w")}>{cells}</w:tr>')
+
+
+def add_text_row(table, values: list[str], widths: tuple[Length, ...],
+                 fill: Optional[str] = None) -> list:
+    """Append a row of TableSmall text cells straight to the table XML.
+
+    Much cheaper than ``table.add_row()`` plus ``row.cells[j]`` lookups,
+    which rescan the whole table grid on every access. Returns the text
+    run element (CT_R) of each cell for any extra formatting.
+    """
+    tr = deepcopy(_text_row_template(widths, fill))
+    runs = tr.xpath("./w:tc/w:p/w:r")
+    for run, val in zip(runs, values):
+        if val:
+            run.text = val  # CT_R.text maps tabs/newlines like Run.add_text
+    table._tbl.append(tr)
+    return runs
+
+
+def set_column_widths(table, widths: tuple[Length, ...]):
+    """Size the table grid and the cells of the rows it already has (the header).
+
+    Rows added later with add_text_row carry their widths from the template.
+    """
+    for grid_col, width in zip(table._tbl.tblGrid.gridCol_lst, widths):
+        grid_col.w = width
+    for row in table.rows:
+        for cell, width in zip(row.cells, widths):
+            cell.width = width
+
+
+# Heading bar <w:tbl> built by the first add_heading_bar call; later bars are
+# deep copies with the text swapped in
+_HEADING_BAR_TBL = None
 
 
 def add_heading_bar(doc: Document, text: str):
     """Add a dark blue heading bar with white text (matching CreateRFIResponse style)."""
+    global _HEADING_BAR_TBL
+    if _HEADING_BAR_TBL is None:
+        _HEADING_BAR_TBL = deepcopy(_build_heading_bar(doc, text))
+    else:
+        tbl = deepcopy(_HEADING_BAR_TBL)
+        tbl.xpath(".//w:r")[-1].text = text  # the formatted text run; keeps its rPr
+        doc.element.body._insert_tbl(tbl)
+
+    doc.add_paragraph("")  # spacer
+
+
+def _build_heading_bar(doc: Document, text: str):
+    """Build the heading bar table with python-docx and return its <w:tbl>."""
     # Add a single-cell table to simulate the heading bar
     table = doc.add_table(rows=1, cols=1)
     table.alignment = WD_TABLE_ALIGNMENT.CENTER
@@ -53,13 +186,13 @@ def add_heading_bar(doc: Document, text: str):
     set_cell_shading(cell, HEADING_BAR_COLOR)
 
     # Set cell width to full page
-    cell.width = Cm(17)
+    cell.width = HEADING_BAR_WIDTH
 
     # Add text with white formatting
     para = cell.paragraphs[0]
     para.alignment = WD_ALIGN_PARAGRAPH.LEFT
     run = para.add_run(text)
-    run.font.color.rgb = RGBColor(0xFF, 0xFF, 0xFF)
+    run.font.color.rgb = WHITE_TEXT
     run.font.size = Pt(14)
     run.font.name = "Calibri"
     run.bold = True
@@ -71,39 +204,93 @@ def add_heading_bar(doc: Document, text: str):
     # Remove table borders (keep only the fill)
     tbl = table._tbl
     tblPr = tbl.tblPr if tbl.tblPr is not None else parse_xml(f'<w:tblPr {nsdecls("w")}/>')
-    borders = parse_xml(
-        f'<w:tblBorders {nsdecls("w")}>'
-        '  <w:top w:val="none" w:sz="0" w:space="0" w:color="auto"/>'
-        '  <w:left w:val="none" w:sz="0" w:space="0" w:color="auto"/>'
-        '  <w:bottom w:val="none" w:sz="0" w:space="0" w:color="auto"/>'
-        '  <w:right w:val="none" w:sz="0" w:space="0" w:color="auto"/>'
-        '  <w:insideH w:val="none" w:sz="0" w:space="0" w:color="auto"/>'
-        '  <w:insideV w:val="none" w:sz="0" w:space="0" w:color="auto"/>'
-        '</w:tblBorders>'
-    )
-    tblPr.append(borders)
-
-    doc.add_paragraph("")  # spacer
+    tblPr.append(deepcopy(_NO_BORDERS))
+    return tbl
 
 
-def style_table_header_row(table, col_count: int):
-    """Style the first row of a table as a gray header."""
-    for i in range(col_count):
-        cell = table.rows[0].cells[i]
+def style_table_header_row(table, headers: list[str]):
+    """Fill the first row of a table with the headers, styled as a gray header."""
+    for cell, header in zip(table.rows[0].cells, headers):
+        cell.text = header
+        cell.paragraphs[0].style = TABLE_HEADER_STYLE
         set_cell_shading(cell, TABLE_HEADER_BG)
-        for para in cell.paragraphs:
-            for run in para.runs:
-                run.font.bold = True
-                run.font.size = Pt(10)
-                run.font.name = "Calibri"
+
+
+def add_blank_lines(doc: Document, count: int):
+    """Leave the space of `count` empty paragraphs using one paragraph's spacing."""
+    para = doc.add_paragraph()
+    para.paragraph_format.space_after = Pt(6 + BLANK_LINE_HEIGHT_PT * (count - 1))
+
+
+def get_events(data: dict) -> list[dict]:
+    """Schedule events from extractor output ("events", or the older "schedule_events")."""
+    if "events" in data:
+        return data["events"]
+    return data.get("schedule_events", [])
+
+
+def fill_text_cell(cell, text: str):
+    """Put text in a pre-built table cell using the TableSmall style."""
+    para = cell.paragraphs[0]
+    para.style = TABLE_TEXT_STYLE
+    return para.add_run(text)
+
+
+@contextlib.contextmanager
+def fast_docx_compression(level: int = DOCX_COMPRESSLEVEL):
+    """Make python-docx deflate at the given zlib level while saving.
+
+    Its zip writer always uses the default level (6), which dominates
+    the save of a large document.xml.
+    """
+    zip_file = phys_pkg.ZipFile
+    phys_pkg.ZipFile = functools.partial(zip_file, compresslevel=level)
+    try:
+        yield
+    finally:
+        phys_pkg.ZipFile = zip_file
+
+
+# Styled blank document, saved by the first generator and re-opened by later ones
+_BASE_DOC_BYTES: Optional[bytes] = None
+
+# <w:tbl> elements of the fully static tables, built by the first generator
+# and deep-copied into later documents
+_STATIC_TABLES: dict[str, Any] = {}
+
+RESPONSE_TEAM_ROLES = [
+    ("Bid Manager / Proposal Lead", "", "Overall response coordination, timeline management"),
+    ("Solution Architect", "", "Technical solution design, architecture documentation"),
+    ("Pre-Sales / Demo Lead", "", "Solution demonstrations, PoC execution"),
+    ("Subject Matter Expert (SME)", "", "Domain expertise, functional responses"),
+    ("Commercial / Pricing Lead", "", "Pricing model, TCO calculation, commercial terms"),
+    ("Legal", "", "Contract review, T&Cs, compliance checks"),
+    ("Executive Sponsor", "", "Strategic oversight, escalation point, executive summary"),
+]
+
+# Common actions pre-filled into the Action Items table
+DEFAULT_ACTION_ITEMS = [
+    ("1", "Confirm intention to respond", "", "", "Not Started"),
+    ("2", "Prepare demo / presentation", "", "", "Not Started"),
+    ("3", "Draft response document", "", "", "Not Started"),
+    ("4", "Review and finalise pricing", "", "", "Not Started"),
+    ("5", "Submit final response", "", "", "Not Started"),
+]
 
 
 class WinPlanGenerator:
     """Generates a professional RFP Win Plan DOCX document."""
 
     def __init__(self):
-        self.doc = Document()
-        self._setup_styles()
+        global _BASE_DOC_BYTES
+        if _BASE_DOC_BYTES is None:
+            self.doc = Document()
+            self._setup_styles()
+            buf = io.BytesIO()
+            self.doc.save(buf)
+            _BASE_DOC_BYTES = buf.getvalue()
+        else:
+            self.doc = Document(io.BytesIO(_BASE_DOC_BYTES))
 
     def _setup_styles(self):
         """Configure document styles."""
@@ -113,35 +300,54 @@ class WinPlanGenerator:
         style.font.size = Pt(11)
         style.paragraph_format.space_after = Pt(6)
 
+        # Table text: set the font once here instead of on every cell's runs
+        table_text = self.doc.styles.add_style(TABLE_TEXT_STYLE, WD_STYLE_TYPE.PARAGRAPH)
+        table_text.base_style = style
+        table_text.font.size = Pt(9)
+
+        table_header = self.doc.styles.add_style(TABLE_HEADER_STYLE, WD_STYLE_TYPE.PARAGRAPH)
+        table_header.base_style = style
+        table_header.font.size = Pt(10)
+        table_header.font.bold = True
+
+    def _add_static_table(self, key: str, build) -> None:
+        """Append a table whose content never varies, building it only on first use."""
+        tbl = _STATIC_TABLES.get(key)
+        if tbl is None:
+            _STATIC_TABLES[key] = deepcopy(build()._tbl)
+        else:
+            self.doc.element.body._insert_tbl(deepcopy(tbl))
+
     def generate(self, data: dict[str, Any], output_path: str) -> str:
         """Generate the complete Win Plan document."""
         os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
 
         self._add_cover(data)
         self._add_rfp_overview(data)
-        self._add_procurement_schedule(data)
-        self._add_key_deadlines(data)
+        events = get_events(data)
+        self._add_procurement_schedule(events)
+        self._add_key_deadlines(events)
         self._add_response_team()
         self._add_win_strategy(data)
         self._add_action_items()
         self._add_notes()
         self._add_footer(data)
 
-        self.doc.save(output_path)
+        with fast_docx_compression():
+            self.doc.save(output_path)
         return output_path
 
     def _add_cover(self, data: dict):
         """Section: Cover / Title page."""
         # Add some spacing
-        for _ in range(4):
-            self.doc.add_paragraph("")
+        add_blank_lines(self.doc, 4)
 
         # Title
         title = self.doc.add_paragraph()
         title.alignment = WD_ALIGN_PARAGRAPH.CENTER
         run = title.add_run("RFP WIN PLAN")
         run.font.size = Pt(32)
-        run.font.color.rgb = RGBColor(0x31, 0x46, 0x62)
+        run.font.color.rgb = HEADING_TEXT
         run.bold = True
         run.font.name = "Calibri"
 
@@ -152,7 +358,7 @@ class WinPlanGenerator:
         client.alignment = WD_ALIGN_PARAGRAPH.CENTER
         run = client.add_run(data.get("client_name", "Client"))
         run.font.size = Pt(20)
-        run.font.color.rgb = RGBColor(0x31, 0x46, 0x62)
+        run.font.color.rgb = HEADING_TEXT
         run.font.name = "Calibri"
 
         # RFP title
@@ -176,8 +382,8 @@ class WinPlanGenerator:
         version = self.doc.add_paragraph()
         version.alignment = WD_ALIGN_PARAGRAPH.CENTER
         run = version.add_run("Version 1.0 | CONFIDENTIAL")
-        run.font.size = Pt(10)
-        run.font.color.rgb = RGBColor(0x99, 0x99, 0x99)
+        run.font.size = BODY_TEXT_SIZE
+        run.font.color.rgb = GREY_TEXT
 
         self.doc.add_page_break()
 
@@ -205,20 +411,20 @@ class WinPlanGenerator:
             set_cell_shading(cell_label, LIGHT_BLUE_BG)
             run = cell_label.paragraphs[0].add_run(label)
             run.font.bold = True
-            run.font.size = Pt(10)
+            run.font.size = BODY_TEXT_SIZE
             run.font.name = "Calibri"
 
             # Value cell
             cell_value = table.rows[i].cells[1]
             cell_value.text = ""
             run = cell_value.paragraphs[0].add_run(value)
-            run.font.size = Pt(10)
+            run.font.size = BODY_TEXT_SIZE
             run.font.name = "Calibri"
 
         # Set column widths
         for row in table.rows:
-            row.cells[0].width = Cm(5)
-            row.cells[1].width = Cm(12)
+            for cell, width in zip(row.cells, OVERVIEW_COL_WIDTHS):
+                cell.width = width
 
         # Additional notes
         notes = data.get("additional_notes", "")
@@ -227,42 +433,33 @@ class WinPlanGenerator:
             p = self.doc.add_paragraph()
             run = p.add_run("Note: ")
             run.bold = True
-            run.font.size = Pt(10)
+            run.font.size = BODY_TEXT_SIZE
             run = p.add_run(notes)
-            run.font.size = Pt(10)
+            run.font.size = BODY_TEXT_SIZE
             run.italic = True
 
         self.doc.add_paragraph("")
 
-    def _add_procurement_schedule(self, data: dict):
+    def _add_procurement_schedule(self, events: list[dict]):
         """Section: Full Procurement Schedule table."""
         add_heading_bar(self.doc, "Procurement Schedule")
 
-        events = data.get("events", data.get("schedule_events", []))
         if not events:
             self.doc.add_paragraph("No schedule events extracted.")
             return
 
         # Create table
         headers = ["#", "Event", "Date", "Type", "Deadline?", "Notes"]
-        table = self.doc.add_table(rows=1 + len(events), cols=len(headers))
+        table = self.doc.add_table(rows=1, cols=len(headers))
         table.style = "Table Grid"
         table.alignment = WD_TABLE_ALIGNMENT.CENTER
 
-        # Header row
-        for j, header in enumerate(headers):
-            cell = table.rows[0].cells[j]
-            cell.text = ""
-            run = cell.paragraphs[0].add_run(header)
-            run.font.bold = True
-            run.font.size = Pt(9)
-            run.font.name = "Calibri"
-
-        style_table_header_row(table, len(headers))
+        style_table_header_row(table, headers)
+        col_widths = SCHEDULE_COL_WIDTHS
+        set_column_widths(table, col_widths)
 
         # Data rows
         for i, event in enumerate(events):
-            row = table.rows[i + 1]
             values = [
                 str(i + 1),
                 event.get("event_name", "—"),
@@ -271,31 +468,17 @@ class WinPlanGenerator:
                 "Yes" if event.get("is_deadline") else "No",
                 event.get("notes", ""),
             ]
-            for j, val in enumerate(values):
-                cell = row.cells[j]
-                cell.text = ""
-                run = cell.paragraphs[0].add_run(val)
-                run.font.size = Pt(9)
-                run.font.name = "Calibri"
-
             # Highlight deadline rows
-            if event.get("is_deadline"):
-                for j in range(len(headers)):
-                    set_cell_shading(row.cells[j], DEADLINE_HIGHLIGHT)
-
-        # Set column widths
-        col_widths = [Cm(1), Cm(5.5), Cm(3), Cm(2), Cm(1.5), Cm(4)]
-        for row in table.rows:
-            for j, width in enumerate(col_widths):
-                row.cells[j].width = width
+            add_text_row(
+                table, values, col_widths, DEADLINE_HIGHLIGHT if event.get("is_deadline") else None
+            )
 
         self.doc.add_paragraph("")
 
-    def _add_key_deadlines(self, data: dict):
+    def _add_key_deadlines(self, events: list[dict]):
         """Section: Key Deadlines Summary — filtered to deadlines only."""
         add_heading_bar(self.doc, "Key Deadlines Summary")
 
-        events = data.get("events", data.get("schedule_events", []))
         deadlines = [e for e in events if e.get("is_deadline")]
 
         if not deadlines:
@@ -304,43 +487,25 @@ class WinPlanGenerator:
 
         p = self.doc.add_paragraph()
         run = p.add_run(f"{len(deadlines)} key deadlines identified. ")
-        run.font.size = Pt(10)
+        run.font.size = BODY_TEXT_SIZE
         run = p.add_run("Ensure the response team is aware of these critical dates.")
-        run.font.size = Pt(10)
+        run.font.size = BODY_TEXT_SIZE
         run.italic = True
 
         self.doc.add_paragraph("")
 
         # Deadlines table (simplified)
-        table = self.doc.add_table(rows=1 + len(deadlines), cols=4)
+        table = self.doc.add_table(rows=1, cols=4)
         table.style = "Table Grid"
         table.alignment = WD_TABLE_ALIGNMENT.CENTER
 
         headers = ["Priority", "Deadline", "Date", "Action Required"]
-        for j, header in enumerate(headers):
-            cell = table.rows[0].cells[j]
-            cell.text = ""
-            run = cell.paragraphs[0].add_run(header)
-            run.font.bold = True
-            run.font.size = Pt(10)
-            run.font.name = "Calibri"
+        style_table_header_row(table, headers)
+        col_widths = DEADLINE_COL_WIDTHS
+        set_column_widths(table, col_widths)
 
-        style_table_header_row(table, 4)
-
-        for i, event in enumerate(deadlines):
-            row = table.rows[i + 1]
-            # Priority based on event type
-            priority_map = {
-                "submission_deadline": "CRITICAL",
-                "intention_to_respond": "HIGH",
-                "clarification_deadline": "HIGH",
-                "poc_end": "HIGH",
-                "shortlist_notification": "MEDIUM",
-                "selection_decision": "MEDIUM",
-                "contracting": "MEDIUM",
-                "implementation_start": "LOW",
-            }
-            priority = priority_map.get(event.get("event_type", ""), "MEDIUM")
+        for event in deadlines:
+            priority = PRIORITY_MAP.get(event.get("event_type", ""), "MEDIUM")
 
             values = [
                 priority,
@@ -349,27 +514,14 @@ class WinPlanGenerator:
                 event.get("notes", "Review and prepare"),
             ]
 
-            for j, val in enumerate(values):
-                cell = row.cells[j]
-                cell.text = ""
-                run = cell.paragraphs[0].add_run(val)
-                run.font.size = Pt(9)
-                run.font.name = "Calibri"
-
-                # Color-code priority
-                if j == 0:
-                    run.font.bold = True
-                    if val == "CRITICAL":
-                        run.font.color.rgb = RGBColor(0xDC, 0x35, 0x45)  # Red
-                    elif val == "HIGH":
-                        run.font.color.rgb = RGBColor(0xFD, 0x7E, 0x14)  # Orange
-                    elif val == "MEDIUM":
-                        run.font.color.rgb = RGBColor(0xFF, 0xC1, 0x07)  # Amber
-
-        col_widths = [Cm(2.5), Cm(5.5), Cm(3), Cm(6)]
-        for row in table.rows:
-            for j, width in enumerate(col_widths):
-                row.cells[j].width = width
+            runs = add_text_row(table, values, col_widths)
+
+            # Color-code priority
+            font = Run(runs[0], table).font
+            font.bold = True
+            rgb = PRIORITY_COLORS[priority]
+            if rgb:
+                font.color.rgb = rgb
 
         self.doc.add_paragraph("")
 
@@ -379,57 +531,39 @@ class WinPlanGenerator:
 
         p = self.doc.add_paragraph()
         run = p.add_run("Assign team members to each role below. Update as the response progresses.")
-        run.font.size = Pt(10)
+        run.font.size = BODY_TEXT_SIZE
         run.italic = True
 
         self.doc.add_paragraph("")
 
-        roles = [
-            ("Bid Manager / Proposal Lead", "", "Overall response coordination, timeline management"),
-            ("Solution Architect", "", "Technical solution design, architecture documentation"),
-            ("Pre-Sales / Demo Lead", "", "Solution demonstrations, PoC execution"),
-            ("Subject Matter Expert (SME)", "", "Domain expertise, functional responses"),
-            ("Commercial / Pricing Lead", "", "Pricing model, TCO calculation, commercial terms"),
-            ("Legal", "", "Contract review, T&Cs, compliance checks"),
-            ("Executive Sponsor", "", "Strategic oversight, escalation point, executive summary"),
-        ]
+        self._add_static_table("response_team", self._build_response_team_table)
+        self.doc.add_paragraph("")
 
+    def _build_response_team_table(self):
+        """Build the Response Team roles table with python-docx."""
+        roles = RESPONSE_TEAM_ROLES
         table = self.doc.add_table(rows=1 + len(roles), cols=3)
         table.style = "Table Grid"
         table.alignment = WD_TABLE_ALIGNMENT.CENTER
 
         headers = ["Role", "Name", "Responsibility"]
-        for j, header in enumerate(headers):
-            cell = table.rows[0].cells[j]
-            cell.text = ""
-            run = cell.paragraphs[0].add_run(header)
-            run.font.bold = True
-            run.font.size = Pt(10)
-            run.font.name = "Calibri"
-
-        style_table_header_row(table, 3)
+        style_table_header_row(table, headers)
 
         for i, (role, name, resp) in enumerate(roles):
             row = table.rows[i + 1]
             for j, val in enumerate([role, name, resp]):
-                cell = row.cells[j]
-                cell.text = ""
-                run = cell.paragraphs[0].add_run(val)
-                run.font.size = Pt(9)
-                run.font.name = "Calibri"
+                run = fill_text_cell(row.cells[j], val)
                 if j == 1 and not val:
                     # Placeholder for name
-                    run = cell.paragraphs[0].add_run("[To be assigned]")
-                    run.font.size = Pt(9)
-                    run.font.color.rgb = RGBColor(0x99, 0x99, 0x99)
+                    run.text = "[To be assigned]"
+                    run.font.color.rgb = GREY_TEXT
                     run.italic = True
 
-        col_widths = [Cm(5), Cm(4), Cm(8)]
+        col_widths = TEAM_COL_WIDTHS
         for row in table.rows:
             for j, width in enumerate(col_widths):
                 row.cells[j].width = width
-
-        self.doc.add_paragraph("")
+        return table
 
     def _add_win_strategy(self, data: dict):
         """Section: Win Strategy — pre-filled with solution data when available."""
@@ -450,7 +584,7 @@ class WinPlanGenerator:
 
             p = self.doc.add_paragraph()
             run = p.add_run(solution_overview)
-            run.font.size = Pt(10)
+            run.font.size = BODY_TEXT_SIZE
             run.font.name = "Calibri"
             self.doc.add_paragraph("")
 
@@ -489,7 +623,7 @@ class WinPlanGenerator:
             run = p.add_run(title)
             run.bold = True
             run.font.size = Pt(11)
-            run.font.color.rgb = RGBColor(0x31, 0x46, 0x62)
+            run.font.color.rgb = HEADING_TEXT
 
             items = data.get(data_key, []) if data_key else []
             if items and isinstance(items, list):
@@ -497,15 +631,15 @@ class WinPlanGenerator:
                 for item in items:
                     bp = self.doc.add_paragraph(style="List Bullet")
                     run = bp.add_run(str(item))
-                    run.font.size = Pt(10)
+                    run.font.size = BODY_TEXT_SIZE
                     run.font.name = "Calibri"
             else:
                 # Fallback: show placeholder prompt
                 p = self.doc.add_paragraph()
                 run = p.add_run(fallback_prompt)
-                run.font.size = Pt(10)
+                run.font.size = BODY_TEXT_SIZE
                 run.italic = True
-                run.font.color.rgb = RGBColor(0x99, 0x99, 0x99)
+                run.font.color.rgb = GREY_TEXT
 
             self.doc.add_paragraph("")
 
@@ -517,50 +651,34 @@ class WinPlanGenerator:
 
         p = self.doc.add_paragraph()
         run = p.add_run("Track all actions required to complete the RFP response.")
-        run.font.size = Pt(10)
+        run.font.size = BODY_TEXT_SIZE
         run.italic = True
 
         self.doc.add_paragraph("")
 
-        table = self.doc.add_table(rows=6, cols=5)
+        self._add_static_table("action_items", self._build_action_items_table)
+        self.doc.add_paragraph("")
+
+    def _build_action_items_table(self):
+        """Build the Action Items table, pre-filled with common actions, with python-docx."""
+        actions = DEFAULT_ACTION_ITEMS
+        table = self.doc.add_table(rows=1 + len(actions), cols=5)
         table.style = "Table Grid"
         table.alignment = WD_TABLE_ALIGNMENT.CENTER
 
         headers = ["#", "Action", "Owner", "Due Date", "Status"]
-        for j, header in enumerate(headers):
-            cell = table.rows[0].cells[j]
-            cell.text = ""
-            run = cell.paragraphs[0].add_run(header)
-            run.font.bold = True
-            run.font.size = Pt(10)
-            run.font.name = "Calibri"
-
-        style_table_header_row(table, 5)
-
-        # Pre-fill with common actions
-        actions = [
-            ("1", "Confirm intention to respond", "", "", "Not Started"),
-            ("2", "Prepare demo / presentation", "", "", "Not Started"),
-            ("3", "Draft response document", "", "", "Not Started"),
-            ("4", "Review and finalise pricing", "", "", "Not Started"),
-            ("5", "Submit final response", "", "", "Not Started"),
-        ]
+        style_table_header_row(table, headers)
 
         for i, (num, action, owner, due, status) in enumerate(actions):
             row = table.rows[i + 1]
             for j, val in enumerate([num, action, owner, due, status]):
-                cell = row.cells[j]
-                cell.text = ""
-                run = cell.paragraphs[0].add_run(val)
-                run.font.size = Pt(9)
-                run.font.name = "Calibri"
+                fill_text_cell(row.cells[j], val)
 
-        col_widths = [Cm(1), Cm(6.5), Cm(3.5), Cm(3), Cm(3)]
+        col_widths = ACTION_COL_WIDTHS
         for row in table.rows:
             for j, width in enumerate(col_widths):
                 row.cells[j].width = width
-
-        self.doc.add_paragraph("")
+        return table
 
     def _add_notes(self):
         """Section: Notes (empty)."""
@@ -568,13 +686,12 @@ class WinPlanGenerator:
 
         p = self.doc.add_paragraph()
         run = p.add_run("[Add any additional notes, observations, or meeting minutes here]")
-        run.font.size = Pt(10)
+        run.font.size = BODY_TEXT_SIZE
         run.italic = True
-        run.font.color.rgb = RGBColor(0x99, 0x99, 0x99)
+        run.font.color.rgb = GREY_TEXT
 
         # Add some space for notes
-        for _ in range(5):
-            self.doc.add_paragraph("")
+        add_blank_lines(self.doc, 5)
 
     def _add_footer(self, data: dict):
         """Add document footer."""
@@ -587,7 +704,7 @@ class WinPlanGenerator:
             f"{datetime.now().strftime('%Y-%m-%d')}"
         )
         run.font.size = Pt(8)
-        run.font.color.rgb = RGBColor(0x99, 0x99, 0x99)
+        run.font.color.rgb = GREY_TEXT
 
 
 # ---------------------------------------------------------------------------
@@ -608,8 +725,9 @@ def main():
 
     # Load data
     try:
-        with open(args.input, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(args.input, "rb") as f:
+            raw = f.read()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
     except FileNotFoundError:
         print(f"Error: Input file not found: {args.input}", file=sys.stderr)
         sys.exit(1)
@@ -622,8 +740,9 @@ def main():
     generator = WinPlanGenerator()
     output_path = generator.generate(data, args.output)
 
-    event_count = len(data.get("events", data.get("schedule_events", [])))
-    deadline_count = len([e for e in data.get("events", data.get("schedule_events", [])) if e.get("is_deadline")])
+    events = get_events(data)
+    event_count = len(events)
+    deadline_count = sum(1 for e in events if e.get("is_deadline"))
     print(f"  Win Plan generated successfully!")
     print(f"  Events: {event_count} ({deadline_count} deadlines)")
     print(f"  Output: {output_path}")
@@ -19,12 +19,14 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
-    op.add_column("projects", sa.Column("processing_status", sa.String(50), nullable=True))
-    op.add_column("projects", sa.Column("processing_message", sa.Text(), nullable=True))
-    op.add_column("projects", sa.Column("processing_started_at", sa.DateTime(timezone=True), nullable=True))
+    with op.batch_alter_table("projects", recreate="auto") as batch_op:
+        batch_op.add_column(sa.Column("processing_status", sa.String(50), nullable=True))
+        batch_op.add_column(sa.Column("processing_message", sa.Text(), nullable=True))
+        batch_op.add_column(sa.Column("processing_started_at", sa.DateTime(timezone=True), nullable=True))
 
 
 def downgrade() -> None:
-    op.drop_column("projects", "processing_started_at")
-    op.drop_column("projects", "processing_message")
-    op.drop_column("projects", "processing_status")
+    with op.batch_alter_table("projects", recreate="auto") as batch_op:
+        batch_op.drop_column("processing_started_at")
+        batch_op.drop_column("processing_message")
+        batch_op.drop_column("processing_status")
@@ -0,0 +1,50 @@
+"""Lower-case stored user emails
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-16
+
+"""
+import logging
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "004"
+down_revision: Union[str, None] = "003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+logger = logging.getLogger(f"alembic.{__name__}")
+
+# Another row already has, or would end up with, the same lower-cased email
+_COLLIDES = "EXISTS (SELECT 1 FROM users AS o WHERE o.id <> u.id AND lower(o.email) = lower(u.email))"
+
+
+def upgrade() -> None:
+    # Register and login now lower-case emails before querying. Rows whose
+    # lower-cased email collides with another account are left alone rather
+    # than failing the unique index, and reported so they can be merged or
+    # renamed by hand; those users can't log in until then.
+    collisions = op.get_bind().execute(
+        sa.text(f"SELECT u.email FROM users AS u WHERE u.email <> lower(u.email) AND {_COLLIDES} ORDER BY u.email")
+    ).scalars().all()
+    for email in collisions:
+        logger.warning(f"Not lower-casing user email {email!r}: another account has the same email in a different case")
+
+    op.execute(
+        f"""
+        UPDATE users AS u
+        SET email = lower(u.email)
+        WHERE u.email <> lower(u.email)
+          AND NOT {_COLLIDES}
+        """
+    )
+
+
+def downgrade() -> None:
+    # The original casing is not recorded, so there is nothing to restore
+    pass
@@ -1,40 +1,82 @@
+import asyncio
+import hashlib
+import math
+import time
 import uuid
 from datetime import datetime, timedelta, timezone
+from typing import Annotated
 
 import bcrypt
+import jwt
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+from cachetools import TTLCache
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from jose import JWTError, jwt
-from pydantic import BaseModel, EmailStr
-from sqlalchemy import select
+from pydantic import AfterValidator, BaseModel, EmailStr
+from sqlalchemy import select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from jwt.exceptions import PyJWTError as JWTError
 
 from app.config import get_settings
 from app.database import get_db
 from app.models.user import User
 
+settings = get_settings()
 router = APIRouter(prefix="/api/auth", tags=["auth"])
 security = HTTPBearer()
 
+# JWT settings resolved once per worker for the per-request token paths
+_jwt_secret = settings.jwt_secret
+_jwt_algorithm = settings.jwt_algorithm
+_jwt_algorithms = [settings.jwt_algorithm]
+_token_lifetime = timedelta(minutes=settings.jwt_expiry_minutes)
+
+# Verified token -> (user id, token expiry); a hit skips JWT signature checking
+_token_cache: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+
+
+_password_hasher = PasswordHasher(time_cost=2, memory_cost=65536, parallelism=2)
+
+
+def _is_bcrypt_hash(hashed: str) -> bool:
+    return hashed.startswith(("$2a$", "$2b$", "$2y$"))
+
 
 def hash_password(password: str) -> str:
-    return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+    return _password_hasher.hash(password)
 
 
 def verify_password(password: str, hashed: str) -> bool:
-    return bcrypt.checkpw(password.encode("utf-8"), hashed.encode("utf-8"))
+    # Accounts created before the switch to Argon2 still carry bcrypt hashes
+    if _is_bcrypt_hash(hashed):
+        return bcrypt.checkpw(password.encode("utf-8"), hashed.encode("utf-8"))
+    try:
+        return _password_hasher.verify(hashed, password)
+    except (VerificationError, InvalidHashError):
+        return False
+
+
+def password_needs_rehash(hashed: str) -> bool:
+    """True for legacy bcrypt hashes and Argon2 hashes with outdated parameters."""
+    return _is_bcrypt_hash(hashed) or _password_hasher.check_needs_rehash(hashed)
+
+
+# Validated before any DB work; stored lower-cased so the users.email index matches any casing
+NormalizedEmail = Annotated[EmailStr, AfterValidator(str.lower)]
 
 
 class RegisterRequest(BaseModel):
-    email: str
+    email: NormalizedEmail
     name: str
     password: str
     role: str = "viewer"
 
 
 class LoginRequest(BaseModel):
-    email: str
+    email: NormalizedEmail
     password: str
 
 
@@ -59,28 +101,39 @@ class UserResponse(BaseModel):
 
 
 def _create_token(user_id: str, email: str) -> str:
-    settings = get_settings()
-    expire = datetime.now(timezone.utc) + timedelta(minutes=settings.jwt_expiry_minutes)
+    expire = datetime.now(timezone.utc) + _token_lifetime
     payload = {"sub": user_id, "email": email, "exp": expire}
-    return jwt.encode(payload, settings.jwt_secret, algorithm=settings.jwt_algorithm)
+    return jwt.encode(payload, _jwt_secret, algorithm=_jwt_algorithm)
+
+
+def _decode_user_id(token: str) -> uuid.UUID:
+    """Return the token's user id, verifying the JWT only on a cache miss."""
+    key = hashlib.blake2b(token.encode("utf-8"), digest_size=16).digest()
+    cached = _token_cache.get(key)
+    if cached is not None:
+        user_id, expires_at = cached
+        if expires_at > time.time():
+            return user_id
+        _token_cache.pop(key, None)
+
+    try:
+        payload = jwt.decode(token, _jwt_secret, algorithms=_jwt_algorithms)
+        user_id = uuid.UUID(payload.get("sub") or "")
+    except (JWTError, ValueError):
+        raise HTTPException(status_code=401, detail="Invalid token")
+
+    _token_cache[key] = (user_id, payload.get("exp", math.inf))
+    return user_id
 
 
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: AsyncSession = Depends(get_db),
 ) -> User:
-    settings = get_settings()
-    try:
-        payload = jwt.decode(
-            credentials.credentials, settings.jwt_secret, algorithms=[settings.jwt_algorithm]
-        )
-        user_id = payload.get("sub")
-        if not user_id:
-            raise HTTPException(status_code=401, detail="Invalid token")
-    except JWTError:
-        raise HTTPException(status_code=401, detail="Invalid token")
+    user_id = _decode_user_id(credentials.credentials)
 
-    result = await db.execute(select(User).where(User.id == uuid.UUID(user_id)))
+    # The user row is still loaded per request so deactivation takes effect at once
+    result = await db.execute(select(User).where(User.id == user_id))
     user = result.scalar_one_or_none()
     if not user or not user.is_active:
         raise HTTPException(status_code=401, detail="User not found or inactive")
@@ -89,37 +142,56 @@ async def get_current_user(
 
 @router.post("/register", response_model=TokenResponse)
 async def register(request: RegisterRequest, db: AsyncSession = Depends(get_db)):
-    # Check if email exists
-    result = await db.execute(select(User).where(User.email == request.email))
-    if result.scalar_one_or_none():
+    hashed_password = await asyncio.to_thread(hash_password, request.password)
+
+    # Single round trip: the unique index on users.email turns a duplicate
+    # (including a concurrent registration) into an empty RETURNING
+    result = await db.execute(
+        pg_insert(User)
+        .values(
+            email=request.email,
+            name=request.name,
+            hashed_password=hashed_password,
+            role=request.role,
+        )
+        .on_conflict_do_nothing(index_elements=[User.email])
+        .returning(User.id)
+    )
+    user_id = result.scalar_one_or_none()
+    if user_id is None:
         raise HTTPException(status_code=400, detail="Email already registered")
 
-    user = User(
+    token = _create_token(str(user_id), request.email)
+    return TokenResponse(
+        access_token=token,
+        user_id=str(user_id),
         email=request.email,
         name=request.name,
-        hashed_password=hash_password(request.password),
         role=request.role,
     )
-    db.add(user)
-    await db.flush()
-
-    token = _create_token(str(user.id), user.email)
-    return TokenResponse(
-        access_token=token,
-        user_id=str(user.id),
-        email=user.email,
-        name=user.name,
-        role=user.role,
-    )
 
 
 @router.post("/login", response_model=TokenResponse)
 async def login(request: LoginRequest, db: AsyncSession = Depends(get_db)):
-    result = await db.execute(select(User).where(User.email == request.email))
-    user = result.scalar_one_or_none()
-    if not user or not verify_password(request.password, user.hashed_password):
+    # Only the columns login needs; a full User also selectin-loads its projects
+    result = await db.execute(
+        select(
+            User.id, User.email, User.name, User.role, User.hashed_password, User.is_active
+        ).where(User.email == request.email)
+    )
+    user = result.one_or_none()
+    if not user or not user.is_active or not await asyncio.to_thread(
+        verify_password, request.password, user.hashed_password
+    ):
         raise HTTPException(status_code=401, detail="Invalid email or password")
 
+    # Upgrade the stored hash while the plaintext is at hand
+    if password_needs_rehash(user.hashed_password):
+        new_hash = await asyncio.to_thread(hash_password, request.password)
+        await db.execute(
+            update(User).where(User.id == user.id).values(hashed_password=new_hash)
+        )
+
     token = _create_token(str(user.id), user.email)
     return TokenResponse(
         access_token=token,
@@ -1,10 +1,14 @@
+import asyncio
 import logging
+import os
 import uuid
+from datetime import datetime, timedelta, timezone
 
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
-from fastapi.responses import Response as FastAPIResponse
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, UploadFile, File
+from fastapi.responses import StreamingResponse
+from sqlalchemy import func, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer, lazyload
 
 from app.database import get_db
 from app.models.project import Project
@@ -15,11 +19,25 @@ from app.schemas.document import DocumentResponse, DocumentListResponse, Documen
 from app.documents.parsers.factory import get_parser_factory
 from app.shared.storage import get_storage_client
 from app.config import get_settings
+from app.tasks.parse_task import parse_document_task
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api", tags=["documents"])
 
+# Loader options for handlers that only need the document's own metadata: skip
+# the parsed text and the selectin-loaded requirements
+_METADATA_ONLY = (defer(Document.parsed_text), lazyload(Document.requirements))
+
+# Document file type to MIME type for downloads
+DOWNLOAD_CONTENT_TYPES = {
+    "pdf": "application/pdf",
+    "docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    "csv": "text/csv",
+    "pptx": "application/vnd.openxmlformats-officedocument.presentationml.presentation",
+}
+
 
 @router.post("/projects/{project_id}/documents", response_model=list[DocumentResponse], status_code=201)
 async def upload_documents(
@@ -37,8 +55,9 @@ async def upload_documents(
     settings = get_settings()
     storage = get_storage_client()
     factory = get_parser_factory()
-    documents = []
 
+    # Validate every file before any of them is uploaded
+    uploads = []
     for file in files:
         # Validate file type
         file_type = factory.detect_file_type(file.filename)
@@ -48,28 +67,45 @@ async def upload_documents(
                 detail=f"Unsupported file type: {file.filename}. Supported: {factory.supported_formats()}",
             )
 
-        # Read file data
-        file_data = await file.read()
-
-        # Check file size
-        if len(file_data) > settings.max_upload_size_mb * 1024 * 1024:
+        # Check file size; the upload is already spooled to disk, so nothing is read yet
+        file_size = file.size if file.size is not None else file.file.seek(0, os.SEEK_END)
+        if file_size > settings.max_upload_size_mb * 1024 * 1024:
             raise HTTPException(
-                status_code=400,
+                status_code=413,
                 detail=f"File {file.filename} exceeds maximum size of {settings.max_upload_size_mb}MB",
             )
 
-        # Upload to storage
         object_name = f"projects/{project_id}/documents/{uuid.uuid4()}/{file.filename}"
-        content_type = factory.get_content_type(file.filename)
-        storage.upload_file(object_name, file_data, content_type)
+        uploads.append((file, file_type, file_size, object_name))
+
+    # Stream to storage in parts rather than reading whole files into memory,
+    # a bounded number of files at a time
+    semaphore = asyncio.Semaphore(settings.storage_upload_concurrency)
+
+    async def upload(file: UploadFile, file_size: int, object_name: str):
+        async with semaphore:
+            await file.seek(0)
+            await asyncio.to_thread(
+                storage.upload_fileobj,
+                object_name,
+                file.file,
+                file_size,
+                factory.get_content_type(file.filename),
+            )
 
+    await asyncio.gather(
+        *(upload(file, file_size, object_name) for file, _, file_size, object_name in uploads)
+    )
+
+    documents = []
+    for file, file_type, file_size, object_name in uploads:
         # Create document record
         doc = Document(
             project_id=project_id,
             filename=file.filename,
             file_path=object_name,
             file_type=file_type,
-            file_size_bytes=len(file_data),
+            file_size_bytes=file_size,
             status="uploaded",
             uploaded_by=current_user.id,
         )
@@ -78,102 +114,105 @@ async def upload_documents(
 
     await db.flush()
 
-    return [
-        DocumentResponse(
-            id=doc.id,
-            project_id=doc.project_id,
-            filename=doc.filename,
-            file_type=doc.file_type,
-            file_size_bytes=doc.file_size_bytes,
-            doc_category=doc.doc_category,
-            page_count=doc.page_count,
-            status=doc.status,
-            error_message=doc.error_message,
-            created_at=doc.created_at,
-        )
-        for doc in documents
-    ]
+    return [DocumentResponse.model_validate(doc) for doc in documents]
 
 
 @router.get("/projects/{project_id}/documents", response_model=DocumentListResponse)
 async def list_documents(
     project_id: uuid.UUID,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=200),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    result = await db.execute(
-        select(Document).where(Document.project_id == project_id).order_by(Document.created_at.desc())
+    # Documents uploaded together share created_at; the id tiebreak keeps pages stable
+    query = (
+        select(Document)
+        .where(Document.project_id == project_id)
+        .options(*_METADATA_ONLY)
+        .order_by(Document.created_at.desc(), Document.id)
+        .offset(skip)
+        .limit(limit)
     )
+    result = await db.execute(query)
     documents = result.scalars().all()
 
+    count_result = await db.execute(
+        select(func.count(Document.id)).where(Document.project_id == project_id)
+    )
+    total = count_result.scalar() or 0
+
     return DocumentListResponse(
-        documents=[
-            DocumentResponse(
-                id=doc.id,
-                project_id=doc.project_id,
-                filename=doc.filename,
-                file_type=doc.file_type,
-                file_size_bytes=doc.file_size_bytes,
-                doc_category=doc.doc_category,
-                page_count=doc.page_count,
-                status=doc.status,
-                error_message=doc.error_message,
-                created_at=doc.created_at,
-            )
-            for doc in documents
-        ],
-        total=len(documents),
+        documents=[DocumentResponse.model_validate(doc) for doc in documents],
+        total=total,
     )
 
 
-@router.post("/documents/{document_id}/parse", response_model=DocumentParseStatus)
+@router.post("/documents/{document_id}/parse", response_model=DocumentParseStatus, status_code=202)
 async def parse_document(
     document_id: uuid.UUID,
+    response: Response,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    """Trigger document parsing (synchronous for MVP, async via Celery in production)."""
-    result = await db.execute(select(Document).where(Document.id == document_id))
-    doc = result.scalar_one_or_none()
-    if not doc:
-        raise HTTPException(status_code=404, detail="Document not found")
-
-    try:
-        doc.status = "parsing"
-        await db.flush()
-
-        # Download file from storage
-        storage = get_storage_client()
-        file_data = storage.download_file(doc.file_path)
-
-        # Parse the document
-        factory = get_parser_factory()
-        parsed = factory.parse(file_data, doc.filename)
-
-        # Classify the document
-        from app.documents.classifier import classify_document
-
-        category = classify_document(parsed.text, doc.filename, bool(parsed.tables))
+    """Queue document parsing on a Celery worker; poll /documents/{id}/status for the result.
+
+    Returns 202 once parsing is queued, 200 with the stored result if the
+    document is already parsed, 409 if it is still being parsed, and 503 if
+    the task could not be queued.
+    """
+    # A parse still "parsing" past the task time limit was lost with its worker
+    # (killed, out of memory, redeployed) and would otherwise never finish
+    settings = get_settings()
+    stale_cutoff = datetime.now(timezone.utc) - timedelta(minutes=settings.parse_stale_after_minutes)
 
-        # Update document record
-        doc.parsed_text = parsed.text
-        doc.page_count = parsed.page_count
-        doc.doc_category = category
-        doc.status = "parsed"
-        await db.flush()
+    # Claim the document for parsing and read back its status in one statement.
+    # Stored files are never modified in place, so a parsed document stays
+    # parsed, and one already being parsed must not be queued twice. The claim
+    # bumps updated_at, which marks when parsing started
+    result = await db.execute(
+        update(Document)
+        .where(
+            Document.id == document_id,
+            Document.status != "parsed",
+            or_(Document.status != "parsing", Document.updated_at < stale_cutoff),
+        )
+        .values(status="parsing", error_message=None)
+        .returning(
+            Document.id,
+            Document.status,
+            Document.doc_category,
+            Document.page_count,
+            Document.error_message,
+        )
+    )
+    row = result.one_or_none()
+    if row is None:
+        doc = await db.get(Document, document_id, options=_METADATA_ONLY)
+        if not doc:
+            raise HTTPException(status_code=404, detail="Document not found")
+        if doc.status == "parsing":
+            raise HTTPException(status_code=409, detail="Document is already being parsed")
+        response.status_code = 200
+        return DocumentParseStatus.model_validate(doc)
+
+    # Commit before queueing so the worker's result can't be overwritten by this request
+    await db.commit()
 
+    try:
+        parse_document_task.delay(str(document_id))
     except Exception as e:
-        doc.status = "failed"
-        doc.error_message = str(e)
-        await db.flush()
-
-    return DocumentParseStatus(
-        id=doc.id,
-        status=doc.status,
-        doc_category=doc.doc_category,
-        page_count=doc.page_count,
-        error_message=doc.error_message,
-    )
+        # Release the claim, or the document would stay "parsing" with no task behind it
+        logger.error(f"Failed to queue parsing for document {document_id}: {e}")
+        await db.execute(
+            update(Document)
+            .where(Document.id == document_id, Document.status == "parsing")
+            .values(status="failed", error_message=f"Failed to queue parsing: {e}")
+        )
+        await db.commit()
+        raise HTTPException(status_code=503, detail="Document parsing is unavailable, try again later")
+
+    return DocumentParseStatus.model_validate(row)
 
 
 @router.get("/documents/{document_id}/status", response_model=DocumentParseStatus)
@@ -182,18 +221,11 @@ async def get_document_status(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    result = await db.execute(select(Document).where(Document.id == document_id))
-    doc = result.scalar_one_or_none()
+    doc = await db.get(Document, document_id, options=_METADATA_ONLY)
     if not doc:
         raise HTTPException(status_code=404, detail="Document not found")
 
-    return DocumentParseStatus(
-        id=doc.id,
-        status=doc.status,
-        doc_category=doc.doc_category,
-        page_count=doc.page_count,
-        error_message=doc.error_message,
-    )
+    return DocumentParseStatus.model_validate(doc)
 
 
 @router.get("/documents/{document_id}/download")
@@ -203,34 +235,24 @@ async def download_document(
     current_user: User = Depends(get_current_user),
 ):
     """Download a document file from storage."""
-    result = await db.execute(select(Document).where(Document.id == document_id))
-    doc = result.scalar_one_or_none()
+    doc = await db.get(Document, document_id, options=_METADATA_ONLY)
     if not doc:
         raise HTTPException(status_code=404, detail="Document not found")
 
+    # Open the object up front so storage errors still become a 500; the body is
+    # then streamed in chunks instead of being read into memory
     try:
         storage = get_storage_client()
-        file_data = storage.download_file(doc.file_path)
+        chunks, file_size = await asyncio.to_thread(storage.stream_file, doc.file_path)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to download file: {e}")
 
-    # Determine content type
-    content_types = {
-        "pdf": "application/pdf",
-        "docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-        "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-        "csv": "text/csv",
-        "pptx": "application/vnd.openxmlformats-officedocument.presentationml.presentation",
-    }
-    content_type = content_types.get(doc.file_type, "application/octet-stream")
-
-    return FastAPIResponse(
-        content=file_data,
-        media_type=content_type,
-        headers={
-            "Content-Disposition": f'attachment; filename="{doc.filename}"',
-        },
-    )
+    content_type = DOWNLOAD_CONTENT_TYPES.get(doc.file_type, "application/octet-stream")
+
+    headers = {"Content-Disposition": f'attachment; filename="{doc.filename}"'}
+    if file_size is not None:
+        headers["Content-Length"] = str(file_size)
+    return StreamingResponse(chunks, media_type=content_type, headers=headers)
 
 
 @router.delete("/documents/{document_id}", status_code=204)
@@ -240,8 +262,7 @@ async def delete_document(
     current_user: User = Depends(get_current_user),
 ):
     """Delete a document and its file from storage."""
-    result = await db.execute(select(Document).where(Document.id == document_id))
-    doc = result.scalar_one_or_none()
+    doc = await db.get(Document, document_id)
     if not doc:
         raise HTTPException(status_code=404, detail="Document not found")
 
@@ -254,3 +275,36 @@ async def delete_document(
 
     # Delete from database
     await db.delete(doc)
+
+
+@router.delete("/projects/{project_id}/documents", status_code=204)
+async def delete_documents(
+    project_id: uuid.UUID,
+    ids: list[uuid.UUID] = Query(...),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Delete several of a project's documents, removing their files in one storage request."""
+    result = await db.execute(
+        select(Document)
+        .where(Document.project_id == project_id, Document.id.in_(ids))
+        .options(defer(Document.parsed_text))
+    )
+    documents = result.scalars().all()
+    if len(documents) != len(set(ids)):
+        raise HTTPException(status_code=404, detail="Document not found")
+
+    # Delete files from S3 (best-effort — DB records deleted even if S3 fails)
+    await delete_stored_files([doc.file_path for doc in documents])
+
+    for doc in documents:
+        await db.delete(doc)
+
+
+async def delete_stored_files(file_paths: list[str]):
+    """Best-effort batched removal of document files, e.g. when a project is deleted."""
+    try:
+        storage = get_storage_client()
+        await asyncio.to_thread(storage.delete_files, file_paths)
+    except Exception as e:
+        logger.warning(f"Failed to delete {len(file_paths)} S3 files: {e}")
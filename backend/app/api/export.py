@@ -1,17 +1,18 @@
+import asyncio
 import uuid
 
 from fastapi import APIRouter, Depends, HTTPException
 from fastapi.responses import StreamingResponse
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import lazyload, selectinload
 import io
 
 from app.database import get_db
 from app.models.project import Project
 from app.models.document import Document
 from app.models.requirement import Requirement
-from app.models.response import Response
-from app.models.pricing import ScheduleEvent, PricingItem, ResponsePlan
+from app.models.pricing import ResponsePlan
 from app.models.user import User
 from app.api.auth import get_current_user
 from app.schemas.export import ExportRequest
@@ -32,32 +33,29 @@ async def export_word(
     if request is None:
         request = ExportRequest()
 
-    # Fetch project
-    proj_result = await db.execute(select(Project).where(Project.id == project_id))
+    # Fetch the project with the related data the export uses (one query per
+    # collection); skip the selectin relationships it doesn't need
+    proj_result = await db.execute(
+        select(Project)
+        .where(Project.id == project_id)
+        .options(
+            selectinload(Project.requirements).lazyload(Requirement.response),
+            selectinload(Project.responses),
+            selectinload(Project.schedule_events),
+            selectinload(Project.pricing_items),
+            lazyload(Project.owner),
+            lazyload(Project.documents),
+            lazyload(Project.response_plan),
+        )
+    )
     project = proj_result.scalar_one_or_none()
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
 
-    # Fetch all related data
-    req_result = await db.execute(
-        select(Requirement).where(Requirement.project_id == project_id).order_by(Requirement.req_number)
-    )
-    requirements = req_result.scalars().all()
-
-    resp_result = await db.execute(
-        select(Response).where(Response.project_id == project_id)
-    )
-    responses = resp_result.scalars().all()
-
-    sched_result = await db.execute(
-        select(ScheduleEvent).where(ScheduleEvent.project_id == project_id)
-    )
-    schedule = sched_result.scalars().all()
-
-    price_result = await db.execute(
-        select(PricingItem).where(PricingItem.project_id == project_id)
-    )
-    pricing = price_result.scalars().all()
+    requirements = sorted(project.requirements, key=lambda r: r.req_number)
+    responses = project.responses
+    schedule = project.schedule_events
+    pricing = project.pricing_items
 
     # Calculate compliance scores
     req_dicts = [{"id": str(r.id), "type": r.type, "is_mandatory": r.is_mandatory} for r in requirements]
@@ -127,8 +125,8 @@ async def export_word(
         "compliance_scores": scores,
     }
 
-    # Generate Word document
-    doc_bytes = generate_word_document(context)
+    # Generate Word document (CPU-bound, so keep it off the event loop)
+    doc_bytes = await asyncio.to_thread(generate_word_document, context)
 
     # Return as downloadable file
     filename = f"RFP_Response_{project.name.replace(' ', '_')}.docx"
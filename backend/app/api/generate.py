@@ -1,10 +1,9 @@
 import uuid
-import asyncio
 import logging
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import select
+from sqlalchemy import exists, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
@@ -12,20 +11,40 @@ from app.models.project import Project
 from app.models.document import Document
 from app.models.user import User
 from app.api.auth import get_current_user
-from app.orchestrator.pipeline import GenerationPipeline
+from app.config import get_settings
+from app.tasks.pipeline_task import run_generation_pipeline_task
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api", tags=["generate"])
 
 
-async def _run_pipeline_background(project_id: uuid.UUID):
-    """Background task to run the generation pipeline."""
-    try:
-        pipeline = GenerationPipeline(project_id)
-        await pipeline.run()
-    except Exception as e:
-        logger.exception(f"Pipeline background task failed: {e}")
+async def requeue_stale_pipelines(db: AsyncSession) -> int:
+    """Requeue generation for projects left "processing" past the stale threshold.
+
+    Covers runs whose task was lost (e.g. the broker was flushed); a run that is
+    still alive just skips the duplicate on its advisory lock.
+    """
+    settings = get_settings()
+    now = datetime.now(timezone.utc)
+    cutoff = now - timedelta(minutes=settings.pipeline_stale_after_minutes)
+    result = await db.execute(
+        update(Project)
+        .where(
+            Project.processing_status == "processing",
+            or_(Project.processing_started_at.is_(None), Project.processing_started_at < cutoff),
+        )
+        .values(processing_message="Generation requeued...", processing_started_at=now)
+        .returning(Project.id)
+    )
+    project_ids = result.scalars().all()
+    await db.commit()
+
+    for project_id in project_ids:
+        run_generation_pipeline_task.delay(str(project_id))
+    if project_ids:
+        logger.info(f"Requeued {len(project_ids)} stale generation pipeline(s)")
+    return len(project_ids)
 
 
 @router.post("/projects/{project_id}/generate-full")
@@ -39,38 +58,39 @@ async def generate_full(
     Returns immediately and runs processing in background.
     Poll GET /projects/{project_id} to check processing_status.
     """
-    # Verify project exists
-    project = await db.get(Project, project_id)
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
-
-    # Check if already processing
-    if project.processing_status == "processing":
+    # Verify project has documents
+    has_documents = await db.scalar(select(exists().where(Document.project_id == project_id)))
+    if not has_documents:
+        if not await db.get(Project, project_id):
+            raise HTTPException(status_code=404, detail="Project not found")
         raise HTTPException(
-            status_code=409,
-            detail="Generation is already in progress for this project"
+            status_code=400,
+            detail="No documents uploaded. Upload documents before generating."
         )
 
-    # Verify project has documents
+    # Claim the project in one conditional UPDATE, so two concurrent requests
+    # can't both start a run
     result = await db.execute(
-        select(Document).where(Document.project_id == project_id)
+        update(Project)
+        .where(
+            Project.id == project_id,
+            or_(Project.processing_status.is_(None), Project.processing_status != "processing"),
+        )
+        .values(
+            processing_status="processing",
+            processing_message="Generation queued...",
+            processing_started_at=datetime.now(timezone.utc),
+        )
     )
-    documents = result.scalars().all()
-    if not documents:
+    if result.rowcount == 0:
         raise HTTPException(
-            status_code=400,
-            detail="No documents uploaded. Upload documents before generating."
+            status_code=409,
+            detail="Generation is already in progress for this project"
         )
-
-    # Set processing status
-    project.processing_status = "processing"
-    project.processing_message = "Generation queued..."
-    project.processing_started_at = datetime.now(timezone.utc)
     await db.commit()
 
-    # Launch as async task on the event loop (not BackgroundTasks)
-    # This properly supports SQLAlchemy async sessions
-    asyncio.create_task(_run_pipeline_background(project_id))
+    # Run on a Celery worker so the job survives API restarts
+    run_generation_pipeline_task.delay(str(project_id))
 
     return {
         "message": "Generation started",
@@ -11,6 +11,7 @@ from app.models.requirement import Requirement
 from app.models.response import Response
 from app.models.user import User
 from app.api.auth import get_current_user
+from app.api.documents import delete_stored_files
 from app.schemas.project import ProjectCreate, ProjectUpdate, ProjectResponse, ProjectListResponse
 
 router = APIRouter(prefix="/api/projects", tags=["projects"])
@@ -185,4 +186,7 @@ async def delete_project(
     project = result.scalar_one_or_none()
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
+
+    # Documents are already selectin-loaded; remove all their files in one batch
+    await delete_stored_files([doc.file_path for doc in project.documents])
     await db.delete(project)
@@ -20,6 +20,7 @@ class Settings(BaseSettings):
     minio_secret_key: str = "minioadmin"
     minio_bucket: str = "rfp-documents"
     minio_secure: bool = False
+    storage_upload_concurrency: int = 8  # files uploaded at once per request
 
     # AI Services
     anthropic_api_key: str = ""
@@ -37,6 +38,9 @@ class Settings(BaseSettings):
     chunk_overlap_tokens: int = 200
     confidence_threshold: float = 0.7
     max_upload_size_mb: int = 100
+    max_request_size_mb: int = 500  # whole request body, checked before it is read
+    pipeline_stale_after_minutes: int = 240  # requeue generation still "processing" after this long
+    parse_stale_after_minutes: int = 15  # retake a parse still "parsing" after this long (> task limit)
 
     # Google Sheets (optional)
     google_service_account_json: str = ""
@@ -1,5 +1,8 @@
+from functools import lru_cache
+
+from sqlalchemy import create_engine
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
 
 from app.config import get_settings
 
@@ -19,6 +22,18 @@ class Base(DeclarativeBase):
     pass
 
 
+@lru_cache
+def get_sync_sessionmaker() -> sessionmaker[Session]:
+    """Session factory for Celery workers, which run synchronously (psycopg, not asyncpg)."""
+    sync_engine = create_engine(
+        settings.database_url.replace("+asyncpg", "+psycopg"),
+        echo=settings.debug,
+        pool_size=5,
+        pool_pre_ping=True,
+    )
+    return sessionmaker(sync_engine, expire_on_commit=False)
+
+
 async def get_db() -> AsyncSession:
     async with async_session() as session:
         try:
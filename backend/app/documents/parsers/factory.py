@@ -23,6 +23,19 @@ CONTENT_TYPES = {
     ".ppt": "application/vnd.ms-powerpoint",
 }
 
+# File extension to document file type mapping
+FILE_TYPES = {
+    ".pdf": "pdf",
+    ".docx": "docx",
+    ".doc": "docx",
+    ".xlsx": "xlsx",
+    ".xls": "xlsx",
+    ".csv": "csv",
+    ".pptx": "pptx",
+    ".ppt": "pptx",
+    ".gsheet": "gsheet",
+}
+
 
 class ParserFactory:
     """Factory that selects the correct parser based on file type."""
@@ -36,6 +49,9 @@ class ParserFactory:
             PptxParser(),
             GoogleSheetParser(),
         ]
+        self._supported_formats = tuple(
+            ext for parser in self._parsers for ext in parser.supported_extensions()
+        )
 
     def get_parser(self, filename: str) -> BaseParser:
         """Get the appropriate parser for a file."""
@@ -61,29 +77,15 @@ class ParserFactory:
                 detail=str(e),
             )
 
-    def supported_formats(self) -> list[str]:
+    def supported_formats(self) -> tuple[str, ...]:
         """Return all supported file extensions."""
-        extensions = []
-        for parser in self._parsers:
-            extensions.extend(parser.supported_extensions())
-        return extensions
+        return self._supported_formats
 
     @staticmethod
     def detect_file_type(filename: str) -> str:
         """Detect file type from filename extension."""
         ext = "." + filename.rsplit(".", 1)[-1].lower() if "." in filename else ""
-        type_map = {
-            ".pdf": "pdf",
-            ".docx": "docx",
-            ".doc": "docx",
-            ".xlsx": "xlsx",
-            ".xls": "xlsx",
-            ".csv": "csv",
-            ".pptx": "pptx",
-            ".ppt": "pptx",
-            ".gsheet": "gsheet",
-        }
-        return type_map.get(ext, "unknown")
+        return FILE_TYPES.get(ext, "unknown")
 
     @staticmethod
     def get_content_type(filename: str) -> str:
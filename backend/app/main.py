@@ -2,12 +2,13 @@ import logging
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from app.config import get_settings
 from app.shared.exceptions import RFPAutomationError
+from app.shared.middleware import RequestSizeLimitMiddleware
 from app.api import auth, projects, documents, requirements, responses, export, pricing, generate
-from app.database import engine, Base
+from app.database import engine, async_session, Base
 import app.models  # noqa: F401 - Import models so Base.metadata knows about all tables
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
@@ -21,8 +22,12 @@ app = FastAPI(
     version="0.1.0",
     docs_url="/api/docs",
     redoc_url="/api/redoc",
+    default_response_class=ORJSONResponse,
 )
 
+# Reject oversized request bodies before they are read
+app.add_middleware(RequestSizeLimitMiddleware, max_bytes=settings.max_request_size_mb * 1024 * 1024)
+
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -36,7 +41,7 @@ app.add_middleware(
 # Global exception handler for application errors
 @app.exception_handler(RFPAutomationError)
 async def rfp_error_handler(request: Request, exc: RFPAutomationError):
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=400,
         content={"error": exc.message, "detail": exc.detail},
     )
@@ -65,6 +70,12 @@ async def startup():
         await conn.run_sync(Base.metadata.create_all)
     logger.info("Database tables created")
 
+    try:
+        async with async_session() as db:
+            await generate.requeue_stale_pipelines(db)
+    except Exception as e:
+        logger.error(f"Failed to requeue stale generation pipelines: {e}")
+
 
 @app.on_event("shutdown")
 async def shutdown():
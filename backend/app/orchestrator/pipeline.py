@@ -8,6 +8,7 @@ generates AI answers for Excel RFPs, and uploads outputs back to S3.
 
 import json
 import logging
+import os
 import re
 import subprocess
 import tempfile
@@ -18,6 +19,7 @@ from pathlib import Path
 from sqlalchemy import or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import get_settings
 from app.database import async_session
 from app.models.document import Document
 from app.models.project import Project
@@ -235,11 +237,9 @@ class GenerationPipeline:
         schedule_output = self.temp_dir / "extracted_schedule.json"
 
         try:
-            import os as _os
-            from app.config import get_settings
             settings = get_settings()
 
-            env = _os.environ.copy()
+            env = os.environ.copy()
             # Ensure ANTHROPIC_API_KEY is available for the subprocess
             if settings.anthropic_api_key:
                 env["ANTHROPIC_API_KEY"] = settings.anthropic_api_key
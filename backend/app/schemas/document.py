@@ -30,3 +30,5 @@ class DocumentParseStatus(BaseModel):
     doc_category: str | None
     page_count: int | None
     error_message: str | None
+
+    model_config = {"from_attributes": True}
@@ -0,0 +1,44 @@
+import json
+import logging
+from typing import Any
+
+import redis
+
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+class ResultCache:
+    """Best-effort JSON cache in Redis; a cache outage never fails the caller."""
+
+    def __init__(self):
+        settings = get_settings()
+        self.client = redis.Redis.from_url(settings.redis_url, socket_timeout=2)
+
+    def get(self, key: str) -> Any | None:
+        """Return the cached value for key, or None on a miss or Redis error."""
+        try:
+            raw = self.client.get(key)
+        except redis.RedisError as e:
+            logger.warning(f"Cache read failed for {key}: {e}")
+            return None
+        return json.loads(raw) if raw is not None else None
+
+    def set(self, key: str, value: Any, ttl_seconds: int):
+        """Store a JSON-serializable value under key for ttl_seconds."""
+        try:
+            self.client.set(key, json.dumps(value), ex=ttl_seconds)
+        except redis.RedisError as e:
+            logger.warning(f"Cache write failed for {key}: {e}")
+
+
+# Singleton instance
+_result_cache: ResultCache | None = None
+
+
+def get_result_cache() -> ResultCache:
+    global _result_cache
+    if _result_cache is None:
+        _result_cache = ResultCache()
+    return _result_cache
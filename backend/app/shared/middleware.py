@@ -0,0 +1,26 @@
+from fastapi.responses import ORJSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class RequestSizeLimitMiddleware:
+    """Reject requests whose declared Content-Length is over the limit before the body is read.
+
+    Form uploads are spooled in full before a handler runs, so the per-file size
+    check in the upload endpoint alone cannot stop an oversized body.
+    """
+
+    def __init__(self, app: ASGIApp, max_bytes: int):
+        self.app = app
+        self.max_bytes = max_bytes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] == "http":
+            content_length = dict(scope["headers"]).get(b"content-length")
+            if content_length and content_length.isdigit() and int(content_length) > self.max_bytes:
+                response = ORJSONResponse(
+                    status_code=413,
+                    content={"detail": f"Request body exceeds maximum size of {self.max_bytes // (1024 * 1024)}MB"},
+                )
+                await response(scope, receive, send)
+                return
+        await self.app(scope, receive, send)
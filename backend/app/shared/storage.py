@@ -1,15 +1,62 @@
 import io
 import logging
+import os
+import threading
+from dataclasses import dataclass
 from pathlib import Path
+from typing import BinaryIO, Iterator
 
+import certifi
+import urllib3
+from cachetools import TTLCache
 from minio import Minio
+from minio.deleteobjects import DeleteObject
 from minio.error import S3Error
+from urllib3.util import Retry, Timeout
 
 from app.config import get_settings
 from app.shared.exceptions import StorageError
 
 logger = logging.getLogger(__name__)
 
+# Multipart part size for streamed uploads (MinIO's minimum is 5 MiB)
+UPLOAD_PART_SIZE = 8 * 1024 * 1024
+
+# Pooled connections to the storage host; MinIO's default of 10 is shared by
+# every request handler and upload thread in the process
+STORAGE_POOL_MAXSIZE = 50
+
+# Chunk size when streaming a stored file back out
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Object keys are never overwritten (each upload gets a fresh uuid), so their
+# metadata only goes stale when the object is deleted
+OBJECT_INFO_CACHE_SIZE = 10_000
+OBJECT_INFO_CACHE_TTL = 300
+
+
+@dataclass(frozen=True)
+class ObjectInfo:
+    """Metadata of a stored object."""
+
+    etag: str
+    size: int
+
+
+def _http_client() -> urllib3.PoolManager:
+    """MinIO's default HTTP pool, enlarged and also retrying throttled (429) requests."""
+    return urllib3.PoolManager(
+        timeout=Timeout(connect=10, read=300),
+        maxsize=STORAGE_POOL_MAXSIZE,
+        cert_reqs="CERT_REQUIRED",
+        ca_certs=os.environ.get("SSL_CERT_FILE") or certifi.where(),
+        retries=Retry(
+            total=5,
+            backoff_factor=0.2,
+            status_forcelist=[429, 500, 502, 503, 504],
+        ),
+    )
+
 
 class StorageClient:
     """MinIO S3-compatible storage client."""
@@ -21,8 +68,11 @@ class StorageClient:
             access_key=settings.minio_access_key,
             secret_key=settings.minio_secret_key,
             secure=settings.minio_secure,
+            http_client=_http_client(),
         )
         self.bucket = settings.minio_bucket
+        self._object_info: TTLCache = TTLCache(maxsize=OBJECT_INFO_CACHE_SIZE, ttl=OBJECT_INFO_CACHE_TTL)
+        self._object_info_lock = threading.Lock()
         self._ensure_bucket()
 
     def _ensure_bucket(self):
@@ -51,6 +101,29 @@ class StorageClient:
             logger.error(f"Upload failed: {e}")
             raise StorageError(f"File upload failed: {e}")
 
+    def upload_fileobj(
+        self,
+        object_name: str,
+        file_obj: BinaryIO,
+        length: int,
+        content_type: str = "application/octet-stream",
+    ) -> str:
+        """Stream a file-like object to MinIO in parts, never holding it all in memory."""
+        try:
+            self.client.put_object(
+                self.bucket,
+                object_name,
+                file_obj,
+                length=length,
+                content_type=content_type,
+                part_size=UPLOAD_PART_SIZE,
+            )
+            logger.info(f"Uploaded: {object_name} ({length} bytes)")
+            return object_name
+        except S3Error as e:
+            logger.error(f"Upload failed: {e}")
+            raise StorageError(f"File upload failed: {e}")
+
     def download_file(self, object_name: str) -> bytes:
         """Download a file from MinIO."""
         try:
@@ -63,15 +136,59 @@ class StorageClient:
             logger.error(f"Download failed: {e}")
             raise StorageError(f"File download failed: {e}")
 
+    def stream_file(
+        self, object_name: str, chunk_size: int = DOWNLOAD_CHUNK_SIZE
+    ) -> tuple[Iterator[bytes], int | None]:
+        """Open a file in MinIO for streaming.
+
+        Returns an iterator over its chunks, which releases the connection once
+        exhausted or closed, and the file size when MinIO reports one.
+        """
+        try:
+            response = self.client.get_object(self.bucket, object_name)
+        except S3Error as e:
+            logger.error(f"Download failed: {e}")
+            raise StorageError(f"File download failed: {e}")
+
+        def chunks() -> Iterator[bytes]:
+            try:
+                yield from response.stream(chunk_size)
+            finally:
+                response.close()
+                response.release_conn()
+
+        length = response.headers.get("Content-Length")
+        return chunks(), int(length) if length else None
+
     def delete_file(self, object_name: str):
         """Delete a file from MinIO."""
         try:
             self.client.remove_object(self.bucket, object_name)
+            self._forget(object_name)
             logger.info(f"Deleted: {object_name}")
         except S3Error as e:
             logger.error(f"Delete failed: {e}")
             raise StorageError(f"File deletion failed: {e}")
 
+    def delete_files(self, object_names: list[str]):
+        """Delete many files from MinIO in batched DeleteObjects requests (1000 keys each)."""
+        if not object_names:
+            return
+        for name in object_names:
+            self._forget(name)
+        try:
+            errors = list(
+                self.client.remove_objects(self.bucket, (DeleteObject(name) for name in object_names))
+            )
+        except S3Error as e:
+            logger.error(f"Bulk delete failed: {e}")
+            raise StorageError(f"File deletion failed: {e}")
+        if errors:
+            failed = ", ".join(f"{err.name} ({err.code})" for err in errors)
+            logger.error(f"Bulk delete failed for: {failed}")
+            raise StorageError(f"File deletion failed for {len(errors)} of {len(object_names)} files")
+        logger.info(f"Deleted {len(object_names)} files")
+
     def get_presigned_url(self, object_name: str, expires_hours: int = 1) -> str:
         """Generate a presigned URL for temporary access."""
         from datetime import timedelta
@@ -85,20 +202,44 @@ class StorageClient:
             logger.error(f"Presigned URL generation failed: {e}")
             raise StorageError(f"URL generation failed: {e}")
 
+    def stat_file(self, object_name: str) -> ObjectInfo:
+        """Return a file's ETag and size, from a short-lived local cache when possible."""
+        with self._object_info_lock:
+            info = self._object_info.get(object_name)
+        if info is not None:
+            return info
+        try:
+            stat = self.client.stat_object(self.bucket, object_name)
+        except S3Error as e:
+            logger.error(f"Stat failed: {e}")
+            raise StorageError(f"File lookup failed: {e}")
+        info = ObjectInfo(etag=stat.etag, size=stat.size)
+        with self._object_info_lock:
+            self._object_info[object_name] = info
+        return info
+
     def file_exists(self, object_name: str) -> bool:
         """Check if a file exists in storage."""
         try:
-            self.client.stat_object(self.bucket, object_name)
+            self.stat_file(object_name)
             return True
-        except S3Error:
+        except StorageError:
             return False
 
+    def _forget(self, object_name: str):
+        with self._object_info_lock:
+            self._object_info.pop(object_name, None)
+
 
 _storage_client: StorageClient | None = None
+_storage_client_lock = threading.Lock()
 
 
 def get_storage_client() -> StorageClient:
     global _storage_client
+    # Uploads run in worker threads, so guard the one-time setup (it checks the bucket)
     if _storage_client is None:
-        _storage_client = StorageClient()
+        with _storage_client_lock:
+            if _storage_client is None:
+                _storage_client = StorageClient()
     return _storage_client
@@ -12,6 +12,7 @@ celery = Celery(
         "app.tasks.parse_task",
         "app.tasks.extract_task",
         "app.tasks.generate_task",
+        "app.tasks.pipeline_task",
     ],
 )
 
@@ -26,4 +27,9 @@ celery.conf.update(
     worker_prefetch_multiplier=1,
     task_soft_time_limit=300,  # 5 minutes
     task_time_limit=600,  # 10 minutes
+    # Generation pipelines run for many minutes on their own queue, served by a
+    # separate worker (celery_pipeline_worker) so they can't starve parsing
+    task_routes={"run_generation_pipeline": {"queue": "pipelines"}},
+    # Unacked tasks are redelivered after this long; it must outlast the longest task
+    broker_transport_options={"visibility_timeout": 4 * 3600},
 )
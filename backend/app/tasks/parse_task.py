@@ -1,44 +1,94 @@
 import logging
+import uuid
+
+from sqlalchemy import select, update
 
 from app.tasks.celery_app import celery
+from app.database import get_sync_sessionmaker
+from app.models import Document
 from app.documents.parsers.factory import get_parser_factory
 from app.documents.classifier import classify_document
+from app.shared.cache import get_result_cache
 from app.shared.storage import get_storage_client
 
 logger = logging.getLogger(__name__)
 
+# Parse results keyed by file content (ETag) and filename, which picks the
+# parser and feeds the classifier
+PARSE_CACHE_TTL = 7 * 24 * 3600
+
+
+def _parse_cache_key(etag: str, filename: str) -> str:
+    return f"parse:{etag}:{filename}"
+
 
 @celery.task(bind=True, name="parse_document")
-def parse_document_task(self, document_id: str, file_path: str, filename: str):
-    """Async task to parse a document and classify it."""
-    logger.info(f"Parsing document: {filename} ({document_id})")
+def parse_document_task(self, document_id: str):
+    """Async task to parse a document, classify it and store the result on its record."""
+    doc_id = uuid.UUID(document_id)
+    session_factory = get_sync_sessionmaker()
+
+    # Read only what the parse needs, and don't hold a transaction open while it runs
+    with session_factory() as db:
+        doc = db.execute(
+            select(Document.filename, Document.file_path).where(Document.id == doc_id)
+        ).one_or_none()
+    if doc is None:
+        logger.warning(f"Parse task: document {document_id} no longer exists")
+        return {"status": "failed", "document_id": document_id, "error": "Document not found"}
+
+    logger.info(f"Parsing document: {doc.filename} ({document_id})")
 
     try:
-        # Download from storage
         storage = get_storage_client()
-        file_data = storage.download_file(file_path)
+        cache = get_result_cache()
+        cache_key = _parse_cache_key(storage.stat_file(doc.file_path).etag, doc.filename)
 
-        # Parse
-        factory = get_parser_factory()
-        parsed = factory.parse(file_data, filename)
+        result = cache.get(cache_key)
+        if result is None:
+            # Download from storage
+            file_data = storage.download_file(doc.file_path)
 
-        # Classify
-        category = classify_document(parsed.text, filename, bool(parsed.tables))
+            # Parse
+            factory = get_parser_factory()
+            parsed = factory.parse(file_data, doc.filename)
 
-        return {
+            # Classify
+            category = classify_document(parsed.text, doc.filename, bool(parsed.tables))
+
+            result = {"text": parsed.text, "page_count": parsed.page_count, "category": category}
+            cache.set(cache_key, result, PARSE_CACHE_TTL)
+        else:
+            logger.info(f"Using cached parse result for {doc.filename}")
+
+        values = {
+            "parsed_text": result["text"],
+            "page_count": result["page_count"],
+            "doc_category": result["category"],
             "status": "parsed",
-            "document_id": document_id,
-            "text_length": len(parsed.text),
-            "page_count": parsed.page_count,
-            "doc_category": category,
-            "was_ocr": parsed.was_ocr,
-            "table_count": len(parsed.tables),
+            "error_message": None,
         }
 
     except Exception as e:
         logger.error(f"Parse task failed for {document_id}: {e}")
-        return {
-            "status": "failed",
-            "document_id": document_id,
-            "error": str(e),
-        }
+        values = {"status": "failed", "error_message": str(e)}
+
+    # Store the outcome in one UPDATE
+    with session_factory.begin() as db:
+        row = db.execute(
+            update(Document)
+            .where(Document.id == doc_id)
+            .values(**values)
+            .returning(Document.status, Document.page_count, Document.doc_category, Document.error_message)
+        ).one_or_none()
+    if row is None:
+        logger.warning(f"Parse task: document {document_id} was deleted while parsing")
+        return {"status": "failed", "document_id": document_id, "error": "Document not found"}
+
+    return {
+        "status": row.status,
+        "document_id": document_id,
+        "page_count": row.page_count,
+        "doc_category": row.doc_category,
+        "error": row.error_message,
+    }
@@ -0,0 +1,47 @@
+import asyncio
+import logging
+import uuid
+
+from sqlalchemy import func, select
+
+from app.tasks.celery_app import celery
+from app.database import engine
+from app.orchestrator.pipeline import GenerationPipeline
+
+logger = logging.getLogger(__name__)
+
+
+async def _run_pipeline(project_id: uuid.UUID) -> bool:
+    """Run the pipeline unless another worker already holds this project's lock."""
+    lock_key = func.hashtext(str(project_id))
+    try:
+        # Session-level advisory lock on a dedicated connection: it is released
+        # explicitly below, or by Postgres if this worker dies mid-run
+        async with engine.connect() as conn:
+            if not await conn.scalar(select(func.pg_try_advisory_lock(lock_key))):
+                logger.warning(f"Pipeline for project {project_id} is already running, skipping")
+                return False
+            # The lock outlives the transaction; don't sit idle in one for the whole run
+            await conn.commit()
+            try:
+                await GenerationPipeline(project_id).run()
+            finally:
+                await conn.scalar(select(func.pg_advisory_unlock(lock_key)))
+                await conn.commit()
+            return True
+    finally:
+        # Pooled asyncpg connections belong to this task's event loop
+        await engine.dispose()
+
+
+@celery.task(
+    bind=True,
+    name="run_generation_pipeline",
+    soft_time_limit=3 * 3600,
+    time_limit=3 * 3600 + 300,
+)
+def run_generation_pipeline_task(self, project_id: str):
+    """Run the full generation pipeline (Win Plan, answered Excel, RFI Response PDF) for a project."""
+    logger.info(f"Running generation pipeline for project: {project_id}")
+    ran = asyncio.run(_run_pipeline(uuid.UUID(project_id)))
+    return {"status": "completed" if ran else "skipped", "project_id": project_id}
@@ -0,0 +1,82 @@
+import uuid
+
+import bcrypt
+import pytest
+from fastapi import HTTPException
+from pydantic import ValidationError
+
+from app.api import auth
+from app.api.auth import (
+    LoginRequest,
+    RegisterRequest,
+    _create_token,
+    hash_password,
+    password_needs_rehash,
+    verify_password,
+)
+
+
+class TestPasswordHashing:
+    def test_hash_is_argon2(self):
+        hashed = hash_password("s3cret")
+        assert hashed.startswith("$argon2id$")
+        assert not password_needs_rehash(hashed)
+
+    def test_verify_correct_password(self):
+        hashed = hash_password("s3cret")
+        assert verify_password("s3cret", hashed)
+
+    def test_verify_wrong_password(self):
+        hashed = hash_password("s3cret")
+        assert not verify_password("wrong", hashed)
+
+    def test_verify_legacy_bcrypt_hash(self):
+        hashed = bcrypt.hashpw(b"s3cret", bcrypt.gensalt(rounds=4)).decode("utf-8")
+        assert verify_password("s3cret", hashed)
+        assert not verify_password("wrong", hashed)
+        assert password_needs_rehash(hashed)
+
+    def test_verify_malformed_hash(self):
+        assert not verify_password("s3cret", "not-a-hash")
+
+
+class TestTokenDecoding:
+    def setup_method(self):
+        auth._token_cache.clear()
+
+    def test_decode_valid_token(self):
+        user_id = uuid.uuid4()
+        token = _create_token(str(user_id), "a@example.com")
+        assert auth._decode_user_id(token) == user_id
+
+    def test_repeat_decode_uses_cache(self, monkeypatch):
+        user_id = uuid.uuid4()
+        token = _create_token(str(user_id), "a@example.com")
+        auth._decode_user_id(token)
+
+        def fail_decode(*args, **kwargs):
+            raise AssertionError("token decoded twice")
+
+        monkeypatch.setattr(auth.jwt, "decode", fail_decode)
+        assert auth._decode_user_id(token) == user_id
+
+    def test_invalid_token_rejected(self):
+        with pytest.raises(HTTPException) as exc_info:
+            auth._decode_user_id("not-a-token")
+        assert exc_info.value.status_code == 401
+
+    def test_non_uuid_subject_rejected(self):
+        token = _create_token("not-a-uuid", "a@example.com")
+        with pytest.raises(HTTPException) as exc_info:
+            auth._decode_user_id(token)
+        assert exc_info.value.status_code == 401
+
+
+class TestAuthRequests:
+    def test_email_is_lowercased(self):
+        request = LoginRequest(email="Jane.Doe@Example.COM", password="s3cret")
+        assert request.email == "jane.doe@example.com"
+
+    def test_malformed_email_rejected(self):
+        with pytest.raises(ValidationError):
+            RegisterRequest(email="not-an-email", name="Jane", password="s3cret")
@@ -0,0 +1,102 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi import HTTPException, Response
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.api import documents
+from app.models.document import Document
+
+
+@pytest.fixture
+async def db(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Document.metadata.create_all, tables=[Document.__table__])
+    async with async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)() as session:
+        yield session
+    await engine.dispose()
+
+
+@pytest.fixture
+async def document(db):
+    doc = Document(project_id=uuid.uuid4(), filename="rfp.pdf", file_path="p/rfp.pdf", file_type="pdf")
+    db.add(doc)
+    await db.commit()
+    return doc
+
+
+class QueuedTasks:
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.queued = []
+
+    def delay(self, document_id: str):
+        if self.fail:
+            raise ConnectionError("broker unavailable")
+        self.queued.append(document_id)
+
+
+async def _parse(db, document_id):
+    response = Response()
+    result = await documents.parse_document(document_id, response, db=db, current_user=None)
+    return result, response
+
+
+async def _status(db, document_id):
+    return await db.scalar(select(Document.status).where(Document.id == document_id))
+
+
+class TestParseDocument:
+    async def test_queues_parse_once(self, db, document, monkeypatch):
+        tasks = QueuedTasks()
+        monkeypatch.setattr(documents, "parse_document_task", tasks)
+
+        result, _ = await _parse(db, document.id)
+        assert result.status == "parsing"
+        assert tasks.queued == [str(document.id)]
+
+        with pytest.raises(HTTPException) as exc_info:
+            await _parse(db, document.id)
+        assert exc_info.value.status_code == 409
+        assert len(tasks.queued) == 1
+
+    async def test_queue_failure_releases_claim(self, db, document, monkeypatch):
+        monkeypatch.setattr(documents, "parse_document_task", QueuedTasks(fail=True))
+        with pytest.raises(HTTPException) as exc_info:
+            await _parse(db, document.id)
+        assert exc_info.value.status_code == 503
+        assert await _status(db, document.id) == "failed"
+
+        tasks = QueuedTasks()
+        monkeypatch.setattr(documents, "parse_document_task", tasks)
+        result, _ = await _parse(db, document.id)
+        assert result.status == "parsing"
+        assert tasks.queued == [str(document.id)]
+
+    async def test_stale_parse_is_retaken(self, db, document, monkeypatch):
+        tasks = QueuedTasks()
+        monkeypatch.setattr(documents, "parse_document_task", tasks)
+        await db.execute(
+            update(Document)
+            .where(Document.id == document.id)
+            .values(status="parsing", updated_at=datetime.now(timezone.utc) - timedelta(hours=1))
+        )
+        await db.commit()
+
+        result, _ = await _parse(db, document.id)
+        assert result.status == "parsing"
+        assert tasks.queued == [str(document.id)]
+
+    async def test_parsed_document_not_requeued(self, db, document, monkeypatch):
+        tasks = QueuedTasks()
+        monkeypatch.setattr(documents, "parse_document_task", tasks)
+        await db.execute(update(Document).where(Document.id == document.id).values(status="parsed"))
+        await db.commit()
+
+        result, response = await _parse(db, document.id)
+        assert result.status == "parsed"
+        assert response.status_code == 200
+        assert tasks.queued == []
@@ -87,6 +87,27 @@ export default function ProjectDetailPage() {
     }
   }, [project?.processing_status]);
 
+  // Parsing runs on a worker; poll /status for documents still being parsed
+  const parsingDocIds = documents
+    .filter((doc) => doc.status === "parsing")
+    .map((doc) => doc.id)
+    .join(",");
+  useEffect(() => {
+    if (!parsingDocIds) return;
+    const timer = setInterval(async () => {
+      const updates: any[] = await Promise.all(
+        parsingDocIds.split(",").map((id) => documentsApi.status(id).catch(() => null))
+      );
+      setDocuments((prev) =>
+        prev.map((doc) => {
+          const update = updates.find((u) => u && u.id === doc.id);
+          return update ? { ...doc, ...update } : doc;
+        })
+      );
+    }, 3000);
+    return () => clearInterval(timer);
+  }, [parsingDocIds]);
+
   useEffect(() => {
     loadProject();
   }, [projectId]);
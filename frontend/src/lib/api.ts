@@ -100,10 +100,30 @@ export const projects = {
 };
 
 // Documents
+const DOCUMENT_PAGE_SIZE = 200; // the API's maximum page size
+
+type DocumentPage = { documents: unknown[]; total: number };
+
+function listDocumentsPage(projectId: string, skip = 0, limit = DOCUMENT_PAGE_SIZE): Promise<DocumentPage> {
+  return request<DocumentPage>(`/api/projects/${projectId}/documents?skip=${skip}&limit=${limit}`);
+}
+
 export const documents = {
   upload: (projectId: string, files: File[]) =>
     uploadFiles(`/api/projects/${projectId}/documents`, files),
-  list: (projectId: string) => request(`/api/projects/${projectId}/documents`),
+  listPage: listDocumentsPage,
+  // The API pages document listings; fetch every page
+  list: async (projectId: string): Promise<DocumentPage> => {
+    const all: unknown[] = [];
+    let total = 0;
+    for (let skip = 0; ; skip += DOCUMENT_PAGE_SIZE) {
+      const page = await listDocumentsPage(projectId, skip);
+      all.push(...page.documents);
+      total = page.total;
+      if (page.documents.length < DOCUMENT_PAGE_SIZE || all.length >= total) break;
+    }
+    return { documents: all, total };
+  },
   parse: (documentId: string) =>
     request(`/api/documents/${documentId}/parse`, { method: "POST" }),
   status: (documentId: string) => request(`/api/documents/${documentId}/status`),